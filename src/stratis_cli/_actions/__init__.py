@@ -16,6 +16,8 @@ Package mediating dbus actions.
 """
 
 from ._bind import BindActions, RebindActions
+from ._cache import invalidate_cache
+from ._connection import set_bus_address
 from ._constants import (
     BLOCKDEV_INTERFACE,
     FILESYSTEM_INTERFACE,
@@ -29,10 +31,13 @@ from ._debug import (
     PoolDebugActions,
     TopDebugActions,
 )
+from ._jobs import JobActions, in_job, start_job
 from ._logical import LogicalActions
 from ._physical import PhysicalActions
+from ._policy import set_deadline
 from ._pool import PoolActions
 from ._stratis import StratisActions
 from ._stratisd_version import check_stratisd_version
 from ._top import TopActions
+from ._trace import trace_dbus
 from ._utils import get_errors
@@ -0,0 +1,127 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Operations performed on many items at once.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from .._errors import StratisCliBatchError
+from ._formatting import print_table
+from ._utils import get_errors
+
+# A task: the values which identify the item in the summary, and a function
+# that performs the operation on it.
+Task = Tuple[Sequence[str], Callable[[], Any]]
+
+
+def _message(err: Exception) -> str:
+    """
+    Get the message of the error which caused an operation to fail.
+    """
+    return str(list(get_errors(err))[-1])
+
+
+def perform_tasks(tasks: List[Task], *, jobs: int) -> List[Optional[str]]:
+    """
+    Perform tasks, at most jobs at a time.
+
+    D-Bus calls made by the tasks share the connection; dbus-python releases
+    the global interpreter lock while waiting for a reply.
+
+    :param tasks: the tasks
+    :param int jobs: the maximum number of tasks performed at once
+    :returns: the error message for each task that failed, otherwise None
+    """
+
+    def perform(task: Task) -> Optional[str]:
+        (_, func) = task
+        try:
+            func()
+        except Exception as err:  # noqa: BLE001
+            return _message(err)
+        return None
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(perform, tasks))
+
+
+def report_results(
+    operation: str,
+    headings: List[str],
+    tasks: List[Task],
+    messages: List[Optional[str]],
+    *,
+    as_json: bool,
+):
+    """
+    Print the result of each task.
+
+    :param str operation: the operation, for the error message
+    :param headings: the headings of the values which identify an item
+    :param tasks: the tasks
+    :param messages: the result of each task, as returned by perform_tasks
+    :param bool as_json: whether to print the results as JSON
+    :raises StratisCliBatchError: if some task failed
+    """
+    if as_json:
+        print(
+            json.dumps(
+                [
+                    dict(zip([heading.lower() for heading in headings], values))
+                    | {"error": message}
+                    for ((values, _), message) in zip(tasks, messages)
+                ],
+                indent=4,
+            )
+        )
+    else:
+        print_table(
+            headings + ["Result"],
+            [
+                list(values) + ["OK" if message is None else f"FAILED: {message}"]
+                for ((values, _), message) in zip(tasks, messages)
+            ],
+            ["<"] * (len(headings) + 1),
+        )
+
+    failed = [
+        (" ".join(values), message)
+        for ((values, _), message) in zip(tasks, messages)
+        if message is not None
+    ]
+    if failed != []:
+        raise StratisCliBatchError(operation, failed, len(tasks))
+
+
+def run_batch(
+    operation: str, headings: List[str], tasks: List[Task], *, jobs: int, as_json: bool
+):
+    """
+    Perform an operation on many items, at most jobs at a time, and print
+    the result for each. A failure for one item does not prevent the
+    operation from being performed on the others.
+
+    :param str operation: the operation, for the error message
+    :param headings: the headings of the values which identify an item
+    :param tasks: the tasks
+    :param int jobs: the maximum number of tasks performed at once
+    :param bool as_json: whether to print the results as JSON
+    :raises StratisCliBatchError: if the operation failed for some item
+    """
+    report_results(
+        operation, headings, tasks, perform_tasks(tasks, jobs=jobs), as_json=as_json
+    )
@@ -15,12 +15,20 @@
 Miscellaneous pool-binding actions.
 """
 
+import fnmatch
 import json
 from argparse import Namespace
+from functools import partial
+from typing import Any, Callable
 
 from .._constants import EncryptionMethod, IdType, PoolId
-from .._errors import StratisCliEngineError, StratisCliNoChangeError
+from .._errors import (
+    StratisCliEngineError,
+    StratisCliNoChangeError,
+    StratisCliResourceNotFoundError,
+)
 from .._stratisd_constants import StratisdErrors
+from ._batch import run_batch
 from ._connection import get_object
 from ._constants import TOP_OBJECT
 
@@ -41,6 +49,61 @@ def _get_pool_id(namespace: Namespace) -> PoolId:
     return PoolId(IdType.NAME, name)
 
 
+def _for_each_pool(
+    operation: str, namespace: Namespace, action: Callable[[str, Any], None]
+):
+    """
+    Perform an action on the specified pool or, if --all-encrypted or
+    --match is specified, on each selected encrypted pool, at most --jobs
+    at a time, and print the result for each.
+
+    :param str operation: the operation, for the error message
+    :param action: performs the operation on the pool with the given object
+                   path, which is identified in messages by the other argument
+    :raises StratisCliBatchError:
+    :raises StratisCliResourceNotFoundError:
+    """
+    from ._data import MOPool, ObjectManager, pools  # noqa: PLC0415
+
+    proxy = get_object(TOP_OBJECT)
+    managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+
+    match = getattr(namespace, "match", None)
+    if not getattr(namespace, "all_encrypted", False) and match is None:
+        pool_id = _get_pool_id(namespace)
+        (pool_object_path, _) = next(
+            pools(props=pool_id.managed_objects_key())
+            .require_unique_match(True)
+            .search(managed_objects)
+        )
+        action(pool_object_path, pool_id.id_value)
+        return
+
+    selected = sorted(
+        (str(MOPool(info).Name()), pool_object_path)
+        for (pool_object_path, info) in pools(props={"Encrypted": True}).search(
+            managed_objects
+        )
+        if match is None or fnmatch.fnmatchcase(str(MOPool(info).Name()), match)
+    )
+
+    if selected == [] and match is not None:
+        raise StratisCliResourceNotFoundError(
+            operation, f"encrypted pools matching {match}"
+        )
+
+    run_batch(
+        operation,
+        ["Pool"],
+        [
+            ((name,), partial(action, pool_object_path, name))
+            for (name, pool_object_path) in selected
+        ],
+        jobs=namespace.jobs,
+        as_json=namespace.as_json,
+    )
+
+
 class BindActions:
     """
     Pool binding actions actions.
@@ -53,63 +116,49 @@ class BindActions:
         discussion of the pin and the configuration, consult Clevis
         documentation.
         """
-        from ._data import ObjectManager, Pool, pools  # noqa: PLC0415
+        from ._data import Pool  # noqa: PLC0415
 
-        proxy = get_object(TOP_OBJECT)
-        managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        def bind(pool_object_path: str, pool_label: Any):
+            (changed, return_code, return_msg) = Pool.Methods.BindClevis(
+                get_object(pool_object_path),
+                {
+                    "pin": namespace.clevis.pin,
+                    "json": json.dumps(namespace.clevis.config),
+                    "token_slot": (False, 0),
+                },
+            )
 
-        pool_id = _get_pool_id(namespace)
+            if return_code != StratisdErrors.OK:
+                raise StratisCliEngineError(return_code, return_msg)
 
-        (pool_object_path, _) = next(
-            pools(props=pool_id.managed_objects_key())
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
-        (changed, return_code, return_msg) = Pool.Methods.BindClevis(
-            get_object(pool_object_path),
-            {
-                "pin": namespace.clevis.pin,
-                "json": json.dumps(namespace.clevis.config),
-                "token_slot": (False, 0),
-            },
-        )
+            # stratisd does not do idempotency checks when binding with Clevis;
+            # because there are multiple token slots, a new Clevis binding will
+            # just find the next token slot.
+            if not changed:  # pragma: no cover
+                raise StratisCliNoChangeError("bind", pool_label)
 
-        if return_code != StratisdErrors.OK:
-            raise StratisCliEngineError(return_code, return_msg)
-
-        # stratisd does not do idempotency checks when binding with Clevis;
-        # because there are multiple token slots, a new Clevis binding will
-        # just find the next token slot.
-        if not changed:  # pragma: no cover
-            raise StratisCliNoChangeError("bind", pool_id.id_value)
+        _for_each_pool("bind", namespace, bind)
 
     @staticmethod
     def bind_keyring(namespace: Namespace):
         """
         Bind all devices in an encrypted pool using the kernel keyring.
         """
-        from ._data import ObjectManager, Pool, pools  # noqa: PLC0415
+        from ._data import Pool  # noqa: PLC0415
 
-        proxy = get_object(TOP_OBJECT)
-        managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        def bind(pool_object_path: str, pool_label: Any):
+            (changed, return_code, return_msg) = Pool.Methods.BindKeyring(
+                get_object(pool_object_path),
+                {"key_desc": namespace.keydesc, "token_slot": (False, 0)},
+            )
 
-        pool_id = _get_pool_id(namespace)
+            if return_code != StratisdErrors.OK:
+                raise StratisCliEngineError(return_code, return_msg)
 
-        (pool_object_path, _) = next(
-            pools(props=pool_id.managed_objects_key())
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
-        (changed, return_code, return_msg) = Pool.Methods.BindKeyring(
-            get_object(pool_object_path),
-            {"key_desc": namespace.keydesc, "token_slot": (False, 0)},
-        )
-
-        if return_code != StratisdErrors.OK:
-            raise StratisCliEngineError(return_code, return_msg)
+            if not changed:
+                raise StratisCliNoChangeError("bind", pool_label)
 
-        if not changed:
-            raise StratisCliNoChangeError("bind", pool_id.id_value)
+        _for_each_pool("bind", namespace, bind)
 
     @staticmethod
     def unbind(namespace: Namespace):
@@ -119,18 +168,7 @@ class BindActions:
         :raises StratisCliNoChangeError:
         :raises StratisCliEngineError:
         """
-        from ._data import ObjectManager, Pool, pools  # noqa: PLC0415
-
-        proxy = get_object(TOP_OBJECT)
-        managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-
-        pool_id = _get_pool_id(namespace)
-
-        (pool_object_path, _) = next(
-            pools(props=pool_id.managed_objects_key())
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
+        from ._data import Pool  # noqa: PLC0415
 
         unbind_method = (
             Pool.Methods.UnbindClevis
@@ -138,22 +176,25 @@ class BindActions:
             else Pool.Methods.UnbindKeyring
         )
 
-        (changed, return_code, return_msg) = unbind_method(
-            get_object(pool_object_path),
-            {
-                "token_slot": (
-                    (False, 0)
-                    if namespace.token_slot is None
-                    else (True, namespace.token_slot)
-                )
-            },
-        )
+        def unbind(pool_object_path: str, pool_label: Any):
+            (changed, return_code, return_msg) = unbind_method(
+                get_object(pool_object_path),
+                {
+                    "token_slot": (
+                        (False, 0)
+                        if namespace.token_slot is None
+                        else (True, namespace.token_slot)
+                    )
+                },
+            )
 
-        if return_code != StratisdErrors.OK:
-            raise StratisCliEngineError(return_code, return_msg)
+            if return_code != StratisdErrors.OK:
+                raise StratisCliEngineError(return_code, return_msg)
 
-        if not changed:
-            raise StratisCliNoChangeError("unbind", pool_id.id_value)
+            if not changed:
+                raise StratisCliNoChangeError("unbind", pool_label)
+
+        _for_each_pool("unbind", namespace, unbind)
 
 
 class RebindActions:
@@ -166,69 +207,55 @@ class RebindActions:
         """
         Rebind with Clevis nbde/tang
         """
-        from ._data import ObjectManager, Pool, pools  # noqa: PLC0415
+        from ._data import Pool  # noqa: PLC0415
 
-        pool_id = _get_pool_id(namespace)
+        def rebind(pool_object_path: str, pool_label: Any):
+            (changed, return_code, return_msg) = Pool.Methods.RebindClevis(
+                get_object(pool_object_path),
+                {
+                    "token_slot": (
+                        (False, 0)
+                        if namespace.token_slot is None
+                        else (True, namespace.token_slot)
+                    )
+                },
+            )
 
-        proxy = get_object(TOP_OBJECT)
-        managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        (pool_object_path, _) = next(
-            pools(props=pool_id.managed_objects_key())
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
-        (changed, return_code, return_msg) = Pool.Methods.RebindClevis(
-            get_object(pool_object_path),
-            {
-                "token_slot": (
-                    (False, 0)
-                    if namespace.token_slot is None
-                    else (True, namespace.token_slot)
-                )
-            },
-        )
+            if return_code != StratisdErrors.OK:
+                raise StratisCliEngineError(return_code, return_msg)
 
-        if return_code != StratisdErrors.OK:
-            raise StratisCliEngineError(return_code, return_msg)
+            if not changed:
+                # The sim engine always returns true on a rebind with Clevis
+                raise StratisCliNoChangeError("rebind", pool_label)  # pragma: no cover
 
-        if not changed:
-            # The sim engine always returns true on a rebind with Clevis
-            raise StratisCliNoChangeError(
-                "rebind", pool_id.id_value
-            )  # pragma: no cover
+        _for_each_pool("rebind", namespace, rebind)
 
     @staticmethod
     def rebind_keyring(namespace: Namespace):
         """
         Rebind with a kernel keyring
         """
-        from ._data import ObjectManager, Pool, pools  # noqa: PLC0415
+        from ._data import Pool  # noqa: PLC0415
 
         keydesc = namespace.keydesc
 
-        proxy = get_object(TOP_OBJECT)
-        managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        pool_id = _get_pool_id(namespace)
-        (pool_object_path, _) = next(
-            pools(props=pool_id.managed_objects_key())
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
-
-        (changed, return_code, return_msg) = Pool.Methods.RebindKeyring(
-            get_object(pool_object_path),
-            {
-                "key_desc": keydesc,
-                "token_slot": (
-                    (False, 0)
-                    if namespace.token_slot is None
-                    else (True, namespace.token_slot)
-                ),
-            },
-        )
-
-        if return_code != StratisdErrors.OK:
-            raise StratisCliEngineError(return_code, return_msg)
-
-        if not changed:
-            raise StratisCliNoChangeError("rebind", pool_id.id_value)
+        def rebind(pool_object_path: str, pool_label: Any):
+            (changed, return_code, return_msg) = Pool.Methods.RebindKeyring(
+                get_object(pool_object_path),
+                {
+                    "key_desc": keydesc,
+                    "token_slot": (
+                        (False, 0)
+                        if namespace.token_slot is None
+                        else (True, namespace.token_slot)
+                    ),
+                },
+            )
+
+            if return_code != StratisdErrors.OK:
+                raise StratisCliEngineError(return_code, return_msg)
+
+            if not changed:
+                raise StratisCliNoChangeError("rebind", pool_label)
+
+        _for_each_pool("rebind", namespace, rebind)
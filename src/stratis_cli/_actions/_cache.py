@@ -0,0 +1,219 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Cache of the GetManagedObjects result, shared by concurrent invocations.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+from argparse import Namespace
+from typing import Any
+
+from ._connection import bus_address, get_object
+from ._constants import TOP_OBJECT
+from ._report import load_managed_objects
+from ._stratisd_version import check_stratisd_version
+
+CACHE_DIRECTORY = os.environ.get("STRATIS_CACHE_DIR", "/run/stratis-cli")
+
+_CACHE_SUFFIX = ".json"
+_LOCK_SUFFIX = ".lock"
+
+# The lock file can be opened by any user, who may hold the lock for as long
+# as they like, so the lock is waited for only this long, in seconds.
+_LOCK_TIMEOUT = 10.0
+_LOCK_POLL_INTERVAL = 0.05
+
+
+def _path(suffix: str) -> str:
+    """
+    Get the path of a file of the cache for the message bus in use, so that
+    a result obtained on one message bus is never listed for another.
+
+    :param str suffix: the suffix of the file's name
+    """
+    address = bus_address()
+    name = (
+        "managed_objects"
+        if address is None
+        else "managed_objects-"
+        + hashlib.blake2b(address.encode(), digest_size=8).hexdigest()
+    )
+    return os.path.join(CACHE_DIRECTORY, name + suffix)
+
+
+def _fetch_managed_objects() -> Any:
+    """
+    Get the GetManagedObjects result from stratisd.
+
+    :raises StratisCliStratisdVersionError:
+    """
+    from ._data import ObjectManager  # noqa: PLC0415
+
+    check_stratisd_version()
+    return ObjectManager.Methods.GetManagedObjects(get_object(TOP_OBJECT), {})
+
+
+def _read_fresh(max_staleness: float) -> Any | None:
+    """
+    Read the cached result if it was obtained no more than max_staleness
+    seconds ago.
+
+    :returns: the cached result or None if there is no usable cached result
+    """
+    try:
+        with open(_path(_CACHE_SUFFIX), encoding="utf-8") as cache_file:
+            age = time.time() - os.fstat(cache_file.fileno()).st_mtime
+            if not 0 <= age <= max_staleness:
+                return None
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+
+def _lock(lock_fd: int) -> bool:
+    """
+    Take the lock, waiting for it no longer than _LOCK_TIMEOUT seconds.
+
+    :param int lock_fd: a descriptor of the lock file
+    :returns: True if the lock was taken, otherwise False
+    """
+    deadline = time.monotonic() + _LOCK_TIMEOUT
+    while True:
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(_LOCK_POLL_INTERVAL)
+
+
+def _write(managed_objects: Any, fetched_at: float):
+    """
+    Replace the cached result.
+
+    The modification time of the file is the time at which stratisd was
+    asked for the result, so that the result's age is not underestimated.
+    The cache is in /run, so the file is not synced.
+
+    :param managed_objects: the GetManagedObjects result
+    :param float fetched_at: the time at which the result was requested
+    :raises OSError:
+    """
+    (fd, temp_path) = tempfile.mkstemp(dir=CACHE_DIRECTORY, prefix=".", suffix=".tmp")
+    try:
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+            cache_file.write(json.dumps(managed_objects, separators=(",", ":")))
+        os.utime(temp_path, (fetched_at, fetched_at))
+        os.replace(temp_path, _path(_CACHE_SUFFIX))
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def get_managed_objects(max_staleness: float) -> Any:
+    """
+    Get the GetManagedObjects result, from the cache if the cached result
+    was obtained no more than max_staleness seconds ago.
+
+    Callers that find the cached result too old take a lock, so that only
+    one of them obtains the result from stratisd and the others read it from
+    the cache. If the cache can not be used, or the lock can not be taken
+    in time, the result is obtained from stratisd directly.
+
+    :param float max_staleness: maximum age of the cached result in seconds
+    :raises StratisCliStratisdVersionError:
+    """
+    managed_objects = _read_fresh(max_staleness)
+    if managed_objects is not None:
+        return managed_objects
+
+    try:
+        os.makedirs(CACHE_DIRECTORY, mode=0o755, exist_ok=True)
+        lock_fd = os.open(
+            _path(_LOCK_SUFFIX), os.O_RDONLY | os.O_CREAT | os.O_CLOEXEC, 0o644
+        )
+    except OSError:
+        return _fetch_managed_objects()
+
+    try:
+        if not _lock(lock_fd):
+            return _fetch_managed_objects()
+
+        # Another caller may have refreshed the cache while this one waited.
+        managed_objects = _read_fresh(max_staleness)
+        if managed_objects is not None:
+            return managed_objects
+
+        fetched_at = time.time()
+        managed_objects = _fetch_managed_objects()
+        try:
+            _write(managed_objects, fetched_at)
+        except OSError:
+            pass
+        return managed_objects
+    finally:
+        os.close(lock_fd)
+
+
+def invalidate_cache():
+    """
+    Remove the cached result.
+
+    The lock is taken first, so that a result that stratisd was asked for
+    before the caller's changes were made, but that has not yet been written,
+    is removed as well. If the lock can not be taken in time, the result is
+    removed without it.
+    """
+    try:
+        lock_fd = os.open(_path(_LOCK_SUFFIX), os.O_RDONLY | os.O_CLOEXEC)
+    except FileNotFoundError:
+        # There has never been a cached result.
+        return
+    except OSError:
+        lock_fd = None
+
+    try:
+        if lock_fd is not None:
+            _lock(lock_fd)
+        os.unlink(_path(_CACHE_SUFFIX))
+    except OSError:
+        pass
+    finally:
+        if lock_fd is not None:
+            os.close(lock_fd)
+
+
+def listing_managed_objects(namespace: Namespace) -> Any | None:
+    """
+    Get the GetManagedObjects result to list as specified by the
+    --from-snapshot or --max-staleness option.
+
+    :returns: the result or None if neither option was specified
+    :raises StratisCliReportFileError:
+    :raises StratisCliStratisdVersionError:
+    """
+    if namespace.from_snapshot is not None:
+        return load_managed_objects(namespace.from_snapshot)
+
+    if namespace.max_staleness is not None:
+        return get_managed_objects(namespace.max_staleness)
+
+    return None
@@ -15,9 +15,23 @@
 Low-level interactions with the D-Bus.
 """
 
+import os
+from typing import cast
+
 import dbus
+import dbus.bus
+from dbus.proxies import ProxyObject
 
 from ._constants import SERVICE
+from ._trace import TracedProxy, tracing
+
+
+def _default_address():
+    """
+    Get the address of the message bus specified by the environment, or None
+    for the system bus.
+    """
+    return os.environ.get("STRATIS_DBUS_ADDRESS") or None
 
 
 class Bus:
@@ -27,16 +41,60 @@ class Bus:
 
     _BUS = None
 
+    # The address of the message bus on which stratisd is found, or None for
+    # the system bus.
+    _ADDRESS = _default_address()
+
     @staticmethod
     def get_bus():
         """
         Get our bus.
         """
         if Bus._BUS is None:
-            Bus._BUS = dbus.SystemBus()
+            Bus._BUS = (
+                dbus.SystemBus()
+                if Bus._ADDRESS is None
+                else dbus.bus.BusConnection(Bus._ADDRESS)
+            )
 
         return Bus._BUS
 
+    @staticmethod
+    def get_signal_bus(mainloop):
+        """
+        Get a new bus connection on which signals are dispatched by the
+        specified main loop.
+
+        :param mainloop: a dbus-python main loop
+        """
+        # A connection to a bus at an address is always a new connection.
+        return (
+            dbus.SystemBus(mainloop=mainloop, private=True)
+            if Bus._ADDRESS is None
+            else dbus.bus.BusConnection(Bus._ADDRESS, mainloop=mainloop)
+        )
+
+
+def set_bus_address(address):
+    """
+    Use the message bus at address or, if address is None, the message bus
+    specified by the environment.
+
+    :param address: a D-Bus server address, or None
+    :type address: str or NoneType
+    """
+    address = _default_address() if address is None else address
+    if address != Bus._ADDRESS:
+        Bus._ADDRESS = address
+        Bus._BUS = None
+
+
+def bus_address():
+    """
+    Get the address of the message bus in use, or None for the system bus.
+    """
+    return Bus._ADDRESS
+
 
 def get_object(object_path):
     """
@@ -46,4 +104,6 @@ def get_object(object_path):
     :returns: the proxy object corresponding to the object path
     :rtype: ProxyObject
     """
-    return Bus.get_bus().get_object(SERVICE, object_path, introspect=False)
+    proxy = Bus.get_bus().get_object(SERVICE, object_path, introspect=False)
+    # A traced proxy supports the methods of a proxy object that are used.
+    return cast(ProxyObject, TracedProxy(proxy, object_path)) if tracing() else proxy
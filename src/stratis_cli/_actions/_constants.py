@@ -22,6 +22,9 @@ TOP_OBJECT = "/org/storage/stratis3"
 
 SECTOR_SIZE = 512
 
+# The largest timeout that libdbus accepts, in seconds.
+MAXIMUM_DBUS_TIMEOUT = 1073741.823
+
 MAXIMUM_STRATISD_VERSION = "4.0.0"
 MINIMUM_STRATISD_VERSION = "3.9.0"
 assert Version(MINIMUM_STRATISD_VERSION) < Version(MAXIMUM_STRATISD_VERSION)
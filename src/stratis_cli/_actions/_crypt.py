@@ -16,6 +16,7 @@ Miscellaneous whole pool encryption actions.
 """
 
 import json
+import math
 from argparse import Namespace
 
 from .._constants import PoolId
@@ -28,7 +29,25 @@ from .._errors import (
 from .._stratisd_constants import StratisdErrors
 from ._connection import get_object
 from ._constants import TOP_OBJECT
+from ._reencrypt import reencrypt_pools
 from ._utils import long_running_operation
+from ._wait import wait_for_pool_operation
+
+
+def _waits(namespace: Namespace) -> bool:
+    """
+    Whether to wait until the operation has completed; a job always waits.
+    """
+    return namespace.wait is not None or namespace.run_async
+
+
+def _deadline(namespace: Namespace) -> float | None:
+    """
+    Get the time allowed by the --wait option, None for no limit.
+    """
+    return (
+        None if namespace.wait is None or math.isinf(namespace.wait) else namespace.wait
+    )
 
 
 class CryptActions:
@@ -64,27 +83,36 @@ class CryptActions:
         if bool(MOPool(mopool).Encrypted()):
             raise StratisCliNoChangeError("encryption on", pool_id)
 
+        args = {
+            "key_descs": (
+                [] if namespace.key_desc is None else [((False, 0), namespace.key_desc)]
+            ),
+            "clevis_infos": (
+                []
+                if namespace.clevis is None
+                else [
+                    (
+                        (False, 0),
+                        namespace.clevis.pin,
+                        json.dumps(namespace.clevis.config),
+                    )
+                ]
+            ),
+        }
+
+        if _waits(namespace):
+            wait_for_pool_operation(
+                pool_object_path,
+                "EncryptPool",
+                args,
+                completed=lambda mopool: bool(mopool.Encrypted()),
+                description=f"Encrypting {pool_id}",
+                deadline=_deadline(namespace),
+            )
+            return
+
         (changed, return_code, message) = Pool.Methods.EncryptPool(
-            get_object(pool_object_path),
-            {
-                "key_descs": (
-                    []
-                    if namespace.key_desc is None
-                    else [((False, 0), namespace.key_desc)]
-                ),
-                "clevis_infos": (
-                    []
-                    if namespace.clevis is None
-                    else [
-                        (
-                            (False, 0),
-                            namespace.clevis.pin,
-                            json.dumps(namespace.clevis.config),
-                        )
-                    ]
-                ),
-            },
-            timeout=10,
+            get_object(pool_object_path), args
         )
 
         if return_code != StratisdErrors.OK:
@@ -124,8 +152,19 @@ class CryptActions:
         if not bool(MOPool(mopool).Encrypted()):
             raise StratisCliNoChangeError("encryption off", pool_id)
 
+        if _waits(namespace):
+            wait_for_pool_operation(
+                pool_object_path,
+                "DecryptPool",
+                {},
+                completed=lambda mopool: not bool(mopool.Encrypted()),
+                description=f"Unencrypting {pool_id}",
+                deadline=_deadline(namespace),
+            )
+            return
+
         (changed, return_code, message) = Pool.Methods.DecryptPool(
-            get_object(pool_object_path), {}, timeout=10
+            get_object(pool_object_path), {}
         )
 
         if return_code != StratisdErrors.OK:  # pragma: no cover
@@ -139,15 +178,31 @@ class CryptActions:
             )
 
     @staticmethod
-    @long_running_operation(method_names=["ReencryptPool"])
     def reencrypt(namespace: Namespace):
         """
-        Reencrypt an already encrypted pool with a new key.
+        Reencrypt an already encrypted pool, or many encrypted pools, with a
+        new key.
         """
         if not namespace.in_place:
             raise StratisCliInPlaceNotSpecified()
 
-        from ._data import ObjectManager, Pool, pools  # noqa: PLC0415
+        if namespace.all_encrypted or namespace.match is not None:
+            reencrypt_pools(
+                namespace.match,
+                max_inflight=namespace.max_inflight,
+                deadline=_deadline(namespace),
+                as_json=namespace.as_json,
+            )
+        else:
+            CryptActions._reencrypt_pool(namespace)
+
+    @staticmethod
+    @long_running_operation(method_names=["ReencryptPool"])
+    def _reencrypt_pool(namespace: Namespace):
+        """
+        Reencrypt a single pool with a new key.
+        """
+        from ._data import MOPool, ObjectManager, Pool, pools  # noqa: PLC0415
 
         pool_id = PoolId.from_parser_namespace(namespace)
         assert pool_id is not None
@@ -156,14 +211,26 @@ class CryptActions:
 
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
 
-        (pool_object_path, _) = next(
+        (pool_object_path, mopool) = next(
             pools(props=pool_id.managed_objects_key())
             .require_unique_match(True)
             .search(managed_objects)
         )
 
+        if _waits(namespace):
+            previous = MOPool(mopool).LastReencryptedTimestamp()
+            wait_for_pool_operation(
+                pool_object_path,
+                "ReencryptPool",
+                {},
+                completed=lambda mopool: mopool.LastReencryptedTimestamp() != previous,
+                description=f"Reencrypting {pool_id}",
+                deadline=_deadline(namespace),
+            )
+            return
+
         (changed, return_code, message) = Pool.Methods.ReencryptPool(
-            get_object(pool_object_path), {}, timeout=10
+            get_object(pool_object_path), {}
         )
 
         if return_code != StratisdErrors.OK:
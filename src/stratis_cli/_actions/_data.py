@@ -37,6 +37,8 @@ from ._constants import (
 )
 from ._environment import get_timeout
 from ._introspect import SPECS
+from ._policy import with_policy
+from ._trace import traced
 
 assert hasattr(sys.modules.get("stratis_cli"), "run"), (
     "This module is being loaded too eagerly. Make sure that loading it is "
@@ -123,7 +125,7 @@ def _add_abs_path_assertion(klass, method_name, key):
     method_class = getattr(klass, "Methods")
     orig_method = getattr(method_class, method_name)
 
-    def new_method(proxy, args):
+    def new_method(proxy, args, **kwargs):
         """
         New CreatePool method
         """
@@ -131,7 +133,7 @@ def _add_abs_path_assertion(klass, method_name, key):
         assert rel_paths == [], (
             f"Precondition violated: paths {', '.join(rel_paths)} should be absolute"
         )
-        return orig_method(proxy, args)
+        return orig_method(proxy, args, **kwargs)
 
     setattr(method_class, method_name, new_method)
 
@@ -149,3 +151,48 @@ except AttributeError as err:  # pragma: no cover
         "Malformed class definition; could not access a class or method in "
         "the generated class definition"
     ) from err
+
+
+def _wrap_calls(klass, interface_name):
+    """
+    Replace the methods and property accessors of klass with ones that are
+    subject to the policy for their calls, and are traced if D-Bus calls are
+    being traced.
+
+    :param klass: the generated class
+    :param str interface_name: the interface that the class was generated from
+    """
+
+    def wrap(member, operation, func):
+        return staticmethod(
+            with_policy(
+                interface_name,
+                member,
+                operation,
+                traced(interface_name, member, operation, func),
+                timeout,
+            )
+        )
+
+    method_class = getattr(klass, "Methods")
+    for name in [name for name in vars(method_class) if not name.startswith("_")]:
+        setattr(method_class, name, wrap(name, "call", getattr(method_class, name)))
+
+    properties_class = getattr(klass, "Properties")
+    for name in [name for name in vars(properties_class) if not name.startswith("_")]:
+        property_class = getattr(properties_class, name)
+        for accessor, operation in (("Get", "get"), ("Set", "set")):
+            if hasattr(property_class, accessor):
+                setattr(
+                    property_class,
+                    accessor,
+                    wrap(name, operation, getattr(property_class, accessor)),
+                )
+
+
+_wrap_calls(Report, REPORT_INTERFACE)
+_wrap_calls(Filesystem, FILESYSTEM_INTERFACE)
+_wrap_calls(Pool, POOL_INTERFACE)
+_wrap_calls(Manager, MANAGER_INTERFACE)
+_wrap_calls(ObjectManager, "org.freedesktop.DBus.ObjectManager")
+_wrap_calls(Manager0, MANAGER_0_INTERFACE)
@@ -0,0 +1,143 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Freezing mounted filesystems while they are snapshotted.
+"""
+
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fcntl import ioctl
+from typing import Dict, List, Optional
+
+from .._errors import StratisCliFreezeError
+
+# _IOWR('X', 119, int) and _IOWR('X', 120, int), from linux/fs.h
+FIFREEZE = 0xC0045877
+FITHAW = 0xC0045878
+
+MOUNTINFO = "/proc/self/mountinfo"
+
+
+def _unescape(path: str) -> str:
+    """
+    Replace the octal escapes of a path in the mountinfo file.
+    """
+    return re.sub(r"\\([0-7]{3})", lambda match: chr(int(match.group(1), 8)), path)
+
+
+def mount_points(devnodes: List[str], mountinfo: str = MOUNTINFO) -> Dict[str, str]:
+    """
+    Find a mount point of each device that is mounted. If a device is
+    mounted more than once, any of its mount points will do, since
+    freezing acts on the filesystem, not on the mount.
+
+    :param devnodes: the device nodes
+    :param str mountinfo: the mountinfo file to read
+    :returns: a map from each mounted device node to a mount point
+    """
+    devices = {}
+    for devnode in devnodes:
+        try:
+            rdev = os.stat(devnode).st_rdev
+        except OSError:
+            continue
+        devices[f"{os.major(rdev)}:{os.minor(rdev)}"] = devnode
+
+    with open(mountinfo, encoding="utf-8") as mountinfo_file:
+        lines = mountinfo_file.readlines()
+
+    found: Dict[str, str] = {}
+    for line in lines:
+        fields = line.split()
+        devnode = devices.get(fields[2])
+        if devnode is not None and devnode not in found:
+            found[devnode] = _unescape(fields[4])
+    return found
+
+
+class Freeze:
+    """
+    Context manager which freezes the filesystems mounted at the given
+    mount points, in parallel, on entry, and thaws them on exit.
+    """
+
+    def __init__(self, paths: List[str]):
+        """
+        Initializer.
+
+        :param paths: the mount points
+        """
+        self.paths = paths
+        self.window = 0.0
+        self._fds: Dict[str, int] = {}
+        self._start = 0.0
+
+    def _each(self, request: int, paths: List[str]) -> List[Optional[OSError]]:
+        """
+        Make the request of the filesystems mounted at paths, in parallel.
+        """
+
+        def make(path: str) -> Optional[OSError]:
+            try:
+                ioctl(self._fds[path], request, 0)
+            except OSError as err:
+                return err
+            return None
+
+        with ThreadPoolExecutor(max_workers=max(len(paths), 1)) as executor:
+            return list(executor.map(make, paths))
+
+    def _thaw(self, paths: List[str]):
+        """
+        Thaw the filesystems mounted at paths, and close every descriptor.
+
+        :raises StratisCliFreezeError: if some filesystem could not be thawed
+        """
+        try:
+            errors = self._each(FITHAW, paths)
+        finally:
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds = {}
+        self.window = time.monotonic() - self._start
+
+        for path, err in zip(paths, errors):
+            if err is not None:
+                raise StratisCliFreezeError("thaw", path, err)
+
+    def __enter__(self):
+        for path in self.paths:
+            try:
+                self._fds[path] = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError as err:
+                for fd in self._fds.values():
+                    os.close(fd)
+                self._fds = {}
+                raise StratisCliFreezeError("freeze", path, err) from err
+
+        self._start = time.monotonic()
+        errors = self._each(FIFREEZE, self.paths)
+        failed = [(path, err) for path, err in zip(self.paths, errors) if err]
+        if failed != []:
+            self._thaw([path for path, err in zip(self.paths, errors) if not err])
+            (path, err) = failed[0]
+            raise StratisCliFreezeError("freeze", path, err) from err
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._thaw(self.paths)
+        return False
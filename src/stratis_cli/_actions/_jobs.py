@@ -0,0 +1,384 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Commands run in the background as jobs, and the job commands.
+
+A job is recorded in three files in the job directory: the command and the
+process that runs it, written when the job is started; the output of the
+command; and the outcome of the command, written by the job's process when
+the command has completed.
+"""
+
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import Namespace
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+from uuid import uuid4
+
+from .._errors import (
+    StratisCliDeadlineError,
+    StratisCliJobFailedError,
+    StratisCliJobFileError,
+    StratisCliJobNotFoundError,
+)
+from .._profile import PROFILE_MEMORY_VARIABLE, PROFILE_VARIABLE
+from ._formatting import print_table
+from ._utils import get_errors
+
+JOB_DIRECTORY = os.environ.get("STRATIS_JOB_DIR", "/run/stratis-cli/jobs")
+
+# Set in the environment of a job's process, so that the command is run
+# rather than started as another job.
+JOB_ID_VARIABLE = "STRATIS_JOB_ID"
+
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+LOST = "lost"
+
+# The interval at which job wait checks whether jobs have completed.
+_POLL_INTERVAL = 0.5
+
+_JOB_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+_RUN_JOB = "from stratis_cli._actions._jobs import run_job; run_job()"
+
+
+def _path(job_id: str, kind: str) -> str:
+    """
+    Get the path of one of a job's files.
+
+    :param str kind: "job", "log", or "result"
+    """
+    return os.path.join(JOB_DIRECTORY, f"{job_id}.{kind}")
+
+
+def _write(path: str, value: Any):
+    """
+    Write a JSON value to a file, replacing it atomically.
+
+    :raises OSError:
+    """
+    (fd, temp_path) = tempfile.mkstemp(dir=JOB_DIRECTORY, prefix=".", suffix=".tmp")
+    try:
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, "w", encoding="utf-8") as job_file:
+            json.dump(value, job_file)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _read(path: str) -> Any:
+    """
+    Read a JSON value from a file.
+
+    :returns: the value or None if there is no file
+    :raises StratisCliJobFileError:
+    """
+    try:
+        with open(path, encoding="utf-8") as job_file:
+            return json.load(job_file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as err:
+        raise StratisCliJobFileError(path, err) from err
+
+
+def _is_alive(pid: int) -> bool:
+    """
+    Whether a process exists.
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_job(job_id: str) -> Dict[str, Any]:
+    """
+    Read the record of a job, together with its outcome if it has completed.
+
+    A job whose process has exited without recording an outcome is lost.
+
+    :param str job_id: the job id
+    :returns: the record, with the job's state
+    :raises StratisCliJobNotFoundError:
+    :raises StratisCliJobFileError:
+    """
+    job = None if _JOB_ID_RE.match(job_id) is None else _read(_path(job_id, "job"))
+    if job is None:
+        raise StratisCliJobNotFoundError(job_id)
+
+    result = _read(_path(job_id, "result"))
+    if result is not None:
+        job.update(result)
+    else:
+        job["state"] = RUNNING if _is_alive(job["pid"]) else LOST
+
+    return job
+
+
+def in_job() -> bool:
+    """
+    Whether this process is a job's process.
+    """
+    return JOB_ID_VARIABLE in os.environ
+
+
+def _job_args(command_line_args: List[str]) -> List[str]:
+    """
+    Get the command line arguments of a job's command: those of the command
+    without --profile and --profile-memory, so that the job does not write
+    over the profile of the command that started it.
+
+    :param command_line_args: the command line arguments of the command
+    :returns: the command line arguments of the job's command
+    """
+    result = []
+    args = iter(command_line_args)
+    for arg in args:
+        if arg == "--profile":
+            next(args, None)
+        elif not (
+            arg.startswith("--profile=")
+            or (arg.startswith("--profile-") and "--profile-memory".startswith(arg))
+        ):
+            result.append(arg)
+    return result
+
+
+def start_job(command_line_args: List[str]):
+    """
+    Run a command in the background as a job and print the job id.
+
+    The command is run in a new process, which is not a child of the
+    terminal's session, with its output written to the job's log. The job
+    is not profiled, whether by its options or by the environment.
+
+    :param command_line_args: the command line arguments of the command
+    :raises StratisCliJobFileError:
+    """
+    job_id = uuid4().hex
+    command_line_args = _job_args(command_line_args)
+    env = {
+        name: value
+        for (name, value) in os.environ.items()
+        if name not in (PROFILE_VARIABLE, PROFILE_MEMORY_VARIABLE)
+    }
+
+    try:
+        os.makedirs(JOB_DIRECTORY, mode=0o755, exist_ok=True)
+        with open(_path(job_id, "log"), "wb") as log:
+            process = subprocess.Popen(
+                [sys.executable, "-c", _RUN_JOB] + command_line_args,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+                env=env | {JOB_ID_VARIABLE: job_id},
+            )
+        _write(
+            _path(job_id, "job"),
+            {
+                "id": job_id,
+                "command": command_line_args,
+                "pid": process.pid,
+                "started": time.time(),
+            },
+        )
+    except OSError as err:
+        raise StratisCliJobFileError(JOB_DIRECTORY, err) from err
+
+    print(job_id)
+
+
+def run_job():
+    """
+    Run the command of the job whose id is in the environment and record its
+    outcome. This is the entry point of a job's process; the command line
+    arguments of the command are the process's arguments.
+    """
+    from .._error_reporting import explain_error  # noqa: PLC0415
+    from .._errors import StratisCliActionError  # noqa: PLC0415
+    from .._exit import StratisCliErrorCodes, exit_  # noqa: PLC0415
+    from .._main import run  # noqa: PLC0415
+
+    job_id = os.environ[JOB_ID_VARIABLE]
+
+    (state, message) = (SUCCEEDED, None)
+    try:
+        run()(["--propagate"] + sys.argv[1:])
+    except StratisCliActionError as err:
+        explanation = explain_error(err)
+        (state, message) = (
+            FAILED,
+            str(list(get_errors(err))[-1]) if explanation is None else explanation,
+        )
+    except Exception as err:  # noqa: BLE001
+        (state, message) = (FAILED, str(err))
+
+    _write(
+        _path(job_id, "result"),
+        {"state": state, "finished": time.time(), "message": message},
+    )
+
+    if state == FAILED:
+        exit_(StratisCliErrorCodes.ERROR, f"Execution failed:{os.linesep}{message}")
+
+
+def _format_time(timestamp: float | None) -> str:
+    """
+    Format a time recorded for a job.
+    """
+    return (
+        ""
+        if timestamp is None
+        else datetime.fromtimestamp(timestamp).astimezone().isoformat(" ", "seconds")
+    )
+
+
+class JobActions:
+    """
+    Job actions.
+    """
+
+    @staticmethod
+    def list_jobs(_: Namespace):
+        """
+        List the recorded jobs.
+
+        :raises StratisCliJobFileError:
+        """
+        try:
+            names = os.listdir(JOB_DIRECTORY)
+        except FileNotFoundError:
+            names = []
+        except OSError as err:
+            raise StratisCliJobFileError(JOB_DIRECTORY, err) from err
+
+        jobs = sorted(
+            (
+                read_job(job_id)
+                for (job_id, extension) in map(os.path.splitext, names)
+                if extension == ".job"
+            ),
+            key=lambda job: job["started"],
+        )
+
+        print_table(
+            ["Job", "State", "Started", "Command"],
+            [
+                (
+                    job["id"],
+                    job["state"],
+                    _format_time(job["started"]),
+                    shlex.join(job["command"]),
+                )
+                for job in jobs
+            ],
+            ["<", "<", "<", "<"],
+        )
+
+    @staticmethod
+    def job_status(namespace: Namespace):
+        """
+        Show the state and the output of a job.
+
+        :raises StratisCliJobFileError:
+        :raises StratisCliJobNotFoundError:
+        """
+        job = read_job(namespace.job_id)
+
+        print(f"Job: {job['id']}")
+        print(f"Command: stratis {shlex.join(job['command'])}")
+        print(f"State: {job['state']}")
+        print(f"Started: {_format_time(job['started'])}")
+        print(f"Finished: {_format_time(job.get('finished'))}")
+        if job.get("message") is not None:
+            print(f"Message: {job['message']}")
+
+        try:
+            with open(
+                _path(job["id"], "log"), encoding="utf-8", errors="replace"
+            ) as log:
+                output = log.read()
+        except OSError as err:
+            raise StratisCliJobFileError(_path(job["id"], "log"), err) from err
+
+        if output != "":
+            print("Output:")
+            print(output, end="" if output.endswith("\n") else "\n")
+
+    @staticmethod
+    def wait_jobs(namespace: Namespace):
+        """
+        Wait until the specified jobs have completed, printing the outcome
+        of each.
+
+        :raises StratisCliDeadlineError:
+        :raises StratisCliJobFailedError:
+        :raises StratisCliJobFileError:
+        :raises StratisCliJobNotFoundError:
+        """
+        pending = list(dict.fromkeys(namespace.job_ids))
+        for job_id in pending:
+            read_job(job_id)
+
+        expires = (
+            None if namespace.timeout is None else time.monotonic() + namespace.timeout
+        )
+        failed: List[Tuple[str, str, str]] = []
+
+        while True:
+            for job_id in list(pending):
+                job = read_job(job_id)
+                if job["state"] == RUNNING:
+                    continue
+
+                pending.remove(job_id)
+                print(f"{job_id} {job['state']}", flush=True)
+                if job["state"] != SUCCEEDED:
+                    failed.append(
+                        (
+                            job_id,
+                            job["state"],
+                            job.get("message")
+                            or "the job's process exited without recording an outcome",
+                        )
+                    )
+
+            if pending == []:
+                break
+
+            if expires is not None and time.monotonic() >= expires:
+                raise StratisCliDeadlineError(
+                    f"job {', '.join(pending)}", namespace.timeout
+                )
+
+            time.sleep(_POLL_INTERVAL)
+
+        if failed != []:
+            raise StratisCliJobFailedError(failed)
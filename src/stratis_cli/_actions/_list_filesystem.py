@@ -16,7 +16,7 @@ Filesystem listing.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
 
 from dateutil import parser as date_parser
 from dbus import ObjectPath, String
@@ -33,28 +33,61 @@ from ._formatting import (
     print_table,
 )
 from ._utils import SizeTriple
+from ._watch import watch_table
 
 
-def list_filesystems(uuid_formatter: Callable, *, pool_name=None, fs_id=None):
+def list_filesystems(
+    uuid_formatter: Callable,
+    *,
+    pool_name=None,
+    fs_id=None,
+    all_details=False,
+    managed_objects=None,
+):
     """
     List the specified information about filesystems.
+
+    :param bool all_details: True if every filesystem should get a detail view
+    :param managed_objects: GetManagedObjects result to list, None for stratisd's
     """
     assert fs_id is None or pool_name is not None
+    assert fs_id is None or not all_details
+
+    from ._data import ObjectManager  # noqa: PLC0415
 
-    from ._data import (  # noqa: PLC0415
-        MOFilesystem,
-        MOPool,
-        ObjectManager,
-        filesystems,
-        pools,
+    if managed_objects is None:
+        proxy = get_object(TOP_OBJECT)
+        managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+
+    (pool_object_path_to_pool_name, filesystems_with_paths) = _select_filesystems(
+        managed_objects, pool_name=pool_name, fs_id=fs_id
     )
+    filesystems_with_props = [mofs for (_, mofs) in filesystems_with_paths]
+
+    if fs_id is None and not all_details:
+        klass = Table(
+            uuid_formatter, filesystems_with_props, pool_object_path_to_pool_name
+        )
+    else:
+        klass = Detail(
+            uuid_formatter, filesystems_with_props, pool_object_path_to_pool_name
+        )
+
+    klass.display()
 
-    proxy = get_object(TOP_OBJECT)
-    managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+
+def _select_filesystems(
+    managed_objects: Mapping[str, Any], *, pool_name=None, fs_id=None
+) -> Tuple[Dict[ObjectPath, String], List[Tuple[str, Any]]]:
+    """
+    Select the filesystems to list.
+
+    :returns: pool names keyed by object path and the selected filesystems
+    """
+    from ._data import MOFilesystem, MOPool, filesystems, pools  # noqa: PLC0415
 
     if pool_name is None:
         props = None
-        pool_object_path = None
         fs_props = None
         requires_unique = False
     else:
@@ -72,23 +105,62 @@ def list_filesystems(uuid_formatter: Callable, *, pool_name=None, fs_id=None):
         for path, info in pools(props=props).search(managed_objects)
     )
 
-    filesystems_with_props = [
-        MOFilesystem(info)
+    filesystems_with_paths = [
+        (objpath, MOFilesystem(info))
         for objpath, info in filesystems(props=fs_props)
         .require_unique_match(requires_unique)
         .search(managed_objects)
     ]
 
-    if fs_id is None:
-        klass = Table(
-            uuid_formatter, filesystems_with_props, pool_object_path_to_pool_name
-        )
-    else:
-        klass = Detail(
-            uuid_formatter, filesystems_with_props, pool_object_path_to_pool_name
-        )
+    return (pool_object_path_to_pool_name, filesystems_with_paths)
 
-    klass.display()
+
+def filesystem_table_rows(
+    uuid_formatter: Callable,
+    managed_objects: Mapping[str, Any],
+    object_paths: Iterable[str] | None = None,
+    *,
+    pool_name=None,
+) -> Dict[str, Tuple[str, ...]]:
+    """
+    Calculate the rows of the filesystem table.
+
+    :param managed_objects: the GetManagedObjects result
+    :param object_paths: the filesystems for which to calculate rows, None for all
+    :param pool_name: the pool whose filesystems are listed, None for all
+    :returns: the rows, keyed by filesystem object path
+    """
+    (pool_object_path_to_pool_name, filesystems_with_paths) = _select_filesystems(
+        managed_objects, pool_name=pool_name
+    )
+    selected = None if object_paths is None else frozenset(object_paths)
+    table = Table(uuid_formatter, [], pool_object_path_to_pool_name)
+    return {
+        objpath: table.row(mofs)
+        for (objpath, mofs) in filesystems_with_paths
+        if selected is None or objpath in selected
+    }
+
+
+def watch_filesystems(uuid_formatter: Callable, *, pool_name=None, throttle: float):
+    """
+    Display the table of filesystems and redisplay it as the filesystems
+    change.
+
+    :param uuid_formatter: function to format a UUID str or UUID
+    :type uuid_formatter: str or UUID -> str
+    :param pool_name: the pool whose filesystems are listed, None for all
+    :param float throttle: the minimum interval between redisplays in seconds
+    """
+    watch_table(
+        Table.HEADINGS,
+        Table.ALIGNMENT,
+        Table.sort_key,
+        lambda managed_objects, object_paths: filesystem_table_rows(
+            uuid_formatter, managed_objects, object_paths, pool_name=pool_name
+        ),
+        throttle=throttle,
+    )
 
 
 class ListFilesystem(ABC):
@@ -191,9 +263,19 @@ class Table(ListFilesystem):
     List filesystems using table format.
     """
 
-    def display(self):
+    HEADINGS = ["Pool", "Filesystem", f"{TOTAL_USED_FREE} / Limit", "Device", "UUID"]
+    ALIGNMENT = ["<", "<", "<", "<", "<"]
+
+    @staticmethod
+    def sort_key(row: Tuple[str, ...]) -> Tuple[str, str]:
         """
-        List the filesystems.
+        Key by which the rows of the table are sorted.
+        """
+        return (row[0], row[1])
+
+    def row(self, mofilesystem: Any) -> Tuple[str, ...]:
+        """
+        Calculate the row of the table for a single filesystem.
         """
 
         def filesystem_size_quartet(mofs: Any) -> str:
@@ -218,21 +300,28 @@ class Table(ListFilesystem):
             )
             return f"{triple_str} / {limit}"
 
-        tables = [
-            (
-                self.pool_name_str(mofilesystem),
-                ListFilesystem.name_str(mofilesystem),
-                filesystem_size_quartet(mofilesystem),
-                ListFilesystem.devnode_str(mofilesystem),
-                self.uuid_str(mofilesystem),
-            )
-            for mofilesystem in self.filesystems_with_props
-        ]
+        return (
+            self.pool_name_str(mofilesystem),
+            ListFilesystem.name_str(mofilesystem),
+            filesystem_size_quartet(mofilesystem),
+            ListFilesystem.devnode_str(mofilesystem),
+            self.uuid_str(mofilesystem),
+        )
 
+    def display(self):
+        """
+        List the filesystems.
+        """
         print_table(
-            ["Pool", "Filesystem", f"{TOTAL_USED_FREE} / Limit", "Device", "UUID"],
-            sorted(tables, key=lambda entry: (entry[0], entry[1])),
-            ["<", "<", "<", "<", "<"],
+            self.HEADINGS,
+            sorted(
+                (
+                    self.row(mofilesystem)
+                    for mofilesystem in self.filesystems_with_props
+                ),
+                key=self.sort_key,
+            ),
+            self.ALIGNMENT,
         )
 
 
@@ -243,12 +332,28 @@ class Detail(ListFilesystem):
 
     def display(self):
         """
-        List the filesystems.
+        List the filesystems, ordered by pool name and filesystem name.
         """
-        assert len(self.filesystems_with_props) == 1
+        for index, fs in enumerate(
+            sorted(
+                self.filesystems_with_props,
+                key=lambda mofs: (
+                    self.pool_name_str(mofs),
+                    ListFilesystem.name_str(mofs),
+                ),
+            )
+        ):
+            if index > 0:
+                print()
+            self._print_detail_view(fs)
 
-        fs = self.filesystems_with_props[0]
+    def _print_detail_view(self, fs: Any):
+        """
+        Print the detailed view for a single filesystem.
 
+        :param fs: properties of the filesystem
+        :type fs: MOFilesystem
+        """
         print(f"UUID: {self.uuid_str(fs)}")
         print(f"Name: {ListFilesystem.name_str(fs)}")
         print(f"Pool: {self.pool_name_str(fs)}")
@@ -52,6 +52,7 @@ from ._utils import (
     StoppedPool,
     fetch_stopped_pools_property,
 )
+from ._watch import watch_table
 
 
 # This method is only used with legacy pools
@@ -178,6 +179,8 @@ def list_pools(
     *,
     stopped: bool = False,
     selection: PoolId | None = None,
+    all_details: bool = False,
+    managed_objects: Mapping[str, Any] | None = None,
 ):
     """
     List the specified information about pools.
@@ -185,21 +188,43 @@ def list_pools(
     :type uuid_formatter: (str or UUID) -> str
     :param bool stopped: True if stopped pools should be listed, else False
     :param PoolId selection: how to select pools to list
+    :param bool all_details: True if every pool should get a detail view
+    :param managed_objects: GetManagedObjects result to list, None for stratisd's
     """
+    assert selection is None or not all_details
+    assert managed_objects is None or not stopped
+
     if stopped:
-        if selection is None:
+        if selection is None and not all_details:
             klass = StoppedTable(uuid_formatter)
         else:
             klass = StoppedDetail(uuid_formatter, selection)
     else:  # noqa: PLR5501
-        if selection is None:
-            klass = DefaultTable(uuid_formatter)
+        if selection is None and not all_details:
+            klass = DefaultTable(uuid_formatter, managed_objects)
         else:
-            klass = DefaultDetail(uuid_formatter, selection)
+            klass = DefaultDetail(uuid_formatter, selection, managed_objects)
 
     klass.display()
 
 
+def watch_pools(uuid_formatter: Callable[[str | UUID], str], *, throttle: float):
+    """
+    Display the table of pools and redisplay it as the pools change.
+
+    :param uuid_formatter: how to format UUIDs
+    :type uuid_formatter: (str or UUID) -> str
+    :param float throttle: the minimum interval between redisplays in seconds
+    """
+    watch_table(
+        DefaultTable.HEADINGS,
+        DefaultTable.ALIGNMENT,
+        DefaultTable.sort_key,
+        DefaultTable(uuid_formatter).rows,
+        throttle=throttle,
+    )
+
+
 def _clevis_to_str(clevis_info: ClevisInfo) -> str:  # pragma: no cover
     """
     :param ClevisInfo clevis_info: the Clevis info to stringify
@@ -236,6 +261,30 @@ class Default(ListPool):
     Handle listing the pools that are listed by default.
     """
 
+    def __init__(
+        self,
+        uuid_formatter: Callable[[UUID | str], str],
+        managed_objects: Mapping[str, Any] | None = None,
+    ):
+        """
+        Initializer.
+        :param uuid_formatter: function to format a UUID str or UUID
+        :param managed_objects: GetManagedObjects result, None to get from stratisd
+        """
+        super().__init__(uuid_formatter)
+        self.managed_objects = managed_objects
+
+    def get_managed_objects(self) -> Mapping[str, Any]:
+        """
+        Get the GetManagedObjects result to list.
+        """
+        if self.managed_objects is not None:
+            return self.managed_objects
+
+        from ._data import ObjectManager  # noqa: PLC0415
+
+        return ObjectManager.Methods.GetManagedObjects(get_object(TOP_OBJECT), {})
+
     @staticmethod
     def metadata_version(mopool: Any) -> MetadataVersion | None:
         """
@@ -349,17 +398,24 @@ class Default(ListPool):
 
 class DefaultDetail(Default):
     """
-    List one pool with a detail view.
+    List one pool, or every pool, with a detail view.
     """
 
-    def __init__(self, uuid_formatter: Callable[[str | UUID], str], selection: PoolId):
+    def __init__(
+        self,
+        uuid_formatter: Callable[[str | UUID], str],
+        selection: PoolId | None,
+        managed_objects: Mapping[str, Any] | None = None,
+    ):
         """
         Initializer.
         :param uuid_formatter: function to format a UUID str or UUID
         :param uuid_formatter: str or UUID -> str
-        :param PoolId selection: how to select pools to list
+        :param selection: how to select pools to list, None for all pools
+        :type selection: PoolId or NoneType
+        :param managed_objects: GetManagedObjects result, None to get from stratisd
         """
-        super().__init__(uuid_formatter)
+        super().__init__(uuid_formatter, managed_objects)
         self.selection = selection
 
     def _print_detail_view(  # noqa: PLR0912,PLR0915
@@ -520,25 +576,40 @@ class DefaultDetail(Default):
 
     def display(self):
         """
-        List a single pool in detail.
-        """
-        from ._data import MOPool, ObjectManager, devs, pools  # noqa: PLC0415
+        List a single pool, or all pools, in detail.
 
-        proxy = get_object(TOP_OBJECT)
-
-        managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        All the pools are displayed from a single GetManagedObjects result,
+        and device size change alerts are calculated just once for all of
+        them.
+        """
+        from ._data import MOPool, devs, pools  # noqa: PLC0415
 
-        (pool_object_path, mopool) = next(
-            pools(props=self.selection.managed_objects_key())
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
+        managed_objects = self.get_managed_objects()
 
-        alerts = DeviceSizeChangedAlerts(
-            devs(props={"Pool": pool_object_path}).search(managed_objects)
-        )
+        if self.selection is None:
+            pools_with_props = sorted(
+                (
+                    (pool_object_path, MOPool(info))
+                    for pool_object_path, info in pools().search(managed_objects)
+                ),
+                key=lambda entry: Default.name_str(entry[1]),
+            )
+            alerts = DeviceSizeChangedAlerts(devs().search(managed_objects))
+        else:
+            (pool_object_path, mopool) = next(
+                pools(props=self.selection.managed_objects_key())
+                .require_unique_match(True)
+                .search(managed_objects)
+            )
+            pools_with_props = [(pool_object_path, MOPool(mopool))]
+            alerts = DeviceSizeChangedAlerts(
+                devs(props={"Pool": pool_object_path}).search(managed_objects)
+            )
 
-        self._print_detail_view(pool_object_path, MOPool(mopool), alerts)
+        for index, (pool_object_path, mopool) in enumerate(pools_with_props):
+            if index > 0:
+                print()
+            self._print_detail_view(pool_object_path, mopool, alerts)
 
 
 class DefaultTable(Default):
@@ -546,13 +617,29 @@ class DefaultTable(Default):
     List several pools with a table view.
     """
 
-    def display(self):
+    HEADINGS = ["Name", TOTAL_USED_FREE, "Properties", "UUID", "Alerts"]
+    ALIGNMENT = ["<", ">", ">", ">", "<"]
+
+    @staticmethod
+    def sort_key(row: tuple[str, ...]) -> str:
         """
-        List pools in table view.
+        Key by which the rows of the table are sorted.
         """
-        from ._data import MOPool, ObjectManager, devs, pools  # noqa: PLC0415
+        return row[0]
 
-        proxy = get_object(TOP_OBJECT)
+    def rows(
+        self,
+        managed_objects: Mapping[str, Any],
+        object_paths: Iterable[str] | None = None,
+    ) -> dict[str, tuple[str, ...]]:
+        """
+        Calculate the rows of the table.
+
+        :param managed_objects: the GetManagedObjects result
+        :param object_paths: the pools for which to calculate rows, None for all
+        :returns: the rows, keyed by pool object path
+        """
+        from ._data import MOPool, devs, pools  # noqa: PLC0415
 
         def physical_size_triple(mopool: Any) -> str:
             """
@@ -637,12 +724,14 @@ class DefaultTable(Default):
             ]
             return ",".join(gen_string(x, y) for x, y in props_list)
 
-        managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        selected = None if object_paths is None else frozenset(object_paths)
 
         alerts = DeviceSizeChangedAlerts(devs().search(managed_objects))
 
         pools_with_props = [
-            (objpath, MOPool(info)) for objpath, info in pools().search(managed_objects)
+            (objpath, MOPool(info))
+            for objpath, info in pools().search(managed_objects)
+            if selected is None or objpath in selected
         ]
 
         def alerts_str(mopool: Any, pool_object_path: str) -> str:
@@ -656,8 +745,8 @@ class DefaultTable(Default):
                 )
             )
 
-        tables = [
-            (
+        return {
+            pool_object_path: (
                 Default.name_str(mopool),
                 physical_size_triple(mopool),
                 properties_string(mopool),
@@ -665,12 +754,16 @@ class DefaultTable(Default):
                 alerts_str(mopool, pool_object_path),
             )
             for (pool_object_path, mopool) in pools_with_props
-        ]
+        }
 
+    def display(self):
+        """
+        List pools in table view.
+        """
         print_table(
-            ["Name", TOTAL_USED_FREE, "Properties", "UUID", "Alerts"],
-            sorted(tables, key=lambda entry: entry[0]),
-            ["<", ">", ">", ">", "<"],
+            self.HEADINGS,
+            sorted(self.rows(self.get_managed_objects()).values(), key=self.sort_key),
+            self.ALIGNMENT,
         )
 
 
@@ -702,15 +795,18 @@ class Stopped(ListPool):
 
 class StoppedDetail(Stopped):
     """
-    Detailed view of one stopped pool.
+    Detailed view of one stopped pool, or of every stopped pool.
     """
 
-    def __init__(self, uuid_formatter: Callable[[str | UUID], str], selection: PoolId):
+    def __init__(
+        self, uuid_formatter: Callable[[str | UUID], str], selection: PoolId | None
+    ):
         """
         Initializer.
         :param uuid_formatter: function to format a UUID str or UUID
         :param uuid_formatter: str or UUID -> str
-        :param PoolId selection: how to select pools to list
+        :param selection: how to select pools to list, None for all pools
+        :type selection: PoolId or NoneType
         """
         super().__init__(uuid_formatter)
         self.selection = selection
@@ -776,11 +872,27 @@ class StoppedDetail(Stopped):
 
     def display(self):
         """
-        Display info about a stopped pool.
+        Display info about a stopped pool, or about all stopped pools.
         """
 
         proxy = get_object(TOP_OBJECT)
         stopped_pools = fetch_stopped_pools_property(proxy)
+
+        if self.selection is None:
+            for index, (pool_uuid, pool) in enumerate(
+                sorted(
+                    (
+                        (pool_uuid, StoppedPool(info))
+                        for pool_uuid, info in stopped_pools.items()
+                    ),
+                    key=lambda entry: self._pool_name(entry[1].name),
+                )
+            ):
+                if index > 0:
+                    print()
+                self._print_detail_view(pool_uuid, pool)
+            return
+
         selection_func = self.selection.stopped_pools_func()
 
         stopped_pool = next(
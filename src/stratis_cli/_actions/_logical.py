@@ -15,23 +15,200 @@
 Miscellaneous logical actions.
 """
 
+import sys
 from argparse import Namespace
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
+from dateutil import parser as date_parser
 from justbytes import Range
 
 from .._constants import FilesystemId
 from .._errors import (
+    StratisCliBatchError,
     StratisCliEngineError,
+    StratisCliFreezeError,
     StratisCliIncoherenceError,
+    StratisCliInvalidCommandLineOptionValue,
+    StratisCliNameConflictError,
     StratisCliNoChangeError,
     StratisCliNoPropertyChangeError,
     StratisCliPartialChangeError,
+    StratisCliResourceNotFoundError,
 )
 from .._stratisd_constants import StratisdErrors
+from ._batch import Task, perform_tasks, report_results, run_batch
+from ._cache import listing_managed_objects
 from ._connection import get_object
 from ._constants import TOP_OBJECT
-from ._formatting import get_uuid_formatter
-from ._list_filesystem import list_filesystems
+from ._formatting import get_uuid_formatter, print_table
+from ._freeze import Freeze, mount_points
+from ._list_filesystem import list_filesystems, watch_filesystems
+from ._prune import select_expired
+from ._utils import get_errors
+
+
+def snapshot_names(
+    origins: List[str], pool_name: str, template: str, now: datetime
+) -> Dict[str, str]:
+    """
+    Get the name of the snapshot of each origin filesystem.
+
+    :param origins: the names of the origins
+    :param str pool_name: the name of the pool
+    :param str template: the template of the snapshot names
+    :param datetime now: the time substituted in the snapshot names
+    :returns: a map from each origin name to its snapshot name
+    :raises StratisCliInvalidCommandLineOptionValue: if two names are the same
+    """
+    snapshots = {
+        name: template.format(
+            origin=name,
+            pool=pool_name,
+            date=now.strftime("%Y-%m-%d"),
+            time=now.strftime("%H%M%S"),
+        )
+        for name in origins
+    }
+
+    repeated = sorted(
+        name for (name, count) in Counter(snapshots.values()).items() if count > 1
+    )
+    if repeated != []:
+        raise StratisCliInvalidCommandLineOptionValue(
+            f"The name template {template} gives more than one snapshot the "
+            f"name {', '.join(repeated)}."
+        )
+
+    return snapshots
+
+
+def _pool_names(managed_objects: Any, pool_name: Optional[str]) -> Dict[str, str]:
+    """
+    Get the names of the pools in scope: the named pool, or every pool if
+    no pool is named.
+
+    :param managed_objects: the result of GetManagedObjects
+    :param pool_name: the name of the pool, or None
+    :returns: map from pool object path to pool name
+    """
+    from ._data import MOPool, pools  # noqa: PLC0415
+
+    return {
+        pool_object_path: str(MOPool(info).Name())
+        for (pool_object_path, info) in (
+            pools()
+            if pool_name is None
+            else pools(props={"Name": pool_name}).require_unique_match(True)
+        ).search(managed_objects)
+    }
+
+
+def destroy_in_pools(
+    operation: str,
+    pool_names: Dict[str, str],
+    selected: Dict[str, List[str]],
+    *,
+    jobs: int,
+    as_json: bool,
+):
+    """
+    Destroy filesystems with one DestroyFilesystems call per pool, making
+    the calls for up to jobs pools at once.
+
+    :param str operation: the operation, for the error message
+    :param pool_names: map from pool object path to pool name
+    :param selected: map from pool object path to the filesystems to destroy
+    :param int jobs: the maximum number of pools to destroy in at once
+    :param bool as_json: whether to print the results as JSON
+    :raises StratisCliBatchError: if the filesystems of some pool were not
+        destroyed
+    """
+    from ._data import Pool  # noqa: PLC0415
+
+    if selected == {}:
+        return
+
+    def destroy(pool_object_path: str, object_paths: List[str]):
+        ((destroyed, list_destroyed), return_code, message) = (
+            Pool.Methods.DestroyFilesystems(
+                get_object(pool_object_path), {"filesystems": object_paths}
+            )
+        )
+
+        if return_code != StratisdErrors.OK:
+            raise StratisCliEngineError(return_code, message)
+
+        if not destroyed or len(list_destroyed) < len(object_paths):  # pragma: no cover
+            raise StratisCliIncoherenceError(
+                (
+                    f"Expected to destroy {len(object_paths)} filesystems in "
+                    f"pool {pool_names[pool_object_path]} but stratisd "
+                    f"reports that it destroyed {len(list_destroyed)}"
+                )
+            )
+
+    run_batch(
+        operation,
+        ["Pool", "Filesystems"],
+        [
+            (
+                (pool_names[pool_object_path], str(len(object_paths))),
+                partial(destroy, pool_object_path, object_paths),
+            )
+            for (pool_object_path, object_paths) in sorted(
+                selected.items(), key=lambda item: pool_names[item[0]]
+            )
+        ],
+        jobs=jobs,
+        as_json=as_json,
+    )
+
+
+def snapshot_group(tasks: List[Task], paths: List[str], *, as_json: bool):
+    """
+    Snapshot a group of filesystems at once, with the filesystems mounted at
+    paths frozen only for as long as the snapshots take. The results are
+    printed once the filesystems are thawed, even if some filesystem could
+    not be thawed.
+
+    :param tasks: the snapshots
+    :param paths: the mount points of the filesystems
+    :param bool as_json: whether to print the results as JSON
+    :raises StratisCliBatchError: if some snapshot failed
+    :raises StratisCliFreezeError: if some filesystem could not be frozen or
+        thawed
+    """
+    freeze = Freeze(paths)
+    messages: List[Optional[str]] = []
+    thaw_error = None
+    try:
+        with freeze:
+            messages = perform_tasks(tasks, jobs=len(tasks))
+    except StratisCliFreezeError as err:
+        if err.operation != "thaw":
+            raise
+        thaw_error = err
+
+    if freeze.paths != []:
+        print(
+            f"Froze {len(freeze.paths)} filesystems for {freeze.window * 1000:.1f} ms",
+            file=sys.stderr,
+        )
+
+    try:
+        report_results(
+            "snapshot", ["Origin", "Snapshot"], tasks, messages, as_json=as_json
+        )
+    except StratisCliBatchError as err:
+        if thaw_error is not None:
+            raise thaw_error from err
+        raise
+
+    if thaw_error is not None:
+        raise thaw_error
 
 
 class LogicalActions:
@@ -42,78 +219,142 @@ class LogicalActions:
     @staticmethod
     def create_volumes(namespace: Namespace):
         """
-        Create volumes in a pool.
+        Create volumes in a pool, or in the pools of a manifest.
 
+        All the filesystems are checked against a single GetManagedObjects
+        result before any is created. The filesystems of each pool are
+        created by CreateFilesystems calls of at most the batch size. If a
+        call fails after earlier calls have created some filesystems, the
+        filesystems that were not created are reported.
+
+        :raises StratisCliBatchError:
         :raises StratisCliEngineError:
         :raises StratisCliIncoherenceError:
         :raises StratisCliPartialChangeError:
+        :raises StratisCliResourceNotFoundError:
         """
 
         from ._data import (  # noqa: PLC0415
             MOFilesystem,
+            MOPool,
             ObjectManager,
             Pool,
             filesystems,
             pools,
         )
 
+        def size_arg(size: Range | None):
+            return (False, "") if size is None else (True, size.magnitude.numerator)
+
+        # The specifications of the filesystems to create in each pool
+        requested: Dict[str, List[Tuple[str, Any, Any]]] = defaultdict(list)
+        for pool_name, fs_name, size, size_limit in (
+            namespace.manifest
+            if namespace.manifest is not None
+            else [
+                (namespace.pool_name, fs_name, namespace.size, namespace.size_limit)
+                for fs_name in dict.fromkeys(namespace.fs_name)
+            ]
+        ):
+            requested[pool_name].append((fs_name, size_arg(size), size_arg(size_limit)))
+
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        (pool_object_path, _) = next(
-            pools(props={"Name": namespace.pool_name})
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
-
-        requested_names = frozenset(namespace.fs_name)
 
-        names = frozenset(
-            MOFilesystem(info).Name()
-            for (_, info) in filesystems(props={"Pool": pool_object_path}).search(
-                managed_objects
+        if namespace.manifest is None:
+            (pool_object_path, _) = next(
+                pools(props={"Name": namespace.pool_name})
+                .require_unique_match(True)
+                .search(managed_objects)
             )
+            pool_object_paths = {namespace.pool_name: pool_object_path}
+        else:
+            pool_object_paths = {
+                str(MOPool(info).Name()): pool_object_path
+                for (pool_object_path, info) in pools().search(managed_objects)
+            }
+            missing = [name for name in requested if name not in pool_object_paths]
+            if missing != []:
+                raise StratisCliResourceNotFoundError(
+                    "create", f"pools {', '.join(missing)}"
+                )
+
+        # Filesystems are identified by their pool only if there are several
+        def label(pool_name: str, fs_name: str) -> str:
+            return fs_name if namespace.manifest is None else f"{pool_name}/{fs_name}"
+
+        requested_names = frozenset(
+            label(pool_name, spec[0])
+            for (pool_name, specs) in requested.items()
+            for spec in specs
         )
-        already_names = requested_names.intersection(names)
+        already_names = frozenset(
+            label(pool_name, MOFilesystem(info).Name())
+            for pool_name in requested
+            for (_, info) in filesystems(
+                props={"Pool": pool_object_paths[pool_name]}
+            ).search(managed_objects)
+        ).intersection(requested_names)
 
         if already_names != frozenset():
             raise StratisCliPartialChangeError(
                 "create", requested_names.difference(already_names), already_names
             )
 
-        requested_size_arg = (
-            (False, "")
-            if namespace.size is None
-            else (True, namespace.size.magnitude.numerator)
-        )
-
-        requested_size_limit_arg = (
-            (False, "")
-            if namespace.size_limit is None
-            else (True, namespace.size_limit.magnitude.numerator)
-        )
-
-        requested_specs = [
-            (n, requested_size_arg, requested_size_limit_arg) for n in requested_names
-        ]
-
-        ((created, list_created), return_code, message) = (
-            Pool.Methods.CreateFilesystems(
-                get_object(pool_object_path), {"specs": requested_specs}
+        def create(pool_name: str, batch: List[Tuple[str, Any, Any]]):
+            ((created, list_created), return_code, message) = (
+                Pool.Methods.CreateFilesystems(
+                    get_object(pool_object_paths[pool_name]), {"specs": batch}
+                )
             )
-        )
 
-        if return_code != StratisdErrors.OK:
-            raise StratisCliEngineError(return_code, message)
+            if return_code != StratisdErrors.OK:
+                raise StratisCliEngineError(return_code, message)
+
+            if not created or len(list_created) < len(batch):  # pragma: no cover
+                raise StratisCliIncoherenceError(
+                    (
+                        f"Expected to create the specified filesystems in pool "
+                        f"{pool_name} but stratisd reports that it did "
+                        f"not actually create some or all of the filesystems "
+                        f"requested"
+                    )
+                )
 
-        if not created or len(list_created) < len(requested_names):  # pragma: no cover
-            raise StratisCliIncoherenceError(
-                (
-                    f"Expected to create the specified filesystems in pool "
-                    f"{namespace.pool_name} but stratisd reports that it did "
-                    f"not actually create some or all of the filesystems "
-                    f"requested"
+        # The names of the filesystems created so far, and of those in the
+        # request being made
+        done: Set[str] = set()
+        pending: FrozenSet[str] = frozenset()
+        try:
+            for pool_name, specs in requested.items():
+                batch_size = (
+                    len(specs) if namespace.batch_size is None else namespace.batch_size
                 )
-            )
+                for index in range(0, len(specs), batch_size):
+                    batch = specs[index : index + batch_size]
+                    pending = frozenset(label(pool_name, spec[0]) for spec in batch)
+                    create(pool_name, batch)
+                    done.update(pending)
+        except Exception as err:
+            if done == set():
+                raise
+
+            # Some filesystems were created by earlier requests; list those
+            # that were not, so that the manifest can be corrected and rerun.
+            error_message = str(list(get_errors(err))[-1])
+            raise StratisCliBatchError(
+                "create",
+                [
+                    (name, error_message if name in pending else "not attempted")
+                    for name in (
+                        label(pool_name, spec[0])
+                        for (pool_name, specs) in requested.items()
+                        for spec in specs
+                    )
+                    if name not in done
+                ],
+                len(requested_names),
+            ) from err
 
     @staticmethod
     def list_volumes(namespace: Namespace):
@@ -135,18 +376,34 @@ class LogicalActions:
         )
 
         uuid_formatter = get_uuid_formatter(namespace.unhyphenated_uuids)
+
+        if getattr(namespace, "watch", False):
+            watch_filesystems(
+                uuid_formatter,
+                pool_name=namespace.pool_name,
+                throttle=namespace.throttle,
+            )
+            return
+
         list_filesystems(
-            uuid_formatter, pool_name=getattr(namespace, "pool_name", None), fs_id=fs_id
+            uuid_formatter,
+            pool_name=getattr(namespace, "pool_name", None),
+            fs_id=fs_id,
+            all_details=getattr(namespace, "all_details", False),
+            managed_objects=listing_managed_objects(namespace),
         )
 
     @staticmethod
     def destroy_volumes(namespace: Namespace):
         """
-        Destroy volumes in a pool.
+        Destroy volumes in a pool, or the volumes that the selectors match
+        in a pool or in every pool.
 
+        :raises StratisCliBatchError:
         :raises StratisCliEngineError:
         :raises StratisCliIncoherenceError:
         :raises StratisCliPartialChangeError:
+        :raises StratisCliResourceNotFoundError:
         """
 
         from ._data import (  # noqa: PLC0415
@@ -160,6 +417,14 @@ class LogicalActions:
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
 
+        if not (
+            namespace.match is None
+            and namespace.older_than is None
+            and namespace.snapshots_of is None
+        ):
+            LogicalActions._destroy_selected(namespace, managed_objects)
+            return
+
         (pool_object_path, _) = next(
             pools(props={"Name": namespace.pool_name})
             .require_unique_match(True)
@@ -206,15 +471,194 @@ class LogicalActions:
                 )
             )
 
+    @staticmethod
+    def _destroy_selected(namespace: Namespace, managed_objects: Any):
+        """
+        Destroy the volumes that all the selectors match.
+
+        :raises StratisCliBatchError:
+        :raises StratisCliResourceNotFoundError:
+        """
+        from ._data import MOFilesystem, filesystems  # noqa: PLC0415
+
+        pool_names = _pool_names(managed_objects, namespace.pool_name)
+
+        mofilesystems = {
+            object_path: mofs
+            for (object_path, mofs) in (
+                (object_path, MOFilesystem(info))
+                for (object_path, info) in filesystems().search(managed_objects)
+            )
+            if mofs.Pool() in pool_names
+        }
+
+        origins: frozenset = frozenset()
+        if namespace.snapshots_of is not None:
+            origins = frozenset(
+                object_path
+                for (object_path, mofs) in mofilesystems.items()
+                if mofs.Name() == namespace.snapshots_of
+            )
+            if origins == frozenset():
+                raise StratisCliResourceNotFoundError(
+                    "destroy", f"filesystem {namespace.snapshots_of}"
+                )
+
+        now = datetime.now(timezone.utc)
+
+        def is_selected(mofs: Any) -> bool:
+            if namespace.match is not None and not namespace.match.fullmatch(
+                str(mofs.Name())
+            ):
+                return False
+
+            if (
+                namespace.older_than is not None
+                and (now - date_parser.isoparse(mofs.Created())).total_seconds()
+                <= namespace.older_than
+            ):
+                return False
+
+            if namespace.snapshots_of is not None:
+                (has_origin, origin) = mofs.Origin()
+                return has_origin and origin in origins
+
+            return True
+
+        selected: Dict[str, List[str]] = defaultdict(list)
+        for object_path, mofs in sorted(
+            mofilesystems.items(), key=lambda item: str(item[1].Name())
+        ):
+            if is_selected(mofs):
+                selected[mofs.Pool()].append(object_path)
+
+        if selected == {}:
+            raise StratisCliResourceNotFoundError(
+                "destroy", "filesystems selected by the options"
+            )
+
+        if namespace.dry_run:
+            print_table(
+                ["Pool", "Filesystem", "Created"],
+                [
+                    [
+                        pool_names[pool_object_path],
+                        str(mofilesystems[object_path].Name()),
+                        date_parser.isoparse(mofilesystems[object_path].Created())
+                        .astimezone()
+                        .strftime("%b %d %Y %H:%M"),
+                    ]
+                    for (pool_object_path, object_paths) in sorted(
+                        selected.items(), key=lambda item: pool_names[item[0]]
+                    )
+                    for object_path in object_paths
+                ],
+                ["<", "<", "<"],
+            )
+            return
+
+        destroy_in_pools(
+            "destroy",
+            pool_names,
+            selected,
+            jobs=namespace.jobs,
+            as_json=namespace.as_json,
+        )
+
+    @staticmethod
+    def prune_snapshots(namespace: Namespace):
+        """
+        Destroy the snapshots that the retention rules do not keep, in one
+        pool or in every pool.
+
+        :raises StratisCliBatchError:
+        """
+        from ._data import MOFilesystem, ObjectManager, filesystems  # noqa: PLC0415
+
+        proxy = get_object(TOP_OBJECT)
+        managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+
+        pool_names = _pool_names(managed_objects, namespace.pool_name)
+
+        mofilesystems = {
+            object_path: MOFilesystem(info)
+            for (object_path, info) in filesystems().search(managed_objects)
+        }
+
+        # The snapshots of each origin, except those scheduled to be reverted
+        snapshots: Dict[str, List[Tuple[str, datetime]]] = defaultdict(list)
+        for object_path, mofs in mofilesystems.items():
+            (has_origin, origin) = mofs.Origin()
+            if (
+                has_origin
+                and origin in mofilesystems
+                and mofs.Pool() in pool_names
+                and not mofs.MergeScheduled()
+            ):
+                snapshots[origin].append(
+                    (object_path, date_parser.isoparse(mofs.Created()).astimezone())
+                )
+
+        expired: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for origin, origin_snapshots in snapshots.items():
+            for object_path in select_expired(
+                origin_snapshots,
+                keep_last=namespace.keep_last,
+                keep_daily=namespace.keep_daily,
+                keep_weekly=namespace.keep_weekly,
+            ):
+                expired[mofilesystems[object_path].Pool()].append((object_path, origin))
+
+        if namespace.dry_run:
+            print_table(
+                ["Pool", "Origin", "Snapshot", "Created"],
+                [
+                    [
+                        pool_names[pool_object_path],
+                        str(mofilesystems[origin].Name()),
+                        str(mofilesystems[object_path].Name()),
+                        date_parser.isoparse(mofilesystems[object_path].Created())
+                        .astimezone()
+                        .strftime("%b %d %Y %H:%M"),
+                    ]
+                    for (pool_object_path, pool_expired) in expired.items()
+                    for (object_path, origin) in pool_expired
+                ],
+                ["<", "<", "<", "<"],
+            )
+            return
+
+        destroy_in_pools(
+            "prune",
+            pool_names,
+            {
+                pool_object_path: [object_path for (object_path, _) in pool_expired]
+                for (pool_object_path, pool_expired) in expired.items()
+            },
+            jobs=namespace.jobs,
+            as_json=namespace.as_json,
+        )
+
     @staticmethod
     def snapshot_filesystem(namespace: Namespace):
         """
-        Snapshot filesystem in a pool.
+        Snapshot filesystem in a pool, every filesystem in the pool whose
+        name matches a pattern, or a group of filesystems together.
 
+        :raises StratisCliBatchError:
         :raises StratisCliEngineError:
+        :raises StratisCliFreezeError:
+        :raises StratisCliNameConflictError:
         :raises StratisCliNoChangeError:
+        :raises StratisCliResourceNotFoundError:
         """
-        from ._data import ObjectManager, Pool, filesystems, pools  # noqa: PLC0415
+        from ._data import (  # noqa: PLC0415
+            MOFilesystem,
+            ObjectManager,
+            Pool,
+            filesystems,
+            pools,
+        )
 
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
@@ -224,22 +668,90 @@ class LogicalActions:
             .require_unique_match(True)
             .search(managed_objects)
         )
+
+        def snapshot(origin_fs_object_path: str, snapshot_name: str):
+            ((changed, _), return_code, message) = Pool.Methods.SnapshotFilesystem(
+                get_object(pool_object_path),
+                {"origin": origin_fs_object_path, "snapshot_name": snapshot_name},
+            )
+
+            if return_code != StratisdErrors.OK:  # pragma: no cover
+                raise StratisCliEngineError(return_code, message)
+
+            if not changed:
+                raise StratisCliNoChangeError("snapshot", snapshot_name)
+
+        if namespace.match is not None or namespace.group is not None:
+            mofilesystems = {
+                str(mofs.Name()): (object_path, mofs)
+                for (object_path, mofs) in (
+                    (object_path, MOFilesystem(info))
+                    for (object_path, info) in filesystems(
+                        props={"Pool": pool_object_path}
+                    ).search(managed_objects)
+                )
+            }
+
+            if namespace.match is not None:
+                origins = sorted(
+                    name for name in mofilesystems if namespace.match.fullmatch(name)
+                )
+                if origins == []:
+                    raise StratisCliResourceNotFoundError(
+                        "snapshot", f"filesystems matching {namespace.match.pattern}"
+                    )
+            else:
+                origins = namespace.group
+                missing = [name for name in origins if name not in mofilesystems]
+                if missing != []:
+                    raise StratisCliResourceNotFoundError(
+                        "snapshot", f"filesystems {', '.join(missing)}"
+                    )
+
+            names = snapshot_names(
+                origins, namespace.pool_name, namespace.name_template, datetime.now()
+            )
+
+            for snapshot_name in names.values():
+                if snapshot_name in mofilesystems:
+                    raise StratisCliNameConflictError("filesystem", snapshot_name)
+
+            tasks: List[Task] = [
+                (
+                    (origin_name, snapshot_name),
+                    partial(snapshot, mofilesystems[origin_name][0], snapshot_name),
+                )
+                for (origin_name, snapshot_name) in names.items()
+            ]
+
+            if namespace.group is None:
+                run_batch(
+                    "snapshot",
+                    ["Origin", "Snapshot"],
+                    tasks,
+                    jobs=namespace.jobs,
+                    as_json=namespace.as_json,
+                )
+                return
+
+            snapshot_group(
+                tasks,
+                list(
+                    mount_points(
+                        [str(mofilesystems[name][1].Devnode()) for name in origins]
+                    ).values()
+                ),
+                as_json=namespace.as_json,
+            )
+            return
+
         (origin_fs_object_path, _) = next(
             filesystems(props={"Name": namespace.origin_name, "Pool": pool_object_path})
             .require_unique_match(True)
             .search(managed_objects)
         )
 
-        ((changed, _), return_code, message) = Pool.Methods.SnapshotFilesystem(
-            get_object(pool_object_path),
-            {"origin": origin_fs_object_path, "snapshot_name": namespace.snapshot_name},
-        )
-
-        if return_code != StratisdErrors.OK:  # pragma: no cover
-            raise StratisCliEngineError(return_code, message)
-
-        if not changed:
-            raise StratisCliNoChangeError("snapshot", namespace.snapshot_name)
+        snapshot(origin_fs_object_path, namespace.snapshot_name)
 
     @staticmethod
     def rename_fs(namespace: Namespace):
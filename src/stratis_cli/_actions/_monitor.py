@@ -0,0 +1,189 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Stream of events describing changes to pools, filesystems, and blockdevs.
+"""
+
+import json
+import sys
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+from ._constants import BLOCKDEV_INTERFACE, FILESYSTEM_INTERFACE, POOL_INTERFACE
+from ._watch import ManagedObjectsWatcher, SignalLoop
+
+_OBJECT_TYPES = {
+    POOL_INTERFACE: "pool",
+    FILESYSTEM_INTERFACE: "filesystem",
+    BLOCKDEV_INTERFACE: "blockdev",
+}
+
+
+class EventWatcher(ManagedObjectsWatcher):
+    """
+    Describe each change to a pool, filesystem, or blockdev as an event.
+    """
+
+    def __init__(
+        self,
+        bus: Any,
+        timeout: int,
+        emit: Callable[[Dict[str, Any]], None],
+        on_error: Callable[[BaseException], None],
+    ):
+        """
+        Initializer.
+
+        :param bus: a bus connection with a main loop
+        :param int timeout: the D-Bus timeout in seconds
+        :param emit: called with each event
+        :param on_error: called if stratisd can not be queried
+        """
+        super().__init__(bus, timeout, lambda: None, on_error)
+        self._emit = emit
+
+    def _names(self, object_path: str, interface: str) -> Tuple[Any, Any]:
+        """
+        Look up the pool name and the filesystem name of an object.
+
+        :returns: the names, None if not known or not applicable
+        """
+        props = self.managed_objects.get(object_path, {}).get(interface, {})
+        if interface == POOL_INTERFACE:
+            return (props.get("Name"), None)
+
+        pool_object_path = props.get("Pool")
+        pool_props = (
+            {}
+            if pool_object_path is None
+            else self.managed_objects.get(pool_object_path, {}).get(POOL_INTERFACE, {})
+        )
+        return (
+            pool_props.get("Name"),
+            props.get("Name") if interface == FILESYSTEM_INTERFACE else None,
+        )
+
+    def _event(  # noqa: PLR0913
+        self,
+        event: str,
+        object_path: str,
+        interface: str,
+        names: Tuple[Any, Any],
+        *,
+        properties: Mapping[str, Any] | None = None,
+        invalidated: List[str] | None = None,
+    ):
+        """
+        Emit an event.
+
+        :param str event: "added", "removed", or "changed"
+        :param names: the pool name and the filesystem name of the object
+        :param properties: the new values of the properties
+        :param invalidated: the names of the properties whose values changed
+                            but were not sent
+        """
+        (pool_name, filesystem_name) = names
+        self._emit(
+            {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "event": event,
+                "object_path": object_path,
+                "object_type": _OBJECT_TYPES[interface],
+                "pool_name": pool_name,
+                "filesystem_name": filesystem_name,
+                "properties": {} if properties is None else dict(properties),
+                "invalidated": (
+                    [] if invalidated is None else [str(name) for name in invalidated]
+                ),
+            }
+        )
+
+    def interfaces_added(self, object_path: str, interfaces: Mapping[str, Any]):
+        super().interfaces_added(object_path, interfaces)
+
+        object_path = str(object_path)
+        for interface, props in interfaces.items():
+            if interface in _OBJECT_TYPES:
+                self._event(
+                    "added",
+                    object_path,
+                    interface,
+                    self._names(object_path, interface),
+                    properties=props,
+                )
+
+    def interfaces_removed(self, object_path: str, interfaces: List[str]):
+        object_path = str(object_path)
+        # The names can only be looked up before the object is removed.
+        removed = [
+            (interface, self._names(object_path, interface))
+            for interface in interfaces
+            if interface in _OBJECT_TYPES
+        ]
+
+        super().interfaces_removed(object_path, interfaces)
+
+        for interface, names in removed:
+            self._event("removed", object_path, interface, names)
+
+    def properties_changed(
+        self,
+        interface: str,
+        changed: Mapping[str, Any],
+        invalidated: List[str],
+        *,
+        object_path: str,
+    ):
+        super().properties_changed(
+            interface, changed, invalidated, object_path=object_path
+        )
+
+        if interface in _OBJECT_TYPES:
+            object_path = str(object_path)
+            self._event(
+                "changed",
+                object_path,
+                interface,
+                self._names(object_path, interface),
+                properties=changed,
+                invalidated=invalidated,
+            )
+
+
+def monitor(stream: Any = sys.stdout):
+    """
+    Write one line of JSON for each event until interrupted.
+
+    The values of invalidated properties are obtained from stratisd and
+    written as a subsequent event.
+
+    :param stream: the stream to write to
+    :raises StratisCliSignalsUnavailableError:
+    """
+    from ._data import timeout  # noqa: PLC0415
+
+    signal_loop = SignalLoop()
+
+    def emit(event: Dict[str, Any]):
+        # Exceptions raised by signal handlers are only logged by
+        # dbus-python, so stop the loop instead.
+        try:
+            stream.write(json.dumps(event, separators=(",", ":")) + "\n")
+            stream.flush()
+        except Exception as err:  # noqa: BLE001
+            signal_loop.fail(err)
+
+    EventWatcher(signal_loop.bus, timeout, emit, signal_loop.fail).start()
+
+    signal_loop.run()
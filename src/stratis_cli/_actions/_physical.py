@@ -16,13 +16,14 @@ Miscellaneous physical actions.
 """
 
 from argparse import Namespace
-from typing import Any
+from typing import Any, Callable, Iterable, Mapping
 
 from justbytes import Range
 
 from dbus_client_gen import DbusClientMissingPropertyError
 
 from .._stratisd_constants import BlockDevTiers
+from ._cache import listing_managed_objects
 from ._connection import get_object
 from ._constants import TOP_OBJECT
 from ._formatting import (
@@ -31,6 +32,151 @@ from ._formatting import (
     get_uuid_formatter,
     print_table,
 )
+from ._watch import watch_table
+
+BLOCKDEV_HEADINGS = ["Pool Name", "Device Node", "Physical Size", "Tier", "UUID"]
+BLOCKDEV_ALIGNMENT = ["<", "<", ">", ">", "<"]
+
+
+def blockdev_sort_key(row: tuple[str, ...]) -> tuple[str, str]:
+    """
+    Key by which the rows of the blockdev table are sorted.
+    """
+    return (row[0], row[1])
+
+
+def blockdev_table_rows(
+    format_uuid: Callable,
+    managed_objects: Mapping[str, Any],
+    object_paths: Iterable[str] | None = None,
+    *,
+    pool_name: str | None = None,
+) -> dict[str, tuple[str, ...]]:
+    """
+    Calculate the rows of the blockdev table.
+
+    :param managed_objects: the GetManagedObjects result
+    :param object_paths: the blockdevs for which to calculate rows, None for all
+    :param pool_name: the pool whose blockdevs are listed, None for all
+    :returns: the rows, keyed by blockdev object path
+    """
+    from ._data import MODev, MOPool, devs, pools  # noqa: PLC0415
+
+    selected = None if object_paths is None else frozenset(object_paths)
+
+    modevs = [
+        (objpath, MODev(info))
+        for objpath, info in devs(
+            props=(
+                None
+                if pool_name is None
+                else {
+                    "Pool": next(
+                        pools(props={"Name": pool_name})
+                        .require_unique_match(True)
+                        .search(managed_objects)
+                    )[0]
+                }
+            )
+        ).search(managed_objects)
+        if selected is None or objpath in selected
+    ]
+
+    path_to_name = dict(
+        (path, MOPool(info).Name())
+        for path, info in pools(
+            props=None if pool_name is None else {"Name": pool_name}
+        ).search(managed_objects)
+    )
+
+    def pool_name_str(modev: Any) -> str:
+        """
+        Return the name of the pool this device belongs to.
+        """
+        try:
+            return path_to_name.get(modev.Pool(), TABLE_UNKNOWN_STRING)
+        except DbusClientMissingPropertyError:  # pragma: no cover
+            return TABLE_UNKNOWN_STRING
+
+    def paths_str(modev: Any) -> str:
+        """
+        Return <physical_path> (<metadata_path>) if they are different,
+        otherwise, just <metadata_path>.
+
+        physical_path D-Bus Property key is PhysicalPath
+        metadata_path D-Bus Property key is Devnode
+
+        :param modev: object containing D-Bus properties
+        :returns: the string to print
+        :rtype: str
+        """
+        try:
+            metadata_path = modev.Devnode()
+        except DbusClientMissingPropertyError:
+            metadata_path = TABLE_UNKNOWN_STRING
+
+        try:
+            physical_path = modev.PhysicalPath()
+        except DbusClientMissingPropertyError:
+            physical_path = TABLE_UNKNOWN_STRING
+
+        return (
+            metadata_path
+            if metadata_path == physical_path
+            else f"{physical_path} ({metadata_path})"
+        )
+
+    def size_str(modev: Any) -> str:
+        """
+        Return in-use size (observed size) if they are different, otherwise
+        just in-use size.
+        """
+        try:
+            in_use_size = Range(modev.TotalPhysicalSize())
+        except DbusClientMissingPropertyError:
+            in_use_size = TABLE_UNKNOWN_STRING
+
+        try:
+            observed_size = get_property(modev.NewPhysicalSize(), Range, in_use_size)
+        except DbusClientMissingPropertyError:
+            observed_size = TABLE_UNKNOWN_STRING
+
+        return (
+            f"{in_use_size}"
+            if in_use_size == observed_size
+            else f"{in_use_size} ({observed_size})"
+        )
+
+    def tier_str(modev: Any) -> str:
+        """
+        String representation of a tier.
+        """
+        try:
+            return str(BlockDevTiers(modev.Tier()))
+        except ValueError:  # pragma: no cover
+            return TABLE_UNKNOWN_STRING
+        except DbusClientMissingPropertyError:
+            return TABLE_UNKNOWN_STRING
+
+    def uuid_str(modev: Any) -> str:
+        """
+        String representation of UUID.
+        """
+        try:
+            return format_uuid(modev.Uuid())
+        except DbusClientMissingPropertyError:
+            return TABLE_UNKNOWN_STRING
+
+    return {
+        objpath: (
+            pool_name_str(modev),
+            paths_str(modev),
+            size_str(modev),
+            tier_str(modev),
+            uuid_str(modev),
+        )
+        for (objpath, modev) in modevs
+    }
 
 
 class PhysicalActions:
@@ -44,133 +190,33 @@ class PhysicalActions:
         List devices. If a pool is specified in the namespace, list devices
         for that pool. Otherwise, list all devices for all pools.
         """
-        from ._data import MODev, MOPool, ObjectManager, devs, pools  # noqa: PLC0415
+        from ._data import ObjectManager  # noqa: PLC0415
 
         # This method is invoked as the default for "stratis blockdev";
         # the namespace may not have a pool_name field.
         pool_name = getattr(namespace, "pool_name", None)
-
-        proxy = get_object(TOP_OBJECT)
-        managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-
-        modevs = [
-            MODev(info)
-            for objpath, info in devs(
-                props=(
-                    None
-                    if pool_name is None
-                    else {
-                        "Pool": next(
-                            pools(props={"Name": pool_name})
-                            .require_unique_match(True)
-                            .search(managed_objects)
-                        )[0]
-                    }
-                )
-            ).search(managed_objects)
-        ]
-
-        path_to_name = dict(
-            (path, MOPool(info).Name())
-            for path, info in pools(
-                props=None if pool_name is None else {"Name": pool_name}
-            ).search(managed_objects)
-        )
-
-        def pool_name_str(modev: Any) -> str:
-            """
-            Return the name of the pool this device belongs to.
-            """
-            try:
-                return path_to_name.get(modev.Pool(), TABLE_UNKNOWN_STRING)
-            except DbusClientMissingPropertyError:  # pragma: no cover
-                return TABLE_UNKNOWN_STRING
-
-        def paths_str(modev: Any) -> str:
-            """
-            Return <physical_path> (<metadata_path>) if they are different,
-            otherwise, just <metadata_path>.
-
-            physical_path D-Bus Property key is PhysicalPath
-            metadata_path D-Bus Property key is Devnode
-
-            :param modev: object containing D-Bus properties
-            :returns: the string to print
-            :rtype: str
-            """
-            try:
-                metadata_path = modev.Devnode()
-            except DbusClientMissingPropertyError:
-                metadata_path = TABLE_UNKNOWN_STRING
-
-            try:
-                physical_path = modev.PhysicalPath()
-            except DbusClientMissingPropertyError:
-                physical_path = TABLE_UNKNOWN_STRING
-
-            return (
-                metadata_path
-                if metadata_path == physical_path
-                else f"{physical_path} ({metadata_path})"
+        uuid_formatter = get_uuid_formatter(namespace.unhyphenated_uuids)
+
+        if getattr(namespace, "watch", False):
+            watch_table(
+                BLOCKDEV_HEADINGS,
+                BLOCKDEV_ALIGNMENT,
+                blockdev_sort_key,
+                lambda managed_objects, object_paths: blockdev_table_rows(
+                    uuid_formatter, managed_objects, object_paths, pool_name=pool_name
+                ),
+                throttle=namespace.throttle,
             )
+            return
 
-        def size_str(modev: Any) -> str:
-            """
-            Return in-use size (observed size) if they are different, otherwise
-            just in-use size.
-            """
-            try:
-                in_use_size = Range(modev.TotalPhysicalSize())
-            except DbusClientMissingPropertyError:
-                in_use_size = TABLE_UNKNOWN_STRING
-
-            try:
-                observed_size = get_property(
-                    modev.NewPhysicalSize(), Range, in_use_size
-                )
-            except DbusClientMissingPropertyError:
-                observed_size = TABLE_UNKNOWN_STRING
-
-            return (
-                f"{in_use_size}"
-                if in_use_size == observed_size
-                else f"{in_use_size} ({observed_size})"
-            )
+        managed_objects = listing_managed_objects(namespace)
+        if managed_objects is None:
+            proxy = get_object(TOP_OBJECT)
+            managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
 
-        def tier_str(modev: Any) -> str:
-            """
-            String representation of a tier.
-            """
-            try:
-                return str(BlockDevTiers(modev.Tier()))
-            except ValueError:  # pragma: no cover
-                return TABLE_UNKNOWN_STRING
-            except DbusClientMissingPropertyError:
-                return TABLE_UNKNOWN_STRING
-
-        format_uuid = get_uuid_formatter(namespace.unhyphenated_uuids)
-
-        def uuid_str(modev: Any) -> str:
-            """
-            String representation of UUID.
-            """
-            try:
-                return format_uuid(modev.Uuid())
-            except DbusClientMissingPropertyError:
-                return TABLE_UNKNOWN_STRING
-
-        tables = [
-            [
-                pool_name_str(modev),
-                paths_str(modev),
-                size_str(modev),
-                tier_str(modev),
-                uuid_str(modev),
-            ]
-            for modev in modevs
-        ]
+        rows = blockdev_table_rows(uuid_formatter, managed_objects, pool_name=pool_name)
         print_table(
-            ["Pool Name", "Device Node", "Physical Size", "Tier", "UUID"],
-            sorted(tables, key=lambda entry: (entry[0], entry[1])),
-            ["<", "<", ">", ">", "<"],
+            BLOCKDEV_HEADINGS,
+            sorted(rows.values(), key=blockdev_sort_key),
+            BLOCKDEV_ALIGNMENT,
         )
@@ -0,0 +1,228 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Timeouts and retries of D-Bus calls, and the deadline of a command.
+"""
+
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+from dbus.exceptions import DBusException
+
+from .._errors import StratisCliDeadlineError
+from ._constants import MANAGER_INTERFACE, POOL_INTERFACE, REPORT_INTERFACE
+from ._utils import get_errors
+
+# Errors which show that a call was not delivered, because stratisd is not
+# on the bus, e.g., because it is starting. Any call may be retried.
+SERVICE_ERRORS = (
+    "org.freedesktop.DBus.Error.ServiceUnknown",
+    "org.freedesktop.DBus.Error.NameHasNoOwner",
+)
+
+# Errors which show that no reply was received in time, although the call
+# may have been performed. Only a call which does not change anything may be
+# retried.
+NO_REPLY_ERRORS = (
+    "org.freedesktop.DBus.Error.NoReply",
+    "org.freedesktop.DBus.Error.Timeout",
+)
+
+TRANSIENT_ERRORS = SERVICE_ERRORS + NO_REPLY_ERRORS
+
+# The timeout, in seconds, which libdbus uses if the timeout is -1
+_LIBDBUS_DEFAULT_TIMEOUT = 25
+
+# The delay before the first retry, which is doubled for each retry up to
+# the maximum
+_FIRST_DELAY = 0.25
+_MAXIMUM_DELAY = 2.0
+
+# The deadline of the command, as a time of the monotonic clock, and the
+# time allowed, in seconds.
+_DEADLINE: "Tuple[float, float] | None" = None
+
+
+class CallPolicy:
+    """
+    The timeout and retries of a D-Bus method call or property access.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: "float | None" = None,
+        retries: int = 5,
+        retry_on: Sequence[str] = SERVICE_ERRORS,
+        initiates: bool = False,
+    ):
+        """
+        Initializer.
+
+        :param timeout: the timeout in seconds, None for the default timeout
+        :param int retries: the maximum number of times the call is retried
+        :param retry_on: the names of the D-Bus errors for which it is retried
+        :param bool initiates: whether no reply means that the operation has
+            been initiated, rather than that the deadline has passed
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_on = retry_on
+        self.initiates = initiates
+
+
+# Calls which only obtain information; these are retried for any transient
+# error.
+_READ = CallPolicy(retry_on=TRANSIENT_ERRORS)
+
+POLICIES: Dict[Tuple[str, str], CallPolicy] = {
+    ("org.freedesktop.DBus.ObjectManager", "GetManagedObjects"): _READ,
+    (REPORT_INTERFACE, "GetReport"): _READ,
+    (MANAGER_INTERFACE, "EngineStateReport"): _READ,
+    (MANAGER_INTERFACE, "ListKeys"): _READ,
+    (POOL_INTERFACE, "FilesystemMetadata"): _READ,
+    (POOL_INTERFACE, "Metadata"): _READ,
+    # Changing the encryption of a pool takes long enough that waiting for
+    # stratisd to finish is pointless; the CLI reports that the operation
+    # has been initiated.
+    (POOL_INTERFACE, "EncryptPool"): CallPolicy(timeout=10, initiates=True),
+    (POOL_INTERFACE, "DecryptPool"): CallPolicy(timeout=10, initiates=True),
+    (POOL_INTERFACE, "ReencryptPool"): CallPolicy(timeout=10, initiates=True),
+}
+
+
+def get_policy(interface: str, member: str, operation: str) -> CallPolicy:
+    """
+    Get the policy for a method call or property access.
+
+    :param str interface: the interface of the method or property
+    :param str member: the name of the method or property
+    :param str operation: "call", "get", or "set"
+    """
+    return POLICIES.get(
+        (interface, member), _READ if operation == "get" else CallPolicy()
+    )
+
+
+def set_deadline(seconds: "float | None"):
+    """
+    Set the time allowed for the D-Bus calls of the command, beginning now.
+
+    :param seconds: the time allowed, or None for no deadline
+    """
+    global _DEADLINE  # noqa: PLW0603
+    _DEADLINE = None if seconds is None else (time.monotonic() + seconds, seconds)
+
+
+def _remaining() -> "float | None":
+    """
+    Get the time remaining before the deadline, or None if there is none.
+    """
+    return None if _DEADLINE is None else _DEADLINE[0] - time.monotonic()
+
+
+def _deadline_error() -> StratisCliDeadlineError:
+    """
+    Get the error raised when the deadline has passed.
+    """
+    assert _DEADLINE is not None
+    return StratisCliDeadlineError("The command", _DEADLINE[1])
+
+
+def _error_name(err: BaseException) -> "str | None":
+    """
+    Get the name of the D-Bus error that caused an exception, if any.
+    """
+    return next(
+        (
+            error.get_dbus_name()
+            for error in get_errors(err)
+            if isinstance(error, DBusException)
+        ),
+        None,
+    )
+
+
+def with_policy(
+    interface: str,
+    member: str,
+    operation: str,
+    func: Callable[..., Any],
+    default_timeout: float,
+) -> Callable[..., Any]:
+    """
+    Make a generated method or property accessor use the timeout and
+    retries of its policy, and fail if the deadline has passed. Its
+    timeout is reduced so that the call does not continue past the
+    deadline. If a call that initiates an operation gets no reply, the
+    error is raised unchanged, so that the operation is reported as
+    initiated.
+
+    :param str interface: the interface of the method or property
+    :param str member: the name of the method or property
+    :param str operation: "call", "get", or "set"
+    :param func: the generated function
+    :param default_timeout: the timeout of the generated function
+    """
+    policy = get_policy(interface, member, operation)
+
+    @wraps(func)
+    def policy_func(*args: Any, **kwargs: Any) -> Any:
+        timeout = kwargs.pop(
+            "timeout", default_timeout if policy.timeout is None else policy.timeout
+        )
+        delay = _FIRST_DELAY
+        retries = policy.retries
+
+        while True:
+            remaining = _remaining()
+            if remaining is not None and remaining <= 0:
+                raise _deadline_error()
+
+            try:
+                return func(
+                    *args,
+                    timeout=(
+                        timeout
+                        if remaining is None
+                        else min(
+                            remaining,
+                            _LIBDBUS_DEFAULT_TIMEOUT if timeout < 0 else timeout,
+                        )
+                    ),
+                    **kwargs,
+                )
+            except Exception as err:
+                name = _error_name(err)
+                remaining = _remaining()
+                if (
+                    name in NO_REPLY_ERRORS
+                    and not policy.initiates
+                    and remaining is not None
+                    and remaining <= 0
+                ):
+                    raise _deadline_error() from err
+
+                if name is None or name not in policy.retry_on or retries == 0:
+                    raise
+
+                if remaining is not None and remaining <= delay:
+                    raise _deadline_error() from err
+
+            time.sleep(delay)
+            retries -= 1
+            delay = min(delay * 2, _MAXIMUM_DELAY)
+
+    return policy_func
@@ -15,12 +15,14 @@
 Pool actions.
 """
 
+import fnmatch
 import json
 import os
 from argparse import Namespace
 from collections import defaultdict
+from functools import partial
 from itertools import tee
-from typing import Dict, Generator, List, Sequence
+from typing import Callable, Dict, Generator, List, Sequence, Tuple
 from uuid import UUID
 
 from dbus import Dictionary
@@ -30,7 +32,7 @@ from justbytes import Range
 from dbus_python_client_gen import DPClientMarshallingError
 
 from .._alerts import PoolAlert
-from .._constants import IntegrityOption, IntegrityTagSpec, PoolId, UnlockMethod
+from .._constants import IdType, IntegrityOption, IntegrityTagSpec, PoolId, UnlockMethod
 from .._errors import (
     StratisCliEngineError,
     StratisCliIncoherenceError,
@@ -45,11 +47,13 @@ from .._errors import (
     StratisCliResourceNotFoundError,
 )
 from .._stratisd_constants import BlockDevTiers, MetadataVersion, StratisdErrors
+from ._batch import run_batch
+from ._cache import listing_managed_objects
 from ._connection import get_object
 from ._constants import TOP_OBJECT
 from ._formatting import get_property, get_uuid_formatter
-from ._list_pool import list_pools
-from ._utils import StoppedPool, fetch_stopped_pools_property, get_passphrase_fd
+from ._list_pool import list_pools, watch_pools
+from ._utils import StoppedPool, fetch_stopped_pools_property, get_passphrase_fds
 
 
 def _generate_pools_to_blockdevs(
@@ -254,111 +258,196 @@ class PoolActions:
     @staticmethod
     def stop_pool(namespace: Namespace):
         """
-        Stop a pool.
+        Stop a pool, or every pool, or the pools whose names match a pattern.
 
+        :raises StratisCliBatchError:
         :raises StratisCliIncoherenceError:
         :raises StratisCliEngineError:
+        :raises StratisCliResourceNotFoundError:
         """
-        from ._data import Manager  # noqa: PLC0415
+        from ._data import MOPool, Manager, ObjectManager, pools  # noqa: PLC0415
 
         proxy = get_object(TOP_OBJECT)
 
-        pool_id = PoolId.from_parser_namespace(namespace)
-        assert pool_id is not None
+        def stop(pool_id: PoolId):
+            ((stopped, _), return_code, message) = Manager.Methods.StopPool(
+                proxy, pool_id.dbus_args()
+            )
+
+            if return_code != StratisdErrors.OK:  # pragma: no cover
+                raise StratisCliEngineError(return_code, message)
+
+            if not stopped:
+                raise StratisCliNoChangeError("stop", pool_id)
+
+        if not namespace.all and namespace.match is None:
+            pool_id = PoolId.from_parser_namespace(namespace)
+            assert pool_id is not None
+            stop(pool_id)
+            return
 
-        ((stopped, _), return_code, message) = Manager.Methods.StopPool(
-            proxy, pool_id.dbus_args()
+        managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        selected = sorted(
+            (str(mopool.Name()), str(UUID(mopool.Uuid())))
+            for mopool in (
+                MOPool(info) for (_, info) in pools().search(managed_objects)
+            )
+            if namespace.all or fnmatch.fnmatchcase(str(mopool.Name()), namespace.match)
         )
 
-        if return_code != StratisdErrors.OK:  # pragma: no cover
-            raise StratisCliEngineError(return_code, message)
+        if selected == [] and namespace.match is not None:
+            raise StratisCliResourceNotFoundError(
+                "stop", f"pools matching {namespace.match}"
+            )
 
-        if not stopped:
-            raise StratisCliNoChangeError("stop", pool_id)
+        run_batch(
+            "stop",
+            ["Name", "UUID"],
+            [
+                ((name, uuid), partial(stop, PoolId(IdType.UUID, UUID(uuid))))
+                for (name, uuid) in selected
+            ],
+            jobs=namespace.jobs,
+            as_json=namespace.as_json,
+        )
 
     @staticmethod
     def start_pool(namespace: Namespace):
         """
-        Start a pool.
+        Start a pool, or every stopped pool, or the stopped pools whose names
+        match a pattern.
 
+        :raises StratisCliBatchError:
         :raises StratisCliIncoherenceError:
         :raises StratisCliEngineError:
+        :raises StratisCliResourceNotFoundError:
         """
         from ._data import Manager  # noqa: PLC0415
 
         proxy = get_object(TOP_OBJECT)
 
-        pool_id = PoolId.from_parser_namespace(namespace)
-        assert pool_id is not None
+        def unlock_method_for(pool_id: PoolId, get_stopped_pools: Callable):
+            if namespace.token_slot is not None:
+                return (True, (True, namespace.token_slot))
 
-        if namespace.token_slot is None:
             if namespace.unlock_method is None:
-                unlock_method = (
+                return (
                     namespace.capture_key or namespace.keyfile_path is not None,
                     (False, 0),
                 )
-            elif namespace.unlock_method is UnlockMethod.ANY:
-                unlock_method = (True, (False, 0))
-            else:
-                stopped_pools = fetch_stopped_pools_property(proxy)
-                selection_func = pool_id.stopped_pools_func()
-                stopped_pool = next(
-                    (
-                        (uuid, StoppedPool(info))
-                        for (uuid, info) in stopped_pools.items()
-                        if selection_func(uuid, info)
-                    ),
-                    None,
+
+            if namespace.unlock_method is UnlockMethod.ANY:
+                return (True, (False, 0))
+
+            selection_func = pool_id.stopped_pools_func()
+            stopped_pool = next(
+                (
+                    (uuid, StoppedPool(info))
+                    for (uuid, info) in get_stopped_pools().items()
+                    if selection_func(uuid, info)
+                ),
+                None,
+            )
+
+            if stopped_pool is None:
+                raise StratisCliResourceNotFoundError("start", pool_id)
+
+            (_, stopped_pool) = stopped_pool
+
+            if stopped_pool.metadata_version is MetadataVersion.V2:
+                raise StratisCliInvalidCommandLineOptionValue(
+                    f'"--unlock-method={namespace.unlock_method}" can not '
+                    "be used with metadata version "
+                    f"{stopped_pool.metadata_version} pools. Use "
+                    f'"--unlock-method=any" or specify a token slot using '
+                    '"--token-slot" instead.'
                 )
 
-                if stopped_pool is None:
-                    raise StratisCliResourceNotFoundError("start", pool_id)
+            return (
+                True,
+                (True, namespace.unlock_method.legacy_token_slot()),
+            )  # pragma: no cover
 
-                (_, stopped_pool) = stopped_pool
+        def key_fds() -> Callable[[], Tuple[int, int]] | None:
+            return (
+                get_passphrase_fds(keyfile_path=namespace.keyfile_path)
+                if namespace.capture_key or namespace.keyfile_path is not None
+                else None
+            )
 
-                if stopped_pool.metadata_version is MetadataVersion.V2:
-                    raise StratisCliInvalidCommandLineOptionValue(
-                        f'"--unlock-method={namespace.unlock_method}" can not '
-                        "be used with metadata version "
-                        f"{stopped_pool.metadata_version} pools. Use "
-                        f'"--unlock-method=any" or specify a token slot using '
-                        '"--token-slot" instead.'
-                    )
+        def start(
+            pool_id: PoolId,
+            unlock_method: Tuple[bool, Tuple[bool, int]],
+            get_key_fd: Callable[[], Tuple[int, int]] | None,
+        ):
+            if get_key_fd is None:
+                fds_to_close = frozenset()
+                key_fd_arg = (False, 0)
+            else:
+                (fd_argument, fd_to_close) = get_key_fd()
+                fds_to_close = frozenset([fd_argument, fd_to_close])
+                key_fd_arg = (True, fd_argument)
+
+            try:
+                ((started, _), return_code, message) = Manager.Methods.StartPool(
+                    proxy,
+                    pool_id.dbus_args()
+                    | {
+                        "unlock_method": unlock_method,
+                        "key_fd": key_fd_arg,
+                        "remove_cache": namespace.remove_cache,
+                    },
+                )
+            finally:
+                for fd in fds_to_close:
+                    os.close(fd)
+
+            if return_code != StratisdErrors.OK:
+                raise StratisCliEngineError(return_code, message)
 
-                unlock_method = (
-                    True,
-                    (True, namespace.unlock_method.legacy_token_slot()),
-                )  # pragma: no cover
-        else:
-            unlock_method = (True, (True, namespace.token_slot))
+            if not started:
+                raise StratisCliNoChangeError("start", pool_id)
 
-        if namespace.capture_key or namespace.keyfile_path is not None:
-            fd_argument, fd_to_close = get_passphrase_fd(
-                keyfile_path=namespace.keyfile_path, verify=False
+        if not namespace.all and namespace.match is None:
+            pool_id = PoolId.from_parser_namespace(namespace)
+            assert pool_id is not None
+            # The unlock method is checked before the passphrase is asked for.
+            unlock_method = unlock_method_for(
+                pool_id, partial(fetch_stopped_pools_property, proxy)
             )
-            key_fd_arg = (True, fd_argument)
-        else:
-            fd_to_close = None
-            key_fd_arg = (False, 0)
-
-        ((started, _), return_code, message) = Manager.Methods.StartPool(
-            proxy,
-            pool_id.dbus_args()
-            | {
-                "unlock_method": unlock_method,
-                "key_fd": key_fd_arg,
-                "remove_cache": namespace.remove_cache,
-            },
+            start(pool_id, unlock_method, key_fds())
+            return
+
+        stopped_pools = fetch_stopped_pools_property(proxy)
+        selected = sorted(
+            (str(info.get("name", "")), str(UUID(uuid)))
+            for (uuid, info) in stopped_pools.items()
+            if namespace.all
+            or fnmatch.fnmatchcase(str(info.get("name", "")), namespace.match)
         )
 
-        if fd_to_close is not None:
-            os.close(fd_to_close)
+        if selected == [] and namespace.match is not None:
+            raise StratisCliResourceNotFoundError(
+                "start", f"stopped pools matching {namespace.match}"
+            )
 
-        if return_code != StratisdErrors.OK:
-            raise StratisCliEngineError(return_code, message)
+        get_key_fd = key_fds()
 
-        if not started:
-            raise StratisCliNoChangeError("start", pool_id)
+        def start_selected(pool_id: PoolId):
+            start(
+                pool_id, unlock_method_for(pool_id, lambda: stopped_pools), get_key_fd
+            )
+
+        run_batch(
+            "start",
+            ["Name", "UUID"],
+            [
+                ((name, uuid), partial(start_selected, PoolId(IdType.UUID, UUID(uuid))))
+                for (name, uuid) in selected
+            ],
+            jobs=namespace.jobs,
+            as_json=namespace.as_json,
+        )
 
     @staticmethod
     def init_cache(namespace: Namespace):
@@ -440,9 +529,32 @@ class PoolActions:
             else None
         )
 
+        all_details = getattr(namespace, "all_details", False)
+
+        # Stopped pools are a property of the Manager object, which is not
+        # included in a managed_objects_report or in the cache.
+        if stopped and not (
+            namespace.from_snapshot is None and namespace.max_staleness is None
+        ):
+            raise StratisCliInvalidCommandLineOptionValue(
+                "Stopped pools can only be listed from stratisd; the "
+                "--stopped option can not be used with --from-snapshot or "
+                "--max-staleness."
+            )
+
         uuid_formatter = get_uuid_formatter(namespace.unhyphenated_uuids)
 
-        list_pools(uuid_formatter, stopped=stopped, selection=selection)
+        if getattr(namespace, "watch", False):
+            watch_pools(uuid_formatter, throttle=namespace.throttle)
+            return
+
+        list_pools(
+            uuid_formatter,
+            stopped=stopped,
+            selection=selection,
+            all_details=all_details,
+            managed_objects=listing_managed_objects(namespace),
+        )
 
     @staticmethod
     def destroy_pool(namespace: Namespace):
@@ -622,28 +734,34 @@ class PoolActions:
     @staticmethod
     def extend_data(namespace: Namespace):
         """
-        Extend the pool making use of the additional space offered by component
-        devices. Exit immediately if something unexpected happens.
+        Extend the pool, or every pool, making use of the additional space
+        offered by component devices. The devices are extended concurrently
+        if so specified, and the result for each device is printed.
 
+        :raises StratisCliBatchError:
         :raises StratisCliPartialChangeError:
-        :raises StratisCliEngineError:
-        :raises StratisCliIncoherenceError:
+        :raises StratisCliNoDeviceSizeChangeError:
+        :raises StratisCliResourceNotFoundError:
         """
-        from ._data import MODev, ObjectManager, Pool, devs, pools  # noqa: PLC0415
+        from ._data import MODev, MOPool, ObjectManager, Pool, devs, pools  # noqa: PLC0415
 
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        (pool_object_path, _) = next(
-            pools(props={"Name": namespace.pool_name})
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
+        pool_names = {
+            pool_object_path: str(MOPool(info).Name())
+            for (pool_object_path, info) in (
+                pools()
+                if namespace.all_pools
+                else pools(props={"Name": namespace.pool_name}).require_unique_match(
+                    True
+                )
+            ).search(managed_objects)
+        }
 
         modevs = (
-            MODev(info)
-            for objpath, info in devs(props={"Pool": pool_object_path}).search(
-                managed_objects
-            )
+            modev
+            for modev in (MODev(info) for (_, info) in devs().search(managed_objects))
+            if modev.Pool() in pool_names
         )
 
         def expandable(modev) -> bool:
@@ -739,9 +857,19 @@ class PoolActions:
         if expand_modevs == []:
             raise StratisCliNoDeviceSizeChangeError()
 
-        pool_proxy = get_object(pool_object_path)  # pragma: no cover
-        for modev in expand_modevs:  # pragma: no cover
-            expand(pool_proxy, modev)
+        run_batch(  # pragma: no cover
+            "extend-data",
+            ["Pool", "Device UUID"],
+            [
+                (
+                    (pool_names[modev.Pool()], str(UUID(modev.Uuid()))),
+                    partial(expand, get_object(modev.Pool()), modev),
+                )
+                for modev in expand_modevs
+            ],
+            jobs=namespace.jobs,
+            as_json=namespace.as_json,
+        )
 
     @staticmethod
     def set_fs_limit(namespace: Namespace):
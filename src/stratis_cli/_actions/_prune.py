@@ -0,0 +1,79 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Retention policy for snapshots.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Hashable, List, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def _keep_per_period(
+    created: List[datetime], count: int, period: Callable[[datetime], Hashable]
+) -> Set[int]:
+    """
+    Keep the newest snapshot of each of the count most recent periods in
+    which some snapshot was created.
+
+    :param created: the creation times, newest first
+    :param int count: the number of periods
+    :param period: the period in which a time falls
+    :returns: the indices of the snapshots to keep
+    """
+    periods: List[Any] = []
+    kept = set()
+    for index, time in enumerate(created):
+        if period(time) not in periods:
+            if len(periods) == count:
+                break
+            periods.append(period(time))
+            kept.add(index)
+    return kept
+
+
+def select_expired(
+    snapshots: List[Tuple[T, datetime]],
+    *,
+    keep_last: int,
+    keep_daily: int,
+    keep_weekly: int,
+) -> List[T]:
+    """
+    Select the snapshots of one origin that no rule keeps.
+
+    A snapshot is kept if it is one of the keep_last newest, or the newest
+    of its day in one of the keep_daily most recent days with a snapshot,
+    or the newest of its ISO week in one of the keep_weekly most recent
+    weeks with a snapshot.
+
+    :param snapshots: each snapshot and the local time it was created
+    :param int keep_last: the number of newest snapshots to keep
+    :param int keep_daily: the number of days to keep a snapshot for
+    :param int keep_weekly: the number of weeks to keep a snapshot for
+    :returns: the expired snapshots, newest first
+    """
+    ordered = sorted(snapshots, key=lambda snapshot: snapshot[1], reverse=True)
+    created = [time for (_, time) in ordered]
+
+    kept = (
+        set(range(min(keep_last, len(ordered))))
+        | _keep_per_period(created, keep_daily, lambda time: time.date())
+        | _keep_per_period(
+            created, keep_weekly, lambda time: tuple(time.isocalendar())[:2]
+        )
+    )
+
+    return [item for (index, (item, _)) in enumerate(ordered) if index not in kept]
@@ -0,0 +1,586 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Reencrypting many pools, never two pools that share a disk at once.
+
+The queue of pools is recorded in a file while it is worked through. If the
+command is interrupted, stratisd goes on reencrypting the pools that it has
+started on; running the command again waits for those pools and then
+reencrypts the pools that remain.
+"""
+
+import fcntl
+import fnmatch
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from dbus.exceptions import DBusException
+
+from .._errors import (
+    StratisCliDeadlineError,
+    StratisCliEngineError,
+    StratisCliIncoherenceError,
+    StratisCliReencryptQueueError,
+    StratisCliResourceNotFoundError,
+)
+from .._stratisd_constants import PoolActionAvailability, StratisdErrors
+from ._batch import Task, report_results
+from ._connection import get_object
+from ._constants import MAXIMUM_DBUS_TIMEOUT, POOL_INTERFACE, SERVICE, TOP_OBJECT
+from ._wait import format_elapsed
+from ._watch import ManagedObjectsWatcher, SignalLoop
+
+QUEUE_PATH = os.environ.get(
+    "STRATIS_REENCRYPT_QUEUE", "/run/stratis-cli/reencrypt-queue.json"
+)
+
+SYS_CLASS_BLOCK = "/sys/class/block"
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+def disks_of(devnode: str, sys_class_block: str = SYS_CLASS_BLOCK) -> FrozenSet[str]:
+    """
+    Get the names of the disks on which a block device is stored: the device
+    itself, the disk that contains it if it is a partition, or the disks of
+    the devices that it is built on if it is, e.g., a device-mapper device.
+
+    A device that is not found in sysfs is taken to be a disk.
+
+    :param str devnode: the device node or the name of the device
+    :param str sys_class_block: the sysfs directory of block devices
+    """
+    name = os.path.basename(os.path.realpath(devnode))
+    path = os.path.realpath(os.path.join(sys_class_block, name))
+    if not os.path.isdir(path):
+        return frozenset([name])
+
+    if os.path.exists(os.path.join(path, "partition")):
+        path = os.path.dirname(path)
+
+    try:
+        slaves = os.listdir(os.path.join(path, "slaves"))
+    except OSError:
+        slaves = []
+
+    if slaves == []:
+        return frozenset([os.path.basename(path)])
+
+    return frozenset().union(*(disks_of(slave, sys_class_block) for slave in slaves))
+
+
+def select_next(
+    entries: List[Dict[str, Any]],
+    disks: Mapping[str, FrozenSet[str]],
+    *,
+    max_inflight: int,
+) -> List[str]:
+    """
+    Select the pending pools to start reencrypting: in order, each pool that
+    shares no disk with a pool that is being reencrypted, while fewer than
+    max_inflight pools are being reencrypted.
+
+    :param entries: the entries of the queue, in order
+    :param disks: the disks of each pool, keyed by pool UUID
+    :param int max_inflight: the maximum number of pools reencrypted at once
+    :returns: the UUIDs of the selected pools
+    """
+    running = [entry["uuid"] for entry in entries if entry["state"] == RUNNING]
+    busy = set().union(*(disks[uuid] for uuid in running))
+
+    selected: List[str] = []
+    for entry in entries:
+        if len(running) + len(selected) >= max_inflight:
+            break
+        if entry["state"] == PENDING and busy.isdisjoint(disks[entry["uuid"]]):
+            selected.append(entry["uuid"])
+            busy.update(disks[entry["uuid"]])
+
+    return selected
+
+
+class ReencryptQueue:
+    """
+    The queue of pools to reencrypt, as recorded in the queue file.
+
+    The queue file is locked while the queue is in use, so that only one
+    command works through it. It is removed once every pool has either been
+    reencrypted or failed.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializer.
+
+        :param str path: the path of the queue file
+        """
+        self.path = path
+        self.entries: List[Dict[str, Any]] = []
+        self._lock_fd: Optional[int] = None
+
+    def __enter__(self) -> "ReencryptQueue":
+        """
+        Lock the queue file and read the queue.
+
+        :raises StratisCliReencryptQueueError:
+        """
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._lock_fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError as err:
+            self.__exit__()
+            raise StratisCliReencryptQueueError(
+                self.path, "another command is working through the queue"
+            ) from err
+        except OSError as err:
+            self.__exit__()
+            raise StratisCliReencryptQueueError(self.path, err) from err
+
+        try:
+            with open(self.path, encoding="utf-8") as queue_file:
+                self.entries = json.load(queue_file)
+        except FileNotFoundError:
+            self.entries = []
+        except (OSError, ValueError) as err:
+            self.__exit__()
+            raise StratisCliReencryptQueueError(self.path, err) from err
+
+        return self
+
+    def __exit__(self, *_exc_info):
+        """
+        Unlock the queue file.
+        """
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def add(self, pools: List[Tuple[str, str]]):
+        """
+        Add the pools that are not already in the queue to it.
+
+        :param pools: the name and UUID of each pool
+        """
+        queued = frozenset(entry["uuid"] for entry in self.entries)
+        self.entries.extend(
+            {
+                "uuid": uuid,
+                "name": name,
+                "state": PENDING,
+                "previous": None,
+                "started": None,
+                "owner": None,
+                "message": None,
+            }
+            for (name, uuid) in pools
+            if uuid not in queued
+        )
+
+    def finished(self) -> bool:
+        """
+        Whether every pool has either been reencrypted or failed.
+        """
+        return all(entry["state"] in (COMPLETED, FAILED) for entry in self.entries)
+
+    def save(self):
+        """
+        Record the queue, replacing the queue file atomically, or remove the
+        queue file if the queue is finished.
+
+        :raises StratisCliReencryptQueueError:
+        """
+        try:
+            if self.finished():
+                if os.path.exists(self.path):
+                    os.unlink(self.path)
+                return
+
+            (fd, temp_path) = tempfile.mkstemp(
+                dir=os.path.dirname(self.path), prefix=".", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as queue_file:
+                    json.dump(self.entries, queue_file)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as err:
+            raise StratisCliReencryptQueueError(self.path, err) from err
+
+
+def _timestamp(mopool: Any) -> Optional[str]:
+    """
+    Get the time at which a pool was last reencrypted, or None if never.
+    """
+    (valid, timestamp) = mopool.LastReencryptedTimestamp()
+    return str(timestamp) if valid else None
+
+
+class Reencryption:
+    """
+    Work through the queue of pools to reencrypt.
+
+    A pool is reencrypted when the method returns successfully or when the
+    pool's LastReencryptedTimestamp property changes. The latter is
+    necessary if the bus gives up waiting for the method to return, or if
+    the reencryption was started by an earlier command.
+
+    The reencryption of a pool fails if the pool is no longer encrypted or
+    fully operational, or if stratisd has been restarted since it was
+    started, since then it will not complete.
+    """
+
+    def __init__(
+        self,
+        signal_loop: SignalLoop,
+        queue: ReencryptQueue,
+        *,
+        max_inflight: int,
+        stream: Any = sys.stderr,
+    ):
+        """
+        Initializer.
+
+        :param signal_loop: the loop on which signals and replies are received
+        :param queue: the queue of pools to reencrypt
+        :param int max_inflight: the maximum number of pools reencrypted at once
+        :param stream: the stream to which progress is written
+        """
+        from ._data import timeout  # noqa: PLC0415
+
+        self._signal_loop = signal_loop
+        self._queue = queue
+        self._max_inflight = max_inflight
+        self._stream = stream
+        self._owner: Optional[str] = None
+        self._disks: Dict[str, FrozenSet[str]] = {}
+        self.watcher = ManagedObjectsWatcher(
+            signal_loop.bus, timeout, self.on_change, signal_loop.fail
+        )
+
+    def start(self):
+        """
+        Subscribe to the signals, find out stratisd's connection to the bus,
+        and request the pools.
+        """
+        bus = self._signal_loop.bus
+        bus.add_signal_receiver(
+            self.name_owner_changed,
+            signal_name="NameOwnerChanged",
+            dbus_interface="org.freedesktop.DBus",
+            arg0=SERVICE,
+        )
+        self._owner = str(
+            bus.get_name_owner(SERVICE)  # pyright: ignore [reportAttributeAccessIssue]
+        )
+        self.watcher.start()
+
+    def _entry(self, uuid: str) -> Dict[str, Any]:
+        return next(entry for entry in self._queue.entries if entry["uuid"] == uuid)
+
+    def note(self, entry: Dict[str, Any], message: str):
+        """
+        Write a message about the reencryption of a pool.
+        """
+        self._stream.write(f"Reencrypting pool {entry['name']}: {message}\n")
+        self._stream.flush()
+
+    def _finish(self, entry: Dict[str, Any], message: Optional[str] = None):
+        """
+        Record that the reencryption of a pool has completed, or, if there is
+        a message, that it has failed.
+        """
+        elapsed = (
+            ""
+            if entry["started"] is None
+            else f" after {format_elapsed(time.time() - entry['started'])}"
+        )
+        if message is None:
+            entry["state"] = COMPLETED
+            self.note(entry, f"completed{elapsed}")
+        else:
+            entry["state"] = FAILED
+            entry["message"] = message
+            self.note(entry, f"failed{elapsed}: {message}")
+
+    def _pools(self) -> Dict[str, Tuple[str, Any]]:
+        """
+        Get the object path and the properties of each pool, by UUID.
+        """
+        from ._data import MOPool, pools  # noqa: PLC0415
+
+        return {
+            str(MOPool(info).Uuid()): (pool_object_path, MOPool(info))
+            for (pool_object_path, info) in pools().search(self.watcher.managed_objects)
+        }
+
+    def _disks_of_pool(self, uuid: str, pool_object_path: str) -> FrozenSet[str]:
+        """
+        Get the disks on which the block devices of a pool are stored. They
+        are found only once for each pool.
+        """
+        from ._data import MODev, devs  # noqa: PLC0415
+
+        if uuid not in self._disks:
+            self._disks[uuid] = frozenset().union(
+                *(
+                    disks_of(str(MODev(info).PhysicalPath()))
+                    for (_, info) in devs(props={"Pool": pool_object_path}).search(
+                        self.watcher.managed_objects
+                    )
+                )
+            )
+        return self._disks[uuid]
+
+    def _abandoned(self, entry: Dict[str, Any], mopool: Any) -> Optional[str]:
+        """
+        Get why the reencryption of a pool will not complete, or None if it
+        may yet.
+        """
+        if entry["owner"] != self._owner:
+            return "stratisd was restarted during the reencryption"
+
+        if not mopool.Encrypted():
+            return "The pool is no longer encrypted"
+
+        availability = PoolActionAvailability[str(mopool.AvailableActions())]
+        if availability is not PoolActionAvailability.fully_operational:
+            return f"The available actions of the pool are now {availability.name}"
+
+        return None
+
+    def _start(self, entry: Dict[str, Any], pool_object_path: str, mopool: Any):
+        """
+        Start reencrypting a pool.
+        """
+        entry["state"] = RUNNING
+        entry["previous"] = _timestamp(mopool)
+        entry["started"] = time.time()
+        entry["owner"] = self._owner
+        self.note(entry, "started")
+
+        uuid = entry["uuid"]
+        self._signal_loop.bus.get_object(
+            SERVICE, pool_object_path, introspect=False
+        ).get_dbus_method("ReencryptPool", dbus_interface=POOL_INTERFACE)(
+            signature="",
+            timeout=MAXIMUM_DBUS_TIMEOUT,
+            reply_handler=lambda *result: self.on_reply(uuid, *result),
+            error_handler=lambda error: self.on_error(uuid, error),
+        )
+
+    def _advance(self):
+        """
+        Record the pools whose reencryption has completed, start reencrypting
+        the pools that may be, record the queue, and stop once it is finished.
+        """
+        current = self._pools()
+
+        for entry in self._queue.entries:
+            if entry["state"] not in (PENDING, RUNNING):
+                continue
+            if entry["uuid"] not in current:
+                self._finish(entry, "The pool was removed")
+                continue
+            if entry["state"] == PENDING:
+                continue
+
+            mopool = current[entry["uuid"]][1]
+            if entry["previous"] != _timestamp(mopool):
+                self._finish(entry)
+            else:
+                reason = self._abandoned(entry, mopool)
+                if reason is not None:
+                    self._finish(entry, reason)
+
+        disks = {
+            entry["uuid"]: self._disks_of_pool(entry["uuid"], current[entry["uuid"]][0])
+            for entry in self._queue.entries
+            if entry["state"] in (PENDING, RUNNING)
+        }
+        for uuid in select_next(
+            self._queue.entries, disks, max_inflight=self._max_inflight
+        ):
+            self._start(self._entry(uuid), *current[uuid])
+
+        try:
+            self._queue.save()
+        except StratisCliReencryptQueueError as err:
+            self._signal_loop.fail(err)
+            return
+
+        if self._queue.finished():
+            self._signal_loop.quit()
+
+    def name_owner_changed(self, _name: str, _old_owner: str, new_owner: str):
+        """
+        Handle a change of stratisd's connection to the bus.
+
+        The reencryptions that are in progress are abandoned when stratisd
+        stops. The pools that remain are left in the queue, since the pools
+        that the restarted stratisd has are not yet known.
+        """
+        self._owner = str(new_owner) or None
+        for entry in self._queue.entries:
+            if entry["state"] == RUNNING:
+                self._finish(entry, "stratisd was restarted during the reencryption")
+
+        try:
+            self._queue.save()
+        except StratisCliReencryptQueueError as err:
+            self._signal_loop.fail(err)
+            return
+
+        if self._queue.finished():
+            self._signal_loop.quit()
+        else:
+            self._signal_loop.fail(
+                StratisCliIncoherenceError(
+                    "stratisd was restarted while pools were being reencrypted; "
+                    "run the command again to reencrypt the pools that remain"
+                )
+            )
+
+    def on_change(self):
+        """
+        Check the pools when they change.
+        """
+        if self.watcher.received:
+            self._advance()
+
+    def on_reply(self, uuid: str, changed: bool, return_code: int, message: str):
+        """
+        Handle the result of the method for a pool.
+        """
+        entry = self._entry(uuid)
+        if entry["state"] != RUNNING:
+            return
+
+        if return_code != StratisdErrors.OK:
+            self._finish(entry, str(StratisCliEngineError(return_code, message)))
+        elif not changed:
+            self._finish(
+                entry, "stratisd reports that it did not perform the operation"
+            )
+        else:
+            self._finish(entry)
+        self._advance()
+
+    def on_error(self, uuid: str, error: BaseException):
+        """
+        Handle an error result of the method for a pool.
+
+        If the bus gave up waiting for the result, the reencryption is
+        followed by means of the pool's properties only.
+        """
+        entry = self._entry(uuid)
+        if entry["state"] != RUNNING:
+            return
+
+        if (
+            isinstance(error, DBusException)
+            and error.get_dbus_name() == "org.freedesktop.DBus.Error.NoReply"
+        ):
+            self.note(entry, "waiting for the pool's properties to change")
+            return
+
+        self._finish(entry, str(error))
+        self._advance()
+
+
+def reencrypt_pools(
+    match: Optional[str], *, max_inflight: int, deadline: Optional[float], as_json: bool
+):
+    """
+    Reencrypt every encrypted pool, or, if match is not None, the encrypted
+    pools whose names match it, together with the pools that remain in the
+    queue from an earlier command, and print the result for each.
+
+    :param match: a glob pattern, or None for every encrypted pool
+    :param int max_inflight: the maximum number of pools reencrypted at once
+    :param deadline: the time allowed in seconds, or None for no limit
+    :param bool as_json: whether to print the results as JSON
+    :raises StratisCliBatchError:
+    :raises StratisCliDeadlineError:
+    :raises StratisCliReencryptQueueError:
+    :raises StratisCliResourceNotFoundError:
+    :raises StratisCliSignalsUnavailableError:
+    """
+    from ._data import MOPool, ObjectManager, pools  # noqa: PLC0415
+
+    managed_objects = ObjectManager.Methods.GetManagedObjects(
+        get_object(TOP_OBJECT), {}
+    )
+    selected = sorted(
+        (str(MOPool(info).Name()), str(MOPool(info).Uuid()))
+        for (_, info) in pools(props={"Encrypted": True}).search(managed_objects)
+        if match is None or fnmatch.fnmatchcase(str(MOPool(info).Name()), match)
+    )
+
+    if selected == [] and match is not None:
+        raise StratisCliResourceNotFoundError(
+            "reencrypt", f"encrypted pools matching {match}"
+        )
+
+    with ReencryptQueue(QUEUE_PATH) as queue:
+        queue.add(selected)
+
+        if not queue.finished():
+            signal_loop = SignalLoop()
+            reencryption = Reencryption(signal_loop, queue, max_inflight=max_inflight)
+
+            for entry in queue.entries:
+                if entry["state"] == RUNNING:
+                    reencryption.note(entry, "started by an earlier command")
+
+            # Subscribe to the signals before any reencryption is started.
+            reencryption.start()
+
+            def expire() -> bool:
+                signal_loop.fail(
+                    StratisCliDeadlineError("Reencrypting the pools", deadline)
+                )
+                return False
+
+            if deadline is not None:
+                signal_loop.call_later(deadline, expire)
+
+            try:
+                signal_loop.run(propagate_interrupt=True)
+            except KeyboardInterrupt:
+                sys.stderr.write(
+                    "Interrupted; stratisd goes on reencrypting the pools that "
+                    "it has started on. Run the command again to wait for them "
+                    "and to reencrypt the pools that remain.\n"
+                )
+                raise
+
+    # The pools have already been reencrypted; the tasks only identify them.
+    tasks: List[Task] = [((entry["name"],), lambda: None) for entry in queue.entries]
+    report_results(
+        "reencrypt",
+        ["Pool"],
+        tasks,
+        [entry["message"] for entry in queue.entries],
+        as_json=as_json,
+    )
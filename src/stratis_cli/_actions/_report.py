@@ -0,0 +1,683 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Helpers for selecting and printing reports.
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Sequence, TextIO
+
+import dbus
+
+from .._errors import StratisCliReportFileError
+
+type PathComponent = str | int
+
+# Number of output chunks that are accumulated before they are written.
+_WRITE_BATCH_SIZE = 4096
+
+_INDENT = " " * 4
+
+_DIGEST_SIZE = 16
+
+SNAPSHOT_SUFFIX = ".json.gz"
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+(_STRING, _INT, _FLOAT, _OBJECT, _ARRAY, _CONSTANT) = range(6)
+
+# Exact types that may occur in a D-Bus structure, mapped to the kind of
+# JSON value that they are written as. Looking up the exact type is much
+# faster than the chain of isinstance checks made by the json module.
+_KINDS = {
+    str: _STRING,
+    dbus.String: _STRING,
+    dbus.ObjectPath: _STRING,
+    dbus.Signature: _STRING,
+    int: _INT,
+    dbus.Boolean: _INT,
+    dbus.Byte: _INT,
+    dbus.Int16: _INT,
+    dbus.UInt16: _INT,
+    dbus.Int32: _INT,
+    dbus.UInt32: _INT,
+    dbus.Int64: _INT,
+    dbus.UInt64: _INT,
+    float: _FLOAT,
+    dbus.Double: _FLOAT,
+    dict: _OBJECT,
+    dbus.Dictionary: _OBJECT,
+    list: _ARRAY,
+    tuple: _ARRAY,
+    dbus.Array: _ARRAY,
+    dbus.Struct: _ARRAY,
+}
+
+_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+_SCALAR_RE = re.compile(r"[^,\]}\s]+")
+
+# Only strings and brackets are relevant when skipping over a container;
+# matching strings as a whole ensures that brackets inside them are ignored.
+_CONTAINER_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}]')
+
+
+def format_path(path: Sequence[PathComponent]) -> str:
+    """
+    Format a path in the syntax accepted by the --path option.
+
+    :param path: the sequence of keys and indices
+    :returns: the path as a string
+    """
+    return "$" + "".join(
+        (
+            f"[{component}]"
+            if isinstance(component, int)
+            else (
+                f".{component}"
+                if _NAME_RE.fullmatch(component)
+                else f"[{json.dumps(component)}]"
+            )
+        )
+        for component in path
+    )
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    """
+    Return the position of the first non-whitespace character.
+    """
+    match = _WHITESPACE_RE.match(text, position)
+    assert match is not None
+    return match.end()
+
+
+def _skip_value(text: str, position: int) -> int:
+    """
+    Return the position just past the JSON value that begins at position,
+    without decoding it.
+
+    :param str text: JSON text
+    :param int position: the position of the first character of the value
+    :raises ValueError: if the text is not well-formed
+    """
+    first = text[position]
+
+    if first == '"':
+        match = _STRING_RE.match(text, position)
+        if match is None:
+            raise ValueError(f"Unterminated string at position {position}")
+        return match.end()
+
+    if first in "[{":
+        depth = 0
+        for match in _CONTAINER_TOKEN_RE.finditer(text, position):
+            token = match.group()[0]
+            if token in "[{":
+                depth += 1
+            elif token in "]}":
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+        raise ValueError(f"Unterminated container at position {position}")
+
+    match = _SCALAR_RE.match(text, position)
+    if match is None:
+        raise ValueError(f"Expected a value at position {position}")
+    return match.end()
+
+
+def _find_member(text: str, position: int, key: str) -> int:
+    """
+    Return the position of the value of the member of the object at
+    position that has the specified key.
+
+    :raises KeyError: if there is no object or no such member
+    """
+    if text[position] != "{":
+        raise KeyError(key)
+
+    position = _skip_whitespace(text, position + 1)
+    while text[position] != "}":
+        match = _STRING_RE.match(text, position)
+        if match is None:
+            raise ValueError(f"Expected a key at position {position}")
+        member_key = json.loads(match.group())
+        position = _skip_whitespace(text, match.end())
+        position = _skip_whitespace(text, position + 1)  # skip ":"
+
+        if member_key == key:
+            return position
+
+        position = _skip_whitespace(text, _skip_value(text, position))
+        if text[position] == ",":
+            position = _skip_whitespace(text, position + 1)
+
+    raise KeyError(key)
+
+
+def _find_element(text: str, position: int, index: int) -> int:
+    """
+    Return the position of the element of the array at position that has
+    the specified index.
+
+    :raises KeyError: if there is no array or no such element
+    """
+    if text[position] != "[":
+        raise KeyError(index)
+
+    position = _skip_whitespace(text, position + 1)
+    current = 0
+    while text[position] != "]":
+        if current == index:
+            return position
+
+        position = _skip_whitespace(text, _skip_value(text, position))
+        if text[position] == ",":
+            position = _skip_whitespace(text, position + 1)
+        current += 1
+
+    raise KeyError(index)
+
+
+def extract_json_text(text: str, path: Sequence[PathComponent]) -> str:
+    """
+    Extract the text of the value at path from a JSON document.
+
+    Values that are not on the path are scanned over but not decoded, so
+    that only the selected subtree needs to be parsed by the caller.
+
+    :param str text: JSON text
+    :param path: the sequence of keys and indices
+    :returns: the JSON text of the selected value, exactly as in the input
+    :raises KeyError: if the path does not exist in the document
+    """
+    position = _skip_whitespace(text, 0)
+    for component in path:
+        position = (
+            _find_element(text, position, component)
+            if isinstance(component, int)
+            else _find_member(text, position, component)
+        )
+    return text[position : _skip_value(text, position)]
+
+
+def select_value(value: Any, path: Sequence[PathComponent]) -> Any:
+    """
+    Select the value at path from an already decoded structure.
+
+    :param value: a structure of dicts, lists, and scalars
+    :param path: the sequence of keys and indices
+    :returns: the selected value
+    :raises KeyError: if the path does not exist in the structure
+    """
+    for component in path:
+        if isinstance(component, int):
+            if not isinstance(value, (list, tuple)) or component >= len(value):
+                raise KeyError(component)
+            value = value[component]
+        else:
+            if not isinstance(value, dict) or component not in value:
+                raise KeyError(component)
+            value = value[component]
+    return value
+
+
+_STRING_TYPES = frozenset(
+    value_type for (value_type, kind) in _KINDS.items() if kind == _STRING
+)
+
+
+def _float_text(value: float) -> str:
+    """
+    Return the JSON text for a float, exactly as the json module does.
+    """
+    if math.isnan(value):
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _kind(value: Any) -> int:  # noqa: PLR0911
+    """
+    Return the kind of a value whose exact type is not in _KINDS.
+
+    :raises TypeError: if the value can not be written as JSON
+    """
+    if value is None or value is True or value is False:
+        return _CONSTANT
+    if isinstance(value, str):
+        return _STRING
+    if isinstance(value, int):
+        return _INT
+    if isinstance(value, float):
+        return _FLOAT
+    if isinstance(value, dict):
+        return _OBJECT
+    if isinstance(value, (list, tuple)):
+        return _ARRAY
+    raise TypeError(
+        f"Object of type {value.__class__.__name__} is not JSON serializable"
+    )
+
+
+def _key_text(key: Any) -> str:
+    """
+    Return the JSON text for an object key, exactly as the json module does.
+
+    :raises TypeError: if the key is not of a permitted type
+    """
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    if isinstance(key, float):
+        return encode_basestring_ascii(_float_text(key))
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, int):
+        return encode_basestring_ascii(int.__repr__(key))
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    )
+
+
+def _open(value: Any, kind: int, sort_keys: bool, depth: int) -> list[Any]:
+    """
+    Return the frame for a non-empty container that is about to be written.
+
+    A frame consists of an iterator over the container's items, whether the
+    container is an object, the separator to write before the next item,
+    the separator to write before every item after the first, and the text
+    that closes the container.
+    """
+    newline = "\n" + _INDENT * (depth + 1)
+    if kind == _OBJECT:
+        return [
+            iter(sorted(value.items()) if sort_keys else value.items()),
+            True,
+            newline,
+            "," + newline,
+            "\n" + _INDENT * depth + "}",
+        ]
+    return [iter(value), False, newline, "," + newline, "\n" + _INDENT * depth + "]"]
+
+
+def write_json(value: Any, stream: TextIO, *, sort_keys: bool = False):  # noqa: PLR0912
+    """
+    Write a structure of D-Bus or Python values to stream as JSON.
+
+    The output is identical to that of json.dump with an indent of 4. The
+    structure is traversed iteratively, and the output is written in
+    batches as it is generated.
+
+    :param value: the value to write
+    :param stream: the stream to write to
+    :param bool sort_keys: whether to sort the keys of objects
+    :raises TypeError: if some value can not be written as JSON
+    """
+    kinds = _KINDS
+    chunks: list[str] = []
+    append = chunks.append
+
+    # The value itself is written as the only item of an enclosing frame.
+    stack: list[list[Any]] = [[iter((value,)), False, "", "", ""]]
+
+    while stack:
+        frame = stack[-1]
+        (iterator, is_object, separator, next_separator, closing) = frame
+
+        for item in iterator:
+            if is_object:
+                (key, value) = item
+                append(separator)
+                append(
+                    encode_basestring_ascii(key)
+                    if type(key) in _STRING_TYPES
+                    else _key_text(key)
+                )
+                append(": ")
+            else:
+                value = item
+                append(separator)
+            separator = next_separator
+
+            kind = kinds.get(type(value))
+            if kind is None:
+                kind = _kind(value)
+
+            if kind == _STRING:
+                append(encode_basestring_ascii(value))
+            elif kind == _INT:
+                append(int.__repr__(value))
+            elif kind == _FLOAT:
+                append(_float_text(value))
+            elif kind in (_OBJECT, _ARRAY):
+                if value:
+                    frame[2] = next_separator
+                    append("{" if kind == _OBJECT else "[")
+                    stack.append(_open(value, kind, sort_keys, len(stack) - 1))
+                    break
+                append("{}" if kind == _OBJECT else "[]")
+            else:
+                append("null" if value is None else "true" if value else "false")
+        else:
+            stack.pop()
+            append(closing)
+
+        if len(chunks) >= _WRITE_BATCH_SIZE:
+            stream.write("".join(chunks))
+            chunks.clear()
+
+    stream.write("".join(chunks))
+
+
+def is_managed_objects(value: Any) -> bool:
+    """
+    Whether a decoded report is a managed_objects_report, i.e., whether
+    it is an object keyed by D-Bus object paths.
+    """
+    return (
+        isinstance(value, dict)
+        and len(value) > 0
+        and all(key.startswith("/") for key in value)
+    )
+
+
+def load_report(report_path: str) -> Any:
+    """
+    Load a saved report. A report saved in a file may be gzip compressed.
+
+    :param str report_path: path of the report, or "-" for stdin
+    :raises StratisCliReportFileError:
+    """
+    try:
+        if report_path == "-":
+            return json.load(sys.stdin)
+        with open(report_path, "rb") as report_file:
+            data = report_file.read()
+        if data.startswith(_GZIP_MAGIC):
+            data = gzip.decompress(data)
+        return json.loads(data)
+    except (EOFError, OSError, ValueError) as err:
+        raise StratisCliReportFileError(report_path, err) from err
+
+
+def load_managed_objects(report_path: str) -> dict[str, Any]:
+    """
+    Load a saved managed_objects_report, for use in place of the result of
+    GetManagedObjects.
+
+    :param str report_path: path of the report
+    :raises StratisCliReportFileError:
+    """
+    managed_objects = load_report(report_path)
+    if managed_objects != {} and not is_managed_objects(managed_objects):
+        raise StratisCliReportFileError(
+            report_path, "the report is not a managed_objects_report"
+        )
+    return managed_objects
+
+
+def subtree_digest(value: Any, digests: dict[int, bytes] | None = None) -> bytes:
+    """
+    Calculate a digest of a decoded JSON value.
+
+    Two values have equal digests exactly when they are equal as JSON; in
+    particular, the order of the keys of an object does not matter. The
+    digest of a container is calculated from the canonical encodings of its
+    scalar items and the digests of its container items, which are
+    remembered in digests, if specified, so that they need not be
+    calculated again when the container's items are compared.
+
+    :param value: a decoded JSON value
+    :param digests: map from the id of a container to its digest
+    :type digests: dict or NoneType
+    :returns: the digest
+    """
+    if digests is not None and id(value) in digests:
+        return digests[id(value)]
+
+    def update(hasher: Any, item: Any):
+        # A digest is preceded by a NUL byte and has a fixed size; an
+        # encoding is preceded by a SOH byte and contains neither byte.
+        if isinstance(item, (dict, list)):
+            hasher.update(b"\x00")
+            hasher.update(subtree_digest(item, digests))
+        else:
+            hasher.update(b"\x01")
+            hasher.update(_CANONICAL_ENCODER.encode(item).encode())
+
+    if isinstance(value, dict):
+        hasher = hashlib.blake2b(b"{", digest_size=_DIGEST_SIZE)
+        for key in sorted(value):
+            hasher.update(encode_basestring_ascii(key).encode())
+            update(hasher, value[key])
+        digest = hasher.digest()
+    elif isinstance(value, list):
+        hasher = hashlib.blake2b(b"[", digest_size=_DIGEST_SIZE)
+        for item in value:
+            update(hasher, item)
+        digest = hasher.digest()
+    else:
+        return hashlib.blake2b(
+            _CANONICAL_ENCODER.encode(value).encode(), digest_size=_DIGEST_SIZE
+        ).digest()
+
+    if digests is not None:
+        digests[id(value)] = digest
+
+    return digest
+
+
+def diff_values(old: Any, new: Any) -> dict[str, dict[str, Any]]:
+    """
+    Find the differences between two decoded JSON documents.
+
+    The digests of corresponding subtrees are compared first, so that
+    subtrees that have not changed are skipped without being examined
+    item by item. Every scalar is encoded once for each document.
+
+    :param old: the old document
+    :param new: the new document
+    :returns: the added and removed values and the changed scalars or
+              containers, each keyed by path
+    """
+    digests: dict[int, bytes] = {}
+
+    added = {}
+    removed = {}
+    changed = {}
+
+    stack: list[tuple[tuple[PathComponent, ...], Any, Any]] = [((), old, new)]
+    while stack:
+        (path, old_value, new_value) = stack.pop()
+
+        if (
+            isinstance(old_value, (dict, list))
+            and type(old_value) is type(new_value)
+            and subtree_digest(old_value, digests) == subtree_digest(new_value, digests)
+        ):
+            continue
+
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            for key, value in old_value.items():
+                if key in new_value:
+                    stack.append((path + (key,), value, new_value[key]))
+                else:
+                    removed[format_path(path + (key,))] = value
+            for key, value in new_value.items():
+                if key not in old_value:
+                    added[format_path(path + (key,))] = value
+
+        elif isinstance(old_value, list) and isinstance(new_value, list):
+            common = min(len(old_value), len(new_value))
+            stack.extend(
+                (path + (index,), old_value[index], new_value[index])
+                for index in range(common)
+            )
+            for index in range(common, len(old_value)):
+                removed[format_path(path + (index,))] = old_value[index]
+            for index in range(common, len(new_value)):
+                added[format_path(path + (index,))] = new_value[index]
+
+        # Comparing the types distinguishes, e.g., 1 from true and 1.0.
+        elif type(old_value) is not type(new_value) or old_value != new_value:
+            changed[format_path(path)] = {"old": old_value, "new": new_value}
+
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def snapshot_paths(directory: str, prefix: str) -> list[str]:
+    """
+    Return the paths of the saved reports in directory, oldest first.
+
+    :param str directory: the directory
+    :param str prefix: the prefix of the names of the reports
+    """
+    return [
+        os.path.join(directory, name)
+        for name in sorted(os.listdir(directory))
+        if name.startswith(f"{prefix}-") and name.endswith(SNAPSHOT_SUFFIX)
+    ]
+
+
+def _write_snapshot(path: str, data: bytes):
+    """
+    Write data to path compressed, so that path is either absent or
+    complete, even if writing is interrupted.
+
+    :param str path: the path to write to
+    :param bytes data: the uncompressed data
+    """
+    (descriptor, temporary_path) = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as snapshot_file:
+            with gzip.GzipFile(fileobj=snapshot_file, mode="wb", mtime=0) as gzip_file:
+                gzip_file.write(data)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        try:
+            os.unlink(temporary_path)
+        except OSError:  # pragma: no cover
+            pass
+        raise
+
+
+def _newest_digest(paths: Sequence[str]) -> bytes | None:
+    """
+    Return the digest of the contents of the newest saved report, if any.
+    """
+    if len(paths) == 0:
+        return None
+
+    try:
+        with gzip.open(paths[-1], "rb") as gzip_file:
+            return hashlib.blake2b(gzip_file.read(), digest_size=_DIGEST_SIZE).digest()
+    except (OSError, EOFError):
+        return None
+
+
+def collect_snapshots(  # noqa: PLR0913
+    render: Callable[[], str],
+    directory: str,
+    prefix: str,
+    *,
+    every: float,
+    keep: int | None = None,
+    count: int | None = None,
+):
+    """
+    Save the rendered report in directory at regular intervals.
+
+    A report is saved only if its contents differ from those of the most
+    recently saved report. Each report is compressed and written
+    atomically to a file whose name is prefix followed by the UTC time.
+    If a report can not be obtained over D-Bus, the sample is skipped and
+    reported on stderr.
+
+    :param render: function that returns the current report
+    :param str directory: the directory to save reports in
+    :param str prefix: the prefix of the names of the reports
+    :param float every: the interval in seconds
+    :param keep: the number of reports to keep, or None to keep all
+    :type keep: int or NoneType
+    :param count: the number of samples to take, or None for no limit
+    :type count: int or NoneType
+    :raises OSError: if a report could not be saved
+    """
+    os.makedirs(directory, exist_ok=True)
+    previous = _newest_digest(snapshot_paths(directory, prefix))
+
+    samples = 0
+    deadline = time.monotonic()
+    while True:
+        try:
+            data = render().encode()
+        except dbus.exceptions.DBusException as err:
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+            print(
+                f"Skipped the sample at {timestamp}: {err.get_dbus_message()}",
+                file=sys.stderr,
+                flush=True,
+            )
+        else:
+            digest = hashlib.blake2b(data, digest_size=_DIGEST_SIZE).digest()
+
+            if digest != previous:
+                timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+                _write_snapshot(
+                    os.path.join(directory, f"{prefix}-{timestamp}{SNAPSHOT_SUFFIX}"),
+                    data,
+                )
+                previous = digest
+
+                if keep is not None:
+                    for path in snapshot_paths(directory, prefix)[:-keep]:
+                        os.unlink(path)
+
+        samples += 1
+        if count is not None and samples >= count:
+            return
+
+        # If a sample took longer than the interval, skip the samples that
+        # were missed rather than taking them all at once.
+        deadline += every
+        now = time.monotonic()
+        if deadline < now:
+            deadline = now
+        else:
+            time.sleep(deadline - now)
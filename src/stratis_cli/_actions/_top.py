@@ -19,7 +19,8 @@ import json
 import os
 import sys
 from argparse import Namespace
-from typing import Tuple
+from io import StringIO
+from typing import Any, TextIO, Tuple
 
 from dbus import Array, Dictionary, String, Struct, UInt16
 from dbus.proxies import ProxyObject
@@ -29,12 +30,25 @@ from .._errors import (
     StratisCliIncoherenceError,
     StratisCliNameConflictError,
     StratisCliNoChangeError,
+    StratisCliReportFileError,
     StratisCliResourceNotFoundError,
 )
 from .._stratisd_constants import ReportKey, StratisdErrors
 from ._connection import get_object
 from ._constants import TOP_OBJECT
 from ._formatting import print_table
+from ._monitor import monitor
+from ._report import (
+    collect_snapshots,
+    diff_values,
+    extract_json_text,
+    format_path,
+    is_managed_objects,
+    load_report,
+    select_value,
+    write_json,
+)
+from ._stratisd_version import check_stratisd_version
 from ._utils import get_passphrase_fd
 
 
@@ -84,6 +98,106 @@ def _add_update_key(
     return add_ret
 
 
+def _fetch_managed_objects(proxy: ProxyObject) -> Dictionary:
+    """
+    Fetch the result of GetManagedObjects from stratisd.
+
+    :param proxy: proxy to the top object in stratisd
+    """
+    from ._data import ObjectManager  # noqa: PLC0415
+
+    return ObjectManager.Methods.GetManagedObjects(proxy, {})
+
+
+def _fetch_json_report(proxy: ProxyObject, report_name: ReportKey) -> str:
+    """
+    Fetch a report that stratisd supplies as a JSON string.
+
+    :param proxy: proxy to the top object in stratisd
+    :param report_name: the report to fetch
+    :raises StratisCliEngineError:
+    """
+    assert report_name is not ReportKey.MANAGED_OBJECTS
+
+    if report_name is ReportKey.ENGINE_STATE:
+        from ._data import Manager  # noqa: PLC0415
+
+        (json_report, return_code, message) = Manager.Methods.EngineStateReport(
+            proxy, {}
+        )
+
+    else:
+        from ._data import Report  # noqa: PLC0415
+
+        (json_report, return_code, message) = Report.Methods.GetReport(
+            proxy, {"name": str(report_name)}
+        )
+
+    # The only reason that stratisd has for returning an error code is
+    # if the report name is unrecognized. However, the parser restricts
+    # the list of names to only the ones that stratisd recognizes, so
+    # this branch can only be taken due to an unexpected bug in
+    # stratisd.
+    if return_code != StratisdErrors.OK:  # pragma: no cover
+        raise StratisCliEngineError(return_code, message)
+
+    return json_report
+
+
+def _write_report(proxy: ProxyObject, namespace: Namespace, stream: TextIO):
+    """
+    Write the report selected by the command-line options to stream.
+
+    :param proxy: proxy to the top object in stratisd
+    :param namespace: the parsed command-line options
+    :param stream: the stream to write to
+    :raises StratisCliEngineError:
+    :raises StratisCliResourceNotFoundError:
+    """
+    path = namespace.path
+
+    if namespace.report_name is ReportKey.MANAGED_OBJECTS:
+        dbus_report = _fetch_managed_objects(proxy)
+
+        if path is None:
+            value = dbus_report
+        else:
+            try:
+                value = select_value(dbus_report, path)
+            except KeyError as err:
+                raise StratisCliResourceNotFoundError(
+                    "report", format_path(path)
+                ) from err
+
+        if namespace.raw:
+            print(json.dumps(value), end="", file=stream)
+        else:
+            write_json(value, stream, sort_keys=(not namespace.no_sort_keys))
+
+    else:
+        json_report = _fetch_json_report(proxy, namespace.report_name)
+
+        if path is not None:
+            try:
+                json_report = extract_json_text(json_report, path)
+            except KeyError as err:
+                raise StratisCliResourceNotFoundError(
+                    "report", format_path(path)
+                ) from err
+
+        if namespace.raw:
+            print(json_report, end="", file=stream)
+        else:
+            json.dump(
+                json.loads(json_report),
+                stream,
+                indent=4,
+                sort_keys=(not namespace.no_sort_keys),
+            )
+
+    print(file=stream)
+
+
 class TopActions:
     """
     Top level actions.
@@ -92,56 +206,70 @@ class TopActions:
     @staticmethod
     def get_report(namespace: Namespace):
         """
-        Get the requested report from stratisd.
+        Get the requested report from stratisd, and either print it or
+        save it periodically.
 
         :raises StratisCliEngineError:
+        :raises StratisCliResourceNotFoundError:
+        :raises StratisCliReportFileError:
         """
 
-        if namespace.report_name is ReportKey.MANAGED_OBJECTS:
-            from ._data import ObjectManager  # noqa: PLC0415
-
-            dbus_report: Dictionary = ObjectManager.Methods.GetManagedObjects(
-                get_object(TOP_OBJECT), {}
-            )
+        proxy = get_object(TOP_OBJECT)
 
-            # unlike pprint, json.dump prints GetManagedObjects result nicely
-            json.dump(
-                dbus_report,
-                sys.stdout,
-                indent=4,
-                sort_keys=(not namespace.no_sort_keys),
+        if namespace.every is None:
+            _write_report(proxy, namespace, sys.stdout)
+            return
+
+        def render() -> str:
+            output = StringIO()
+            _write_report(proxy, namespace, output)
+            return output.getvalue()
+
+        try:
+            collect_snapshots(
+                render,
+                namespace.dir,
+                str(namespace.report_name),
+                every=namespace.every,
+                keep=namespace.keep,
+                count=namespace.count,
             )
+        except OSError as err:
+            raise StratisCliReportFileError(namespace.dir, err) from err
 
-        else:
-            if namespace.report_name is ReportKey.ENGINE_STATE:
-                from ._data import Manager  # noqa: PLC0415
-
-                (json_report, return_code, message) = Manager.Methods.EngineStateReport(
-                    get_object(TOP_OBJECT), {}
-                )
-
-            else:
-                from ._data import Report  # noqa: PLC0415
+    @staticmethod
+    def monitor(_: Namespace):
+        """
+        Write an event for each change to a pool, filesystem, or blockdev.
 
-                (json_report, return_code, message) = Report.Methods.GetReport(
-                    get_object(TOP_OBJECT), {"name": str(namespace.report_name)}
-                )
+        :raises StratisCliSignalsUnavailableError:
+        """
+        monitor()
 
-            # The only reason that stratisd has for returning an error code is
-            # if the report name is unrecognized. However, the parser restricts
-            # the list of names to only the ones that stratisd recognizes, so
-            # this branch can only be taken due to an unexpected bug in
-            # stratisd.
-            if return_code != StratisdErrors.OK:  # pragma: no cover
-                raise StratisCliEngineError(return_code, message)
+    @staticmethod
+    def diff_reports(namespace: Namespace):
+        """
+        Print the differences between two saved reports, or between a saved
+        report and the corresponding report from stratisd.
 
-            json.dump(
-                json.loads(json_report),
-                sys.stdout,
-                indent=4,
-                sort_keys=(not namespace.no_sort_keys),
+        :raises StratisCliReportFileError:
+        :raises StratisCliEngineError:
+        """
+        old = load_report(namespace.old)
+
+        if namespace.new is None:
+            check_stratisd_version()
+            proxy = get_object(TOP_OBJECT)
+            new = (
+                # Convert D-Bus values exactly as when the report was saved.
+                json.loads(json.dumps(_fetch_managed_objects(proxy)))
+                if is_managed_objects(old)
+                else json.loads(_fetch_json_report(proxy, ReportKey.ENGINE_STATE))
             )
+        else:
+            new = load_report(namespace.new)
 
+        write_json(diff_values(old, new), sys.stdout, sort_keys=True)
         print(file=sys.stdout)
 
     @staticmethod
@@ -0,0 +1,494 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tracing of D-Bus method calls and property accesses.
+
+Each call is written as a line of JSON, which records where the time went:
+converting the arguments to D-Bus types, marshalling them into the request,
+waiting for the reply, which is the time spent in transport and in the
+daemon, and unmarshalling the reply. The time taken by a call to the
+Peer.Ping method, which the daemon answers without doing any work, is
+recorded before the first call, so that the transport's share of the waiting
+can be estimated.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager, suppress
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+import dbus
+
+from ._constants import SERVICE
+
+_TRACER: "DBusTracer | None" = None
+
+_PEER_INTERFACE = "org.freedesktop.DBus.Peer"
+
+# The maximum length of the summary of an argument.
+_SUMMARY_LENGTH = 64
+
+# Alignment of each D-Bus type code in the marshalled data.
+_ALIGNMENT = {
+    "y": 1,
+    "b": 4,
+    "n": 2,
+    "q": 2,
+    "i": 4,
+    "u": 4,
+    "x": 8,
+    "t": 8,
+    "d": 8,
+    "h": 4,
+    "s": 4,
+    "o": 4,
+    "g": 1,
+    "v": 1,
+    "a": 4,
+    "(": 8,
+    "{": 8,
+}
+
+# Sizes of the fixed-size D-Bus types.
+_FIXED_SIZE = {
+    "y": 1,
+    "b": 4,
+    "n": 2,
+    "q": 2,
+    "i": 4,
+    "u": 4,
+    "x": 8,
+    "t": 8,
+    "d": 8,
+    "h": 4,
+}
+
+# Signatures of dbus-python types, most derived first.
+_TYPE_SIGNATURES = (
+    (dbus.Boolean, "b"),
+    (dbus.Byte, "y"),
+    (dbus.Int16, "n"),
+    (dbus.UInt16, "q"),
+    (dbus.Int32, "i"),
+    (dbus.UInt32, "u"),
+    (dbus.Int64, "x"),
+    (dbus.UInt64, "t"),
+    (dbus.ObjectPath, "o"),
+    (dbus.Signature, "g"),
+    (dbus.UnixFd, "h"),
+    (bool, "b"),
+    (int, "i"),
+    (float, "d"),
+    (str, "s"),
+    (bytes, "ay"),
+)
+
+
+def _split_signature(signature: str) -> List[str]:
+    """
+    Split a signature into its complete types.
+    """
+    types = []
+    start = 0
+    depth = 0
+    for index, code in enumerate(signature):
+        if code in "({":
+            depth += 1
+        elif code in ")}":
+            depth -= 1
+        if depth == 0 and code != "a":
+            types.append(signature[start : index + 1])
+            start = index + 1
+    return types
+
+
+def _signature_of(value: Any) -> str:
+    """
+    Get the signature of the value of a variant.
+    """
+    signature = getattr(value, "signature", None)
+
+    if isinstance(value, dict):
+        entry = next(iter(value.items()), None)
+        inner = signature or (
+            "sv" if entry is None else "".join(_signature_of(item) for item in entry)
+        )
+        return f"a{{{inner}}}"
+
+    if isinstance(value, tuple):
+        return f"({signature or ''.join(_signature_of(item) for item in value)})"
+
+    if isinstance(value, list):
+        inner = signature or ("v" if value == [] else _signature_of(value[0]))
+        return f"a{inner}"
+
+    return next(
+        (
+            signature
+            for (klass, signature) in _TYPE_SIGNATURES
+            if isinstance(value, klass)
+        ),
+        "s",
+    )
+
+
+def _marshalled_end(signature: str, value: Any, offset: int) -> int:
+    """
+    Get the offset at which a value ends when it is marshalled at an offset.
+
+    :param str signature: a complete type
+    """
+    code = signature[0]
+    offset += -offset % _ALIGNMENT[code]
+
+    if code in _FIXED_SIZE:
+        return offset + _FIXED_SIZE[code]
+
+    if code in "so":
+        return offset + 4 + len(str(value).encode("utf-8")) + 1
+
+    if code == "g":
+        return offset + 1 + len(str(value)) + 1
+
+    if code == "v":
+        variant_signature = _signature_of(value)
+        offset = _marshalled_end("g", variant_signature, offset)
+        return _marshalled_end(variant_signature, value, offset)
+
+    if code == "(":
+        for member_signature, member in zip(_split_signature(signature[1:-1]), value):
+            offset = _marshalled_end(member_signature, member, offset)
+        return offset
+
+    # An array: its length, then padding to the alignment of its elements,
+    # then the elements.
+    element_signature = signature[1:]
+    offset += 4
+    offset += -offset % _ALIGNMENT[element_signature[0]]
+    if element_signature[0] == "{":
+        (key_signature, value_signature) = _split_signature(element_signature[1:-1])
+        for key, item in value.items():
+            offset += -offset % 8
+            offset = _marshalled_end(key_signature, key, offset)
+            offset = _marshalled_end(value_signature, item, offset)
+    else:
+        for item in value:
+            offset = _marshalled_end(element_signature, item, offset)
+    return offset
+
+
+def marshalled_size(signature: str, values: Sequence[Any]) -> int:
+    """
+    Get the size of the marshalled body of a D-Bus message.
+
+    :param str signature: the signature of the body
+    :param values: the values in the body
+    :returns: the size in bytes
+    """
+    offset = 0
+    for value_signature, value in zip(_split_signature(signature), values):
+        offset = _marshalled_end(value_signature, value, offset)
+    return offset
+
+
+def summarize(value: Any) -> str:
+    """
+    Summarize an argument of a method call.
+    """
+    if isinstance(value, dict):
+        return f"{{{len(value)} entries}}"
+    if isinstance(value, tuple):
+        return f"({', '.join(summarize(item) for item in value)})"
+    if isinstance(value, list):
+        return f"[{len(value)} items]"
+    if isinstance(value, dbus.UnixFd):
+        return "<fd>"
+    text = repr(value)
+    return text if len(text) <= _SUMMARY_LENGTH else f"{text[: _SUMMARY_LENGTH - 3]}..."
+
+
+class DBusTracer:
+    """
+    Writes a line of JSON for each traced call.
+    """
+
+    def __init__(self, stream: Any):
+        """
+        Initializer.
+
+        :param stream: the stream to write to
+        """
+        self._stream = stream
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._pinged = False
+
+    @property
+    def _frames(self) -> List[Dict[str, Any]]:
+        """
+        The records of the calls being made by this thread.
+        """
+        return self._local.__dict__.setdefault("frames", [])
+
+    def _emit(self, record: Dict[str, Any]):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._stream.write(line)
+            self._stream.flush()
+
+    @contextmanager
+    def record(self, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time a call and write its record when it returns.
+
+        The record may be completed by a traced call that is made within the
+        context.
+        """
+        frame: Dict[str, Any] = {
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        } | fields
+        self._frames.append(frame)
+        start = time.perf_counter()
+        try:
+            yield frame
+        except BaseException as err:
+            frame["error"] = (
+                err.get_dbus_name()
+                if isinstance(err, dbus.exceptions.DBusException)
+                else type(err).__name__
+            )
+            raise
+        finally:
+            self._frames.pop()
+            frame["seconds"] = time.perf_counter() - start
+            if "round_trip_seconds" in frame:
+                frame["convert_seconds"] = max(
+                    0.0,
+                    frame["seconds"]
+                    - frame["marshal_seconds"]
+                    - frame["round_trip_seconds"]
+                    - frame["unmarshal_seconds"]
+                    - frame["trace_seconds"],
+                )
+            self._emit(frame)
+
+    def _call_blocking(  # noqa: PLR0913
+        self,
+        frame: Dict[str, Any],
+        object_path: str,
+        interface: str | None,
+        member: str,
+        args: Tuple[Any, ...],
+        *,
+        signature: str | None,
+        timeout: float,
+    ) -> Any:
+        """
+        Call a method as dbus-python's Connection.call_blocking does,
+        recording the sizes of the request and the reply and timing each
+        step.
+        """
+        from dbus.lowlevel import MethodCallMessage  # noqa: PLC0415
+
+        from ._connection import Bus  # noqa: PLC0415
+
+        frame.setdefault("object_path", object_path)
+        frame.setdefault("arguments", [summarize(arg) for arg in args])
+
+        start = time.perf_counter()
+        message = MethodCallMessage(
+            destination=SERVICE, path=object_path, interface=interface, method=member
+        )
+        message.append(signature=signature, *args)
+        marshalled = time.perf_counter()
+        frame["marshal_seconds"] = marshalled - start
+        frame["request_bytes"] = marshalled_size(message.get_signature(), args)
+        frame["round_trip_seconds"] = 0.0
+        frame["unmarshal_seconds"] = 0.0
+
+        # The time taken to calculate the sizes is recorded separately.
+        sent = time.perf_counter()
+        frame["trace_seconds"] = sent - marshalled
+        try:
+            reply = Bus.get_bus().send_message_with_reply_and_block(message, timeout)
+        finally:
+            frame["round_trip_seconds"] = time.perf_counter() - sent
+
+        received = time.perf_counter()
+        results = reply.get_args_list()
+        unmarshalled = time.perf_counter()
+        frame["unmarshal_seconds"] = unmarshalled - received
+        frame["reply_bytes"] = marshalled_size(reply.get_signature(), results)
+        frame["trace_seconds"] += time.perf_counter() - unmarshalled
+
+        if len(results) == 0:
+            return None
+        if len(results) == 1:
+            return results[0]
+        return tuple(results)
+
+    def call(  # noqa: PLR0913
+        self,
+        object_path: str,
+        interface: str | None,
+        member: str,
+        args: Tuple[Any, ...],
+        *,
+        signature: str | None,
+        timeout: float,
+    ) -> Any:
+        """
+        Make a traced method call.
+
+        If the call is made by a traced generated method, the generated
+        method's record is completed; otherwise, the call is recorded
+        separately.
+        """
+        if not self._pinged:
+            self._pinged = True
+            # An error is recorded, but does not prevent the call.
+            with (
+                suppress(dbus.exceptions.DBusException),
+                self.record(
+                    operation="ping", interface=_PEER_INTERFACE, member="Ping"
+                ) as frame,
+            ):
+                self._call_blocking(
+                    frame, "/", _PEER_INTERFACE, "Ping", (), signature="", timeout=-1
+                )
+
+        if self._frames and "round_trip_seconds" not in self._frames[-1]:
+            return self._call_blocking(
+                self._frames[-1],
+                object_path,
+                interface,
+                member,
+                args,
+                signature=signature,
+                timeout=timeout,
+            )
+
+        with self.record(operation="call", interface=interface, member=member) as frame:
+            return self._call_blocking(
+                frame,
+                object_path,
+                interface,
+                member,
+                args,
+                signature=signature,
+                timeout=timeout,
+            )
+
+
+class _TracedMethod:
+    """
+    A method of a traced proxy.
+    """
+
+    def __init__(self, proxy: Any, object_path: str, member: str, interface: Any):
+        self._proxy = proxy
+        self._object_path = object_path
+        self._member = member
+        self._interface = interface
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        interface = kwargs.pop("dbus_interface", self._interface)
+        signature = kwargs.pop("signature", None)
+        timeout = kwargs.pop("timeout", -1)
+
+        # Asynchronous calls and calls with other options are not traced.
+        if _TRACER is None or kwargs:
+            return self._proxy.get_dbus_method(self._member, dbus_interface=interface)(
+                *args, signature=signature, timeout=timeout, **kwargs
+            )
+
+        return _TRACER.call(
+            self._object_path,
+            interface,
+            self._member,
+            args,
+            signature=signature,
+            timeout=timeout,
+        )
+
+
+class TracedProxy:
+    """
+    A proxy object whose method calls are traced.
+    """
+
+    def __init__(self, proxy: Any, object_path: str):
+        """
+        Initializer.
+
+        :param proxy: a dbus-python proxy object
+        :param str object_path: the object path of the proxy object
+        """
+        self._proxy = proxy
+        self._object_path = object_path
+
+    def get_dbus_method(self, member: str, dbus_interface: str | None = None) -> Any:
+        """
+        Get a method of the object.
+        """
+        return _TracedMethod(self._proxy, self._object_path, member, dbus_interface)
+
+    def __getattr__(self, member: str) -> Any:
+        if member.startswith("_"):
+            return getattr(self._proxy, member)
+        return self.get_dbus_method(member)
+
+
+def trace_dbus(stream: Any):
+    """
+    Start tracing D-Bus calls, or stop if stream is None.
+
+    :param stream: the stream to which the trace is written, or None
+    """
+    global _TRACER  # noqa: PLW0603
+    _TRACER = None if stream is None else DBusTracer(stream)
+
+
+def tracing() -> bool:
+    """
+    Whether D-Bus calls are being traced.
+    """
+    return _TRACER is not None
+
+
+def traced(
+    interface: str, member: str, operation: str, func: Callable[..., Any]
+) -> Callable[..., Any]:
+    """
+    Trace a generated method or property accessor, so that the time taken
+    to convert its arguments is recorded with its call.
+
+    :param str interface: the interface of the method or property
+    :param str member: the name of the method or property
+    :param str operation: "call", "get", or "set"
+    :param func: the generated function
+    """
+
+    @wraps(func)
+    def traced_func(*args: Any, **kwargs: Any) -> Any:
+        if _TRACER is None:
+            return func(*args, **kwargs)
+
+        with _TRACER.record(operation=operation, interface=interface, member=member):
+            return func(*args, **kwargs)
+
+    return traced_func
@@ -260,6 +260,34 @@ def get_passphrase_fd(*, keyfile_path=None, verify=True) -> Tuple[int, int]:
     return (file_desc, fd_to_close)
 
 
+def get_passphrase_fds(*, keyfile_path=None) -> Callable[[], Tuple[int, int]]:
+    """
+    Get a passphrase either from stdin or from a file, for use in more than
+    one D-Bus call. The passphrase is read from stdin only once. A new file
+    descriptor is made for each call, since descriptors duplicated from one
+    another would share the offset of the key already read.
+
+    :param str keyfile_path: path to a keyfile, may be None
+    :return: a function returning a new file descriptor to pass on the
+             D-Bus, and what to close when done
+    """
+    if keyfile_path is not None:
+        (_, fd_to_close) = get_passphrase_fd(keyfile_path=keyfile_path)
+        os.close(fd_to_close)
+        return lambda: get_passphrase_fd(keyfile_path=keyfile_path)
+
+    password = get_pass("Enter passphrase followed by the return key: ")
+    if len(password) == 0:
+        raise StratisCliPassphraseEmptyError()
+
+    def pipe_fd() -> Tuple[int, int]:
+        (read, write) = os.pipe()
+        os.write(write, password.encode("utf-8"))
+        return (read, write)
+
+    return pipe_fd
+
+
 def fetch_stopped_pools_property(proxy: ProxyObject) -> Dictionary:
     """
     Fetch the StoppedPools property from stratisd.
@@ -0,0 +1,307 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Wait for a long-running pool operation to complete.
+"""
+
+import sys
+import time
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+from dbus.exceptions import DBusException
+
+from .._errors import (
+    StratisCliDeadlineError,
+    StratisCliEngineError,
+    StratisCliIncoherenceError,
+)
+from .._stratisd_constants import StratisdErrors
+from ._constants import MAXIMUM_DBUS_TIMEOUT, POOL_INTERFACE, SERVICE
+from ._introspect import SPECS
+from ._watch import ManagedObjectsWatcher, SignalLoop
+
+# Pool properties whose changes are displayed while waiting.
+_DISPLAYED_PROPERTIES = ("AvailableActions", "Encrypted", "LastReencryptedTimestamp")
+
+
+def _in_args(interface: str, method_name: str) -> Tuple[List[str], str]:
+    """
+    Get the names and the signature of the input arguments of a method.
+
+    :returns: the argument names and the D-Bus signature
+    """
+    method = ET.fromstring(SPECS[interface]).find(f"./method[@name='{method_name}']")
+    assert method is not None
+    in_args = method.findall("./arg[@direction='in']")
+    return (
+        [arg.attrib["name"] for arg in in_args],
+        "".join(arg.attrib["type"] for arg in in_args),
+    )
+
+
+def format_elapsed(seconds: float) -> str:
+    """
+    Format an elapsed time as [H:]MM:SS.
+    """
+    (minutes, seconds) = divmod(int(seconds), 60)
+    (hours, minutes) = divmod(minutes, 60)
+    return (
+        f"{hours}:{minutes:02}:{seconds:02}"
+        if hours > 0
+        else f"{minutes:02}:{seconds:02}"
+    )
+
+
+class Progress:
+    """
+    Displays the progress of an operation.
+
+    On a terminal, a status line that shows the elapsed time is kept up to
+    date. Otherwise, only the changes of status are written.
+    """
+
+    def __init__(self, description: str, stream: Any):
+        """
+        Initializer.
+
+        :param str description: what is being done
+        :param stream: the stream to write to
+        """
+        self._description = description
+        self._stream = stream
+        self._terminal = stream.isatty()
+        self._start = time.monotonic()
+        self._status = "in progress"
+
+        if not self._terminal:
+            self._write(f"{self._description}: {self._status}\n")
+
+    def _write(self, text: str):
+        self._stream.write(text)
+        self._stream.flush()
+
+    def _elapsed(self) -> str:
+        return format_elapsed(time.monotonic() - self._start)
+
+    def tick(self) -> bool:
+        """
+        Update the elapsed time on a terminal.
+
+        :returns: True, so that the update is repeated
+        """
+        if self._terminal:
+            self._write(
+                f"\r\x1b[2K{self._description}: {self._status} [{self._elapsed()}]"
+            )
+        return True
+
+    def note(self, message: str):
+        """
+        Write a message about the operation.
+        """
+        self._write(f"\r\x1b[2K{message}\n" if self._terminal else f"{message}\n")
+        self.tick()
+
+    def finish(self, outcome: str):
+        """
+        Write the outcome of the operation.
+        """
+        self._write(
+            ("\r\x1b[2K" if self._terminal else "")
+            + f"{self._description}: {outcome} after {self._elapsed()}\n"
+        )
+
+
+class _PoolOperation:
+    """
+    Follow a long-running pool operation until it completes or fails.
+    """
+
+    def __init__(
+        self,
+        signal_loop: SignalLoop,
+        pool_object_path: str,
+        completed: Callable[[Any], bool],
+        description: str,
+        *,
+        stream: Any = sys.stderr,
+    ):
+        """
+        Initializer.
+
+        :param signal_loop: the loop on which signals and replies are received
+        :param str pool_object_path: the pool's object path
+        :param completed: whether the pool's properties show that the
+                          operation is complete, given the pool as an MOPool
+        :param str description: what is being done
+        :param stream: the stream to which progress is written
+        """
+        from ._data import timeout  # noqa: PLC0415
+
+        self._signal_loop = signal_loop
+        self._pool_object_path = pool_object_path
+        self._completed = completed
+        self._description = description
+        self._displayed: Dict[str, Any] = {}
+        self.progress = Progress(description, stream)
+        self.outcome: str | None = None
+        self.watcher = ManagedObjectsWatcher(
+            signal_loop.bus, timeout, self.on_change, self.fail
+        )
+
+    def finish(self):
+        """
+        Stop waiting because the operation has completed.
+        """
+        if self.outcome is None:
+            self.outcome = "completed"
+            self.progress.finish(self.outcome)
+            self._signal_loop.quit()
+
+    def fail(self, error: BaseException):
+        """
+        Stop waiting because the operation has failed, or can not be followed.
+        """
+        if self.outcome is None:
+            self.outcome = "failed"
+            self.progress.finish(self.outcome)
+            self._signal_loop.fail(error)
+
+    def on_change(self):
+        """
+        Check the pool's properties when they change.
+        """
+        from ._data import MOPool  # noqa: PLC0415
+
+        if not self.watcher.received:
+            return
+
+        info = self.watcher.managed_objects.get(self._pool_object_path)
+        if info is None:
+            self.fail(
+                StratisCliIncoherenceError(
+                    f"The pool was removed during the operation: {self._description}"
+                )
+            )
+            return
+
+        props = info.get(POOL_INTERFACE, {})
+        for name in _DISPLAYED_PROPERTIES:
+            if name in self._displayed and self._displayed[name] != props.get(name):
+                self.progress.note(f"{name} changed to {props.get(name)}")
+            self._displayed[name] = props.get(name)
+
+        try:
+            if self._completed(MOPool(info)):
+                self.finish()
+        except Exception as err:  # noqa: BLE001
+            self.fail(err)
+
+    def on_reply(self, changed: bool, return_code: int, message: str):
+        """
+        Handle the result of the method.
+        """
+        if return_code != StratisdErrors.OK:
+            self.fail(StratisCliEngineError(return_code, message))
+        elif not changed:
+            self.fail(
+                StratisCliIncoherenceError(
+                    "stratisd reports that it did not perform the operation: "
+                    f"{self._description}"
+                )
+            )
+        else:
+            self.finish()
+
+    def on_error(self, error: BaseException):
+        """
+        Handle an error result of the method.
+
+        If the bus gave up waiting for the result, the operation is followed
+        by means of the pool's properties only.
+        """
+        if (
+            isinstance(error, DBusException)
+            and error.get_dbus_name() == "org.freedesktop.DBus.Error.NoReply"
+        ):
+            self.progress.note(
+                "stratisd did not reply in the time allowed by the bus; "
+                "waiting for the pool's properties to change"
+            )
+        else:
+            self.fail(error)
+
+
+def wait_for_pool_operation(  # noqa: PLR0913
+    pool_object_path: str,
+    method_name: str,
+    args: Mapping[str, Any],
+    *,
+    completed: Callable[[Any], bool],
+    description: str,
+    deadline: float | None = None,
+):
+    """
+    Call a long-running pool method and wait until the operation has
+    completed or failed, displaying its progress.
+
+    The operation has completed when the method returns successfully or when
+    the pool's properties show that it is complete. The latter is necessary
+    if the bus gives up waiting for the method to return.
+
+    :param str pool_object_path: the pool's object path
+    :param str method_name: the name of the method
+    :param args: the arguments of the method, keyed by name
+    :param completed: whether the pool's properties show that the operation
+                      is complete, given the pool as an MOPool
+    :param str description: what is being done, e.g., "Encrypting pool p"
+    :param deadline: the time allowed in seconds, or None for no limit
+    :raises StratisCliDeadlineError:
+    :raises StratisCliEngineError:
+    :raises StratisCliIncoherenceError:
+    :raises StratisCliSignalsUnavailableError:
+    """
+    signal_loop = SignalLoop()
+    operation = _PoolOperation(signal_loop, pool_object_path, completed, description)
+
+    # Subscribe to the signals before the operation is started.
+    operation.watcher.start()
+
+    (names, signature) = _in_args(POOL_INTERFACE, method_name)
+    signal_loop.bus.get_object(
+        SERVICE, pool_object_path, introspect=False
+    ).get_dbus_method(method_name, dbus_interface=POOL_INTERFACE)(
+        *(args[name] for name in names),
+        signature=signature,
+        timeout=MAXIMUM_DBUS_TIMEOUT,
+        reply_handler=operation.on_reply,
+        error_handler=operation.on_error,
+    )
+
+    def expire() -> bool:
+        operation.fail(StratisCliDeadlineError(description, deadline))
+        return False
+
+    operation.progress.tick()
+    signal_loop.call_later(1, operation.progress.tick)
+    if deadline is not None:
+        signal_loop.call_later(deadline, expire)
+
+    signal_loop.run()
+
+    # The loop is only stopped without an outcome if it is interrupted.
+    if operation.outcome is None:
+        operation.progress.finish("interrupted")
+        raise KeyboardInterrupt()
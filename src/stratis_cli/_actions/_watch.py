@@ -0,0 +1,454 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Redisplay a table as the D-Bus objects that it lists change.
+"""
+
+import sys
+import time
+from io import StringIO
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+from .._errors import StratisCliSignalsUnavailableError
+from ._connection import Bus
+from ._constants import SERVICE, TOP_OBJECT
+from ._formatting import print_table
+
+OBJECT_MANAGER_INTERFACE = "org.freedesktop.DBus.ObjectManager"
+PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+
+
+def get_mainloop() -> Tuple[Any, Any]:
+    """
+    Get the GLib module and a dbus-python main loop which uses it.
+
+    :raises StratisCliSignalsUnavailableError:
+    """
+    try:
+        from dbus.mainloop.glib import DBusGMainLoop  # noqa: PLC0415
+        from gi.repository import GLib  # noqa: PLC0415
+    except ImportError as err:
+        raise StratisCliSignalsUnavailableError(str(err)) from err
+
+    return (GLib, DBusGMainLoop())
+
+
+def _pool_of(info: Mapping[str, Mapping[str, Any]]) -> Any:
+    """
+    Get the object path of the pool to which an object belongs.
+
+    :param info: the interfaces and properties of the object
+    :returns: the pool object path or None if the object is not in a pool
+    """
+    return next((props["Pool"] for props in info.values() if "Pool" in props), None)
+
+
+class ManagedObjectsWatcher:
+    """
+    Keep a GetManagedObjects result up to date using the signals that
+    stratisd sends when its objects change.
+    """
+
+    def __init__(
+        self,
+        bus: Any,
+        timeout: int,
+        on_change: Callable[[], None],
+        on_error: Callable[[BaseException], None],
+    ):
+        """
+        Initializer.
+
+        :param bus: a bus connection with a main loop
+        :param int timeout: the D-Bus timeout in seconds
+        :param on_change: called whenever an object changes
+        :param on_error: called if stratisd can not be queried
+        """
+        self._bus = bus
+        self._timeout = timeout
+        self._on_change = on_change
+        self._on_error = on_error
+        self.managed_objects: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.received = False
+        self._changed: set = set()
+
+    def start(self):
+        """
+        Subscribe to the signals, then request the objects.
+
+        The request is asynchronous, so that signals sent before the result
+        are handled before it and signals sent after it are handled after it.
+        """
+        self._bus.add_signal_receiver(
+            self.interfaces_added,
+            signal_name="InterfacesAdded",
+            dbus_interface=OBJECT_MANAGER_INTERFACE,
+            bus_name=SERVICE,
+            path=TOP_OBJECT,
+        )
+        self._bus.add_signal_receiver(
+            self.interfaces_removed,
+            signal_name="InterfacesRemoved",
+            dbus_interface=OBJECT_MANAGER_INTERFACE,
+            bus_name=SERVICE,
+            path=TOP_OBJECT,
+        )
+        self._bus.add_signal_receiver(
+            self.properties_changed,
+            signal_name="PropertiesChanged",
+            dbus_interface=PROPERTIES_INTERFACE,
+            bus_name=SERVICE,
+            path_keyword="object_path",
+        )
+        self._bus.get_object(SERVICE, TOP_OBJECT, introspect=False).GetManagedObjects(
+            dbus_interface=OBJECT_MANAGER_INTERFACE,
+            timeout=self._timeout,
+            reply_handler=self.managed_objects_received,
+            error_handler=self._on_error,
+        )
+
+    def _changed_object(self, object_path: str):
+        """
+        Record that an object, and so possibly the pool it belongs to, changed.
+        """
+        self._changed.add(object_path)
+        info = self.managed_objects.get(object_path)
+        if info is not None:
+            pool = _pool_of(info)
+            if pool is not None:
+                self._changed.add(pool)
+
+    def managed_objects_received(self, managed_objects: Mapping[str, Any]):
+        """
+        Handle the GetManagedObjects result.
+        """
+        self._changed.update(self.managed_objects)
+        self.managed_objects = {
+            str(object_path): {
+                str(interface): dict(props) for (interface, props) in info.items()
+            }
+            for (object_path, info) in managed_objects.items()
+        }
+        self._changed.update(self.managed_objects)
+        self.received = True
+        self._on_change()
+
+    def interfaces_added(self, object_path: str, interfaces: Mapping[str, Any]):
+        """
+        Handle the InterfacesAdded signal.
+        """
+        info = self.managed_objects.setdefault(str(object_path), {})
+        for interface, props in interfaces.items():
+            info[str(interface)] = dict(props)
+        self._changed_object(str(object_path))
+        self._on_change()
+
+    def interfaces_removed(self, object_path: str, interfaces: List[str]):
+        """
+        Handle the InterfacesRemoved signal.
+        """
+        object_path = str(object_path)
+        if object_path not in self.managed_objects:
+            return
+
+        self._changed_object(object_path)
+        info = self.managed_objects[object_path]
+        for interface in interfaces:
+            info.pop(str(interface), None)
+        if info == {}:
+            del self.managed_objects[object_path]
+        self._on_change()
+
+    def properties_changed(
+        self,
+        interface: str,
+        changed: Mapping[str, Any],
+        invalidated: List[str],
+        *,
+        object_path: str,
+    ):
+        """
+        Handle the PropertiesChanged signal.
+
+        The values of invalidated properties are requested asynchronously;
+        until they are received, the previous values are kept. If the request
+        fails, the object is most likely being removed, and its removal is
+        signaled separately.
+        """
+        object_path = str(object_path)
+        interface = str(interface)
+        props = self.managed_objects.get(object_path, {}).get(interface)
+        if props is None:
+            return
+
+        # A change to the Pool property moves the object out of a pool as
+        # well as into one.
+        self._changed_object(object_path)
+        props.update(changed)
+        self._changed_object(object_path)
+
+        if invalidated:
+            self._bus.get_object(SERVICE, object_path, introspect=False).GetAll(
+                interface,
+                dbus_interface=PROPERTIES_INTERFACE,
+                timeout=self._timeout,
+                reply_handler=lambda values: self.properties_changed(
+                    interface, values, [], object_path=object_path
+                ),
+                error_handler=lambda _: None,
+            )
+
+        self._on_change()
+
+    def take_changed(self) -> frozenset:
+        """
+        Get the object paths of the objects that changed since the previous
+        call, together with the objects that belong to a changed pool.
+        """
+        changed = self._changed
+        self._changed = set()
+        return frozenset(changed).union(
+            object_path
+            for (object_path, info) in self.managed_objects.items()
+            if _pool_of(info) in changed
+        )
+
+
+class Screen:
+    """
+    Displays successive versions of a table.
+
+    On a terminal, only the lines that differ from the previous version are
+    written. Otherwise, every version is written in full, followed by an
+    empty line.
+    """
+
+    def __init__(self, stream: Any):
+        """
+        Initializer.
+
+        :param stream: the stream to write to
+        """
+        self._stream = stream
+        self._terminal = stream.isatty()
+        self._lines: List[str] | None = None
+
+    def show(self, lines: List[str]):
+        """
+        Display a version of the table.
+
+        :param lines: the lines of the table
+        """
+        previous = self._lines
+        if previous == lines:
+            return
+        self._lines = lines
+
+        if not self._terminal:
+            self._stream.write("".join(f"{line}\n" for line in lines) + "\n")
+        elif previous is None:
+            self._stream.write("".join(f"{line}\n" for line in lines))
+        else:
+            output = [f"\x1b[{len(previous)}F"] if previous else []
+            for index, line in enumerate(lines):
+                if index < len(previous) and previous[index] == line:
+                    output.append("\n")
+                else:
+                    output.append(f"\x1b[2K{line}\n")
+            if len(lines) < len(previous):
+                output.append("\x1b[J")
+            self._stream.write("".join(output))
+
+        self._stream.flush()
+
+
+def table_lines(
+    headings: List[str], rows: List[Tuple[str, ...]], alignment: List[str]
+) -> List[str]:
+    """
+    Get the lines of a table as print_table would print them.
+    """
+    output = StringIO()
+    print_table(headings, rows, alignment, file=output)
+    return output.getvalue().splitlines()
+
+
+class SignalLoop:
+    """
+    A GLib main loop, with a bus connection on which it receives signals,
+    that runs until interrupted or until an error occurs.
+    """
+
+    def __init__(self):
+        """
+        Initializer.
+
+        :raises StratisCliSignalsUnavailableError:
+        """
+        (self._glib, mainloop) = get_mainloop()
+        self._loop = self._glib.MainLoop()
+        self.bus = Bus.get_signal_bus(mainloop)
+        self.error: BaseException | None = None
+
+    def call_later(self, delay: float, func: Callable[[], bool]):
+        """
+        Call func once after delay seconds, or repeatedly if it returns True.
+        """
+        self._glib.timeout_add(int(delay * 1000), func)
+
+    def fail(self, error: BaseException):
+        """
+        Stop the loop because of an error.
+        """
+        if self.error is None:
+            self.error = error
+        self._loop.quit()
+
+    def quit(self):
+        """
+        Stop the loop.
+        """
+        self._loop.quit()
+
+    def run(self, *, propagate_interrupt: bool = False):
+        """
+        Run the loop until it is stopped or interrupted.
+
+        :param bool propagate_interrupt: whether to raise KeyboardInterrupt
+                                         if the loop is interrupted
+        :raises Exception: the error that stopped the loop
+        """
+        try:
+            self._loop.run()
+        except KeyboardInterrupt:
+            if propagate_interrupt:
+                raise
+            return
+
+        if self.error is not None:
+            raise self.error
+
+
+class _TableWatch:
+    """
+    Redraw a table when the objects that it lists change.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        signal_loop: SignalLoop,
+        headings: List[str],
+        alignment: List[str],
+        sort_key: Callable,
+        rows: Callable,
+        *,
+        throttle: float,
+        stream: Any,
+    ):
+        self._signal_loop = signal_loop
+        self._headings = headings
+        self._alignment = alignment
+        self._sort_key = sort_key
+        self._rows = rows
+        self._throttle = throttle
+        self._screen = Screen(stream)
+        self._table: Dict[str, Tuple[str, ...]] = {}
+        self._scheduled = False
+        self._last_redraw: float | None = None
+        self.watcher: ManagedObjectsWatcher | None = None
+
+    def schedule(self):
+        """
+        Schedule a redraw, no sooner than throttle seconds after the last one.
+        """
+        if self._scheduled or self._signal_loop.error is not None:
+            return
+
+        delay = (
+            0.0
+            if self._last_redraw is None
+            else max(0.0, self._last_redraw + self._throttle - time.monotonic())
+        )
+        self._signal_loop.call_later(delay, self.redraw)
+        self._scheduled = True
+
+    def redraw(self) -> bool:
+        """
+        Recalculate the rows of the changed objects and redraw the table.
+
+        :returns: False, so that the redraw is not repeated
+        """
+        assert self.watcher is not None
+
+        self._scheduled = False
+        try:
+            changed = self.watcher.take_changed()
+            for object_path in changed:
+                self._table.pop(object_path, None)
+            self._table.update(self._rows(self.watcher.managed_objects, changed))
+            self._screen.show(
+                table_lines(
+                    self._headings,
+                    sorted(self._table.values(), key=self._sort_key),
+                    self._alignment,
+                )
+            )
+        except Exception as err:  # noqa: BLE001
+            self._signal_loop.fail(err)
+
+        self._last_redraw = time.monotonic()
+        return False
+
+
+def watch_table(  # noqa: PLR0913
+    headings: List[str],
+    alignment: List[str],
+    sort_key: Callable,
+    rows: Callable,
+    *,
+    throttle: float,
+    stream: Any = sys.stdout,
+):
+    """
+    Display a table and redraw it as the objects that it lists change, until
+    interrupted.
+
+    :param headings: the column headings
+    :param alignment: the alignment of each column
+    :param sort_key: the key by which rows are sorted
+    :param rows: calculates rows keyed by object path from a GetManagedObjects
+                 result and the object paths of the objects that changed
+    :param float throttle: the minimum interval between redraws in seconds
+    :param stream: the stream to write to
+    :raises StratisCliSignalsUnavailableError:
+    """
+    from ._data import timeout  # noqa: PLC0415
+
+    signal_loop = SignalLoop()
+
+    table_watch = _TableWatch(
+        signal_loop,
+        headings,
+        alignment,
+        sort_key,
+        rows,
+        throttle=throttle,
+        stream=stream,
+    )
+    table_watch.watcher = ManagedObjectsWatcher(
+        signal_loop.bus, timeout, table_watch.schedule, signal_loop.fail
+    )
+    table_watch.watcher.start()
+
+    signal_loop.run()
@@ -42,8 +42,13 @@ from ._actions import (
 )
 from ._errors import (
     StratisCliActionError,
+    StratisCliBatchError,
+    StratisCliDeadlineError,
     StratisCliEngineError,
+    StratisCliFreezeError,
     StratisCliIncoherenceError,
+    StratisCliJobFailedError,
+    StratisCliSignalsUnavailableError,
     StratisCliStratisdVersionError,
     StratisCliSynthUeventError,
     StratisCliUnknownInterfaceError,
@@ -109,6 +114,19 @@ def _interpret_errors_0(error: dbus.exceptions.DBusException) -> Optional[str]:
             "Most likely stratis has insufficient permissions for the action requested."
         )
 
+    # These are raised on connecting to the bus, which is most likely to fail
+    # if the address of a bus other than the system bus was specified.
+    if dbus_name in (
+        "org.freedesktop.DBus.Error.BadAddress",
+        "org.freedesktop.DBus.Error.FileNotFound",
+        "org.freedesktop.DBus.Error.NoServer",
+    ):  # pragma: no cover
+        return (
+            "Most likely stratis is unable to connect to the D-Bus message "
+            "bus. Check the address of the bus, if one was specified with "
+            "--bus-address or STRATIS_DBUS_ADDRESS."
+        )
+
     # We have observed three causes of this problem. The first is that
     # stratisd is not running at all. The second is that stratisd has not
     # yet established its D-Bus service. The third is that stratisd is
@@ -216,6 +234,35 @@ def _interpret_errors_1(errors: List[BaseException]) -> Optional[str]:  # noqa:
             f"of the command that you requested: {error}"
         )
 
+    if isinstance(error, StratisCliDeadlineError):
+        return (
+            f"{error}. stratis stopped waiting, but stratisd may still be "
+            "performing the operation."
+        )
+
+    if isinstance(error, StratisCliBatchError):
+        return (
+            f"{error}. The result for each is shown in the summary; the "
+            "operation was performed for the others."
+        )
+
+    if isinstance(error, StratisCliFreezeError):
+        return (
+            f"{error}. The filesystem may still be frozen; thaw it with "
+            f"fsfreeze --unfreeze {error.mount_point}."
+            if error.operation == "thaw"
+            else f"{error}. No snapshot was taken and no filesystem remains frozen."
+        )
+
+    if isinstance(error, StratisCliJobFailedError):
+        return (
+            f"Not every job succeeded: {error}. The output of a job is "
+            "shown by stratis job status."
+        )
+
+    if isinstance(error, StratisCliSignalsUnavailableError):
+        return f"stratis could not watch for changes. {error}."
+
     if isinstance(error, StratisCliSynthUeventError):
         return (
             f"stratis reported an error in generating a synthetic "
@@ -370,6 +417,17 @@ def _interpret_errors(errors: List[BaseException]) -> Optional[str]:
         return None
 
 
+def explain_error(err: StratisCliActionError) -> Optional[str]:
+    """
+    Get an explanation of the given error, which may be the head of an error
+    chain.
+
+    :param Exception err: an exception
+    :returns: None if no interpretation found, otherwise str
+    """
+    return _interpret_errors(list(get_errors(err)))
+
+
 def handle_error(err: StratisCliActionError):
     """
     Do the right thing with the given error, which may be the head of an error
@@ -378,9 +436,7 @@ def handle_error(err: StratisCliActionError):
     :param Exception err: an exception
     """
 
-    errors = list(get_errors(err))
-
-    explanation = _interpret_errors(errors)
+    explanation = explain_error(err)
 
     # The goal is to have an explanation for every error chain. If there is
     # none, then this will rapidly be fixed, so it will be difficult to
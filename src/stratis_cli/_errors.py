@@ -308,6 +308,84 @@ class StratisCliKeyfileNotFoundError(StratisCliUserError):
         return f'There is no keyfile at the path "{self.keyfile_path}"'
 
 
+class StratisCliReportFileError(StratisCliUserError):
+    """
+    Raised if the user specified a location for saved reports that could
+    not be read or written.
+    """
+
+    def __init__(self, report_path, reason):
+        """
+        Initializer.
+
+        :param str report_path: the path of the report or report directory
+        :param str reason: why the path could not be used
+        """
+        self.report_path = report_path
+        self.reason = reason
+
+    def __str__(self):
+        return f'Could not use the saved report at "{self.report_path}": {self.reason}'
+
+
+class StratisCliJobNotFoundError(StratisCliUserError):
+    """
+    Raised if the user specified a job that has not been recorded.
+    """
+
+    def __init__(self, job_id):
+        """
+        Initializer.
+
+        :param str job_id: the unfound job id
+        """
+        self.job_id = job_id
+
+    def __str__(self):
+        return f'There is no job with id "{self.job_id}"'
+
+
+class StratisCliJobFileError(StratisCliUserError):
+    """
+    Raised if the record of a job could not be read or written.
+    """
+
+    def __init__(self, job_path, reason):
+        """
+        Initializer.
+
+        :param str job_path: the path of the job record or job directory
+        :param str reason: why the path could not be used
+        """
+        self.job_path = job_path
+        self.reason = reason
+
+    def __str__(self):
+        return f'Could not use the job record at "{self.job_path}": {self.reason}'
+
+
+class StratisCliReencryptQueueError(StratisCliUserError):
+    """
+    Raised if the reencryption queue could not be read, written, or locked.
+    """
+
+    def __init__(self, queue_path, reason):
+        """
+        Initializer.
+
+        :param str queue_path: the path of the queue file
+        :param str reason: why the queue could not be used
+        """
+        self.queue_path = queue_path
+        self.reason = reason
+
+    def __str__(self):
+        return (
+            f'Could not use the reencryption queue at "{self.queue_path}": '
+            f"{self.reason}"
+        )
+
+
 class StratisCliUnknownInterfaceError(StratisCliRuntimeError):
     """
     Error raised when code encounters an unexpected D-Bus interface name.
@@ -325,6 +403,120 @@ class StratisCliUnknownInterfaceError(StratisCliRuntimeError):
         return f"unexpected interface name {self._interface_name}"
 
 
+class StratisCliSignalsUnavailableError(StratisCliRuntimeError):
+    """
+    Raised if D-Bus signals can not be received because the GLib main loop
+    is not available.
+    """
+
+    def __init__(self, reason):
+        """
+        Initializer.
+
+        :param reason: why the main loop is not available
+        """
+        self.reason = reason
+
+    def __str__(self):
+        return (
+            "Receiving D-Bus signals requires the GLib main loop, which is "
+            f"provided by PyGObject, but it could not be loaded: {self.reason}"
+        )
+
+
+class StratisCliDeadlineError(StratisCliRuntimeError):
+    """
+    Raised if an operation did not complete by the deadline.
+    """
+
+    def __init__(self, operation, deadline):
+        """
+        Initializer.
+
+        :param str operation: the operation
+        :param float deadline: the time allowed, in seconds
+        """
+        self.operation = operation
+        self.deadline = deadline
+
+    def __str__(self):
+        return (
+            f"{self.operation} did not complete within the time allowed, "
+            f"{self.deadline:g} seconds"
+        )
+
+
+class StratisCliJobFailedError(StratisCliRuntimeError):
+    """
+    Raised if a job that was waited for did not succeed.
+    """
+
+    def __init__(self, failed):
+        """
+        Initializer.
+
+        :param failed: the id, the state, and the message of each job that
+                       did not succeed
+        :type failed: list of (str * str * str)
+        """
+        self.failed = failed
+
+    def __str__(self):
+        return "; ".join(
+            f"job {job_id} {state}: {message}"
+            for (job_id, state, message) in self.failed
+        )
+
+
+class StratisCliBatchError(StratisCliRuntimeError):
+    """
+    Raised if an operation performed on many items failed for some of them.
+    """
+
+    def __init__(self, operation, failed, total):
+        """
+        Initializer.
+
+        :param str operation: the operation
+        :param failed: the item and the error message of each failure
+        :type failed: list of (str * str)
+        :param int total: the number of items on which it was performed
+        """
+        self.operation = operation
+        self.failed = failed
+        self.total = total
+
+    def __str__(self):
+        return (
+            f"{self.operation} failed for {len(self.failed)} of {self.total}: "
+            + "; ".join(f"{item}: {message}" for (item, message) in self.failed)
+        )
+
+
+class StratisCliFreezeError(StratisCliRuntimeError):
+    """
+    Raised if a mounted filesystem could not be frozen or thawed.
+    """
+
+    def __init__(self, operation, mount_point, error):
+        """
+        Initializer.
+
+        :param str operation: "freeze" or "thaw"
+        :param str mount_point: the mount point of the filesystem
+        :param OSError error: the error
+        """
+        self.operation = operation
+        self.mount_point = mount_point
+        self.error = error
+
+    def __str__(self):
+        return (
+            f"Could not {self.operation} the filesystem mounted at "
+            f"{self.mount_point}: {self.error.strerror}"
+        )
+
+
 class StratisCliEngineError(StratisCliRuntimeError):
     """
     Raised if there was a failure due to an error in stratisd's engine.
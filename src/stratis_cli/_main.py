@@ -19,31 +19,46 @@ from typing import Callable
 
 import justbytes as jb
 
+from ._actions import in_job, set_bus_address, set_deadline, start_job, trace_dbus
 from ._error_reporting import handle_error
 from ._errors import StratisCliActionError, StratisCliEnvironmentError
 from ._parser import gen_parser
+from ._profile import Profiler
 
 
 def run() -> Callable:
     """
     Generate a function that parses arguments and executes.
     """
+    # A profile requested by the environment includes generating the parser.
+    environment_profiler = Profiler.from_environment()
+    if environment_profiler is not None:
+        environment_profiler.start("generating the parser")
+
     parser = gen_parser()
 
     # Set default configuration parameters for display of sizes, i.e., values
     # that are generally given in bytes or some multiple thereof.
     jb.Config.set_display_config(jb.DisplayConfig(show_approx_str=False))
 
-    def the_func(command_line_args):
+    def run_command(command_line_args, namespace):
         """
-        Run according to the arguments passed.
+        Run the command specified by the parsed arguments.
         """
-        namespace = parser.parse_args(command_line_args)
-
         post_parser = getattr(namespace, "post_parser", None)
         if post_parser is not None:
             post_parser(namespace).verify(namespace, parser)
 
+        trace_dbus(namespace.trace_dbus)
+
+        set_deadline(namespace.deadline)
+
+        set_bus_address(namespace.bus_address)
+
+        # The job runs the command again, in the background.
+        if getattr(namespace, "run_async", False) and not in_job():
+            namespace.func = lambda _: start_job(command_line_args)
+
         try:
             try:
                 namespace.func(namespace)
@@ -71,4 +86,26 @@ def run() -> Callable:
 
         return 0
 
+    def the_func(command_line_args):
+        """
+        Run according to the arguments passed.
+        """
+        profiler = environment_profiler
+        if profiler is not None:
+            profiler.next_phase("parsing the command line")
+
+        try:
+            namespace = parser.parse_args(command_line_args)
+
+            if profiler is None and namespace.profile is not None:
+                profiler = Profiler(namespace.profile, memory=namespace.profile_memory)
+                profiler.start("running the command")
+            elif profiler is not None:
+                profiler.next_phase("running the command")
+
+            return run_command(command_line_args, namespace)
+        finally:
+            if profiler is not None:
+                profiler.stop()
+
     return the_func
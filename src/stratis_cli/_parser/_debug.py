@@ -29,6 +29,7 @@ TOP_DEBUG_SUBCMDS = [
         {
             "help": "Refresh all un-stopped pools.",
             "func": TopDebugActions.refresh_state,
+            "mutates": True,
         },
     ),
     (
@@ -37,6 +38,7 @@ TOP_DEBUG_SUBCMDS = [
             "help": "Generate a synthetic uevent.",
             "args": [("device", {"help": "Path to device"})],
             "func": TopDebugActions.send_uevent,
+            "mutates": True,
         },
     ),
 ]
@@ -16,19 +16,25 @@ Encryption command-line parser for Stratis CLI.
 """
 
 import copy
-from argparse import SUPPRESS, Namespace
+from argparse import SUPPRESS, ArgumentParser, Namespace
 
 from .._actions import BindActions, CryptActions, RebindActions
 from .._constants import Clevis, EncryptionMethod
 from ._shared import (
+    ASYNC,
+    BATCH,
+    BATCH_JSON,
     CLEVIS_AND_KERNEL,
     IN_PLACE,
     TRUST_URL_OR_THUMBPRINT,
     UUID_OR_NAME,
+    WAIT,
     ClevisEncryptionOptions,
+    DefaultAction,
     MoveNotice,
     RejectAction,
     ensure_nat,
+    ensure_positive,
 )
 
 
@@ -57,6 +63,100 @@ class ClevisEncryptionOptionsForTpm2(ClevisEncryptionOptions):
         super().__init__(namespace)
 
 
+class EncryptedPoolsOptions:
+    """
+    Verifies the options specified on a command that may select many
+    encrypted pools with --all-encrypted or --match.
+    """
+
+    def __init__(self, _namespace: Namespace):
+        pass
+
+    def verify(self, namespace: Namespace, parser: ArgumentParser):
+        """
+        Verify that the options that only apply to many pools are specified
+        only when many pools are selected.
+        """
+        if (
+            not namespace.all_encrypted
+            and namespace.match is None
+            and (not getattr(namespace, "jobs_default", True) or namespace.as_json)
+        ):
+            parser.error("--jobs and --json require --all-encrypted or --match.")
+
+
+class BindOptionsForTang:
+    """
+    Gathers and verifies the options specified on pool encryption bind nbde.
+    """
+
+    def __init__(self, namespace: Namespace):
+        self.clevis_encryption_options = ClevisEncryptionOptionsForTang(namespace)
+        self.encrypted_pools_options = EncryptedPoolsOptions(namespace)
+
+    def verify(self, namespace: Namespace, parser: ArgumentParser):
+        """
+        Verify that the command line is formed correctly.
+        """
+        self.clevis_encryption_options.verify(namespace, parser)
+        self.encrypted_pools_options.verify(namespace, parser)
+
+
+class BindOptionsForTpm2:
+    """
+    Gathers and verifies the options specified on pool encryption bind tpm2.
+    """
+
+    def __init__(self, namespace: Namespace):
+        self.clevis_encryption_options = ClevisEncryptionOptionsForTpm2(namespace)
+        self.encrypted_pools_options = EncryptedPoolsOptions(namespace)
+
+    def verify(self, namespace: Namespace, parser: ArgumentParser):
+        """
+        Verify that the command line is formed correctly.
+        """
+        self.clevis_encryption_options.verify(namespace, parser)
+        self.encrypted_pools_options.verify(namespace, parser)
+
+
+class ReencryptOptions:
+    """
+    Verifies the options specified on pool encryption reencrypt.
+    """
+
+    def __init__(self, _namespace: Namespace):
+        pass
+
+    def verify(self, namespace: Namespace, parser: ArgumentParser):
+        """
+        Verify that the options that only apply to many pools are specified
+        only when many pools are selected.
+        """
+        if (
+            not namespace.all_encrypted
+            and namespace.match is None
+            and (
+                not getattr(namespace, "max_inflight_default", True)
+                or namespace.as_json
+            )
+        ):
+            parser.error(
+                "--max-inflight and --json require --all-encrypted or --match."
+            )
+
+
+# Alternatives to UUID_OR_NAME that select many encrypted pools
+ENCRYPTED_POOLS = [
+    ("--all-encrypted", {"action": "store_true", "help": "Every encrypted pool"}),
+    (
+        "--match",
+        {
+            "metavar": "PATTERN",
+            "help": "The encrypted pools whose names match the glob PATTERN",
+        },
+    ),
+]
+
 BIND_SUBCMDS = [
     (
         str(Clevis.NBDE),
@@ -89,6 +189,7 @@ BIND_SUBCMDS = [
                 MoveNotice("nbde", "pool bind", "pool encryption bind", "3.10.0")
             ),
             "func": BindActions.bind_clevis,
+            "mutates": True,
         },
     ),
     (
@@ -111,6 +212,7 @@ BIND_SUBCMDS = [
                 MoveNotice("tpm2", "pool bind", "pool encryption bind", "3.10.0")
             ),
             "func": BindActions.bind_clevis,
+            "mutates": True,
         },
     ),
     (
@@ -125,6 +227,7 @@ BIND_SUBCMDS = [
                 MoveNotice("keyring", "pool bind", "pool encryption bind", "3.10.0")
             ),
             "func": BindActions.bind_keyring,
+            "mutates": True,
         },
     ),
 ]
@@ -154,6 +257,7 @@ REBIND_SUBCMDS = [
                 MoveNotice("clevis", "pool rebind", "pool encryption rebind", "3.10.0")
             ),
             "func": RebindActions.rebind_clevis,
+            "mutates": True,
         },
     ),
     (
@@ -182,6 +286,7 @@ REBIND_SUBCMDS = [
                 MoveNotice("keyring", "pool rebind", "pool encryption rebind", "3.10.0")
             ),
             "func": RebindActions.rebind_keyring,
+            "mutates": True,
         },
     ),
 ]
@@ -196,19 +301,22 @@ BIND_SUBCMDS_ENCRYPTION = [
                     "--post-parser",
                     {
                         "action": RejectAction,
-                        "default": ClevisEncryptionOptionsForTang,
+                        "default": BindOptionsForTang,
                         "help": SUPPRESS,
                         "nargs": "?",
                     },
                 ),
                 ("url", {"help": "URL of tang server"}),
-            ],
+            ]
+            + BATCH,
             "groups": [
                 (
                     "Pool Identifier",
                     {
-                        "description": "Choose one option to specify the pool to bind",
-                        "mut_ex_args": [(True, UUID_OR_NAME)],
+                        "description": (
+                            "Choose one option to specify the pool or pools to bind"
+                        ),
+                        "mut_ex_args": [(True, UUID_OR_NAME + ENCRYPTED_POOLS)],
                     },
                 ),
                 (
@@ -221,6 +329,7 @@ BIND_SUBCMDS_ENCRYPTION = [
             ],
             "aliases": [str(Clevis.TANG)],
             "func": BindActions.bind_clevis,
+            "mutates": True,
         },
     ),
     (
@@ -232,22 +341,26 @@ BIND_SUBCMDS_ENCRYPTION = [
                     "--post-parser",
                     {
                         "action": RejectAction,
-                        "default": ClevisEncryptionOptionsForTpm2,
+                        "default": BindOptionsForTpm2,
                         "help": SUPPRESS,
                         "nargs": "?",
                     },
                 )
-            ],
+            ]
+            + BATCH,
             "groups": [
                 (
                     "Pool Identifier",
                     {
-                        "description": "Choose one option to specify the pool to bind",
-                        "mut_ex_args": [(True, UUID_OR_NAME)],
+                        "description": (
+                            "Choose one option to specify the pool or pools to bind"
+                        ),
+                        "mut_ex_args": [(True, UUID_OR_NAME + ENCRYPTED_POOLS)],
                     },
                 )
             ],
             "func": BindActions.bind_clevis,
+            "mutates": True,
         },
     ),
     (
@@ -258,13 +371,28 @@ BIND_SUBCMDS_ENCRYPTION = [
                 (
                     "Pool Identifier",
                     {
-                        "description": "Choose one option to specify the pool to bind",
-                        "mut_ex_args": [(True, UUID_OR_NAME)],
+                        "description": (
+                            "Choose one option to specify the pool or pools to bind"
+                        ),
+                        "mut_ex_args": [(True, UUID_OR_NAME + ENCRYPTED_POOLS)],
                     },
                 )
             ],
-            "args": [("keydesc", {"help": "key description"})],
+            "args": [
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": EncryptedPoolsOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
+                ("keydesc", {"help": "key description"}),
+            ]
+            + BATCH,
             "func": BindActions.bind_keyring,
+            "mutates": True,
         },
     ),
 ]
@@ -280,12 +408,23 @@ REBIND_SUBCMDS_ENCRYPTION = [
                 (
                     "Pool Identifier",
                     {
-                        "description": "Choose one option to specify the pool to rebind",
-                        "mut_ex_args": [(True, UUID_OR_NAME)],
+                        "description": (
+                            "Choose one option to specify the pool or pools to rebind"
+                        ),
+                        "mut_ex_args": [(True, UUID_OR_NAME + ENCRYPTED_POOLS)],
                     },
                 )
             ],
             "args": [
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": EncryptedPoolsOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
                 (
                     "--token-slot",
                     {
@@ -296,9 +435,11 @@ REBIND_SUBCMDS_ENCRYPTION = [
                         ),
                         "type": ensure_nat,
                     },
-                )
-            ],
+                ),
+            ]
+            + BATCH,
             "func": RebindActions.rebind_clevis,
+            "mutates": True,
         },
     ),
     (
@@ -312,12 +453,23 @@ REBIND_SUBCMDS_ENCRYPTION = [
                 (
                     "Pool Identifier",
                     {
-                        "description": "Choose one option to specify the pool to rebind",
-                        "mut_ex_args": [(True, UUID_OR_NAME)],
+                        "description": (
+                            "Choose one option to specify the pool or pools to rebind"
+                        ),
+                        "mut_ex_args": [(True, UUID_OR_NAME + ENCRYPTED_POOLS)],
                     },
                 )
             ],
             "args": [
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": EncryptedPoolsOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
                 ("keydesc", {"help": "key description"}),
                 (
                     "--token-slot",
@@ -330,8 +482,10 @@ REBIND_SUBCMDS_ENCRYPTION = [
                         "type": ensure_nat,
                     },
                 ),
-            ],
+            ]
+            + BATCH,
             "func": RebindActions.rebind_keyring,
+            "mutates": True,
         },
     ),
 ]
@@ -352,7 +506,9 @@ ENCRYPTION_SUBCMDS = [
                     },
                 )
             ]
-            + IN_PLACE,
+            + IN_PLACE
+            + WAIT
+            + ASYNC,
             "groups": [
                 (
                     "Pool Identifier",
@@ -377,13 +533,14 @@ ENCRYPTION_SUBCMDS = [
                 ),
             ],
             "func": CryptActions.encrypt,
+            "mutates": True,
         },
     ),
     (
         "off",
         {
             "help": "Make unencrypted a previously encrypted pool",
-            "args": IN_PLACE,
+            "args": IN_PLACE + WAIT + ASYNC,
             "groups": [
                 (
                     "Pool Identifier",
@@ -394,23 +551,55 @@ ENCRYPTION_SUBCMDS = [
                 )
             ],
             "func": CryptActions.unencrypt,
+            "mutates": True,
         },
     ),
     (
         "reencrypt",
         {
             "help": "Reencrypt an encrypted pool with a new master key",
-            "args": IN_PLACE,
+            "args": IN_PLACE
+            + WAIT
+            + ASYNC
+            + [
+                (
+                    "--max-inflight",
+                    {
+                        "action": DefaultAction,
+                        "type": ensure_positive,
+                        "default": 1,
+                        "metavar": "N",
+                        "help": (
+                            "Reencrypt at most N pools at once; pools that "
+                            "share a disk are never reencrypted at once"
+                        ),
+                    },
+                ),
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": ReencryptOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
+            ]
+            + BATCH_JSON,
             "groups": [
                 (
                     "Pool Identifier",
                     {
-                        "description": "Choose one option to specify the pool",
-                        "mut_ex_args": [(True, UUID_OR_NAME)],
+                        "description": (
+                            "Choose one option to specify the pool or pools to "
+                            "reencrypt"
+                        ),
+                        "mut_ex_args": [(True, UUID_OR_NAME + ENCRYPTED_POOLS)],
                     },
                 )
             ],
             "func": CryptActions.reencrypt,
+            "mutates": True,
         },
     ),
     (
@@ -438,12 +627,23 @@ ENCRYPTION_SUBCMDS = [
                 (
                     "Pool Identifier",
                     {
-                        "description": "Choose one option to specify the pool to unbind",
-                        "mut_ex_args": [(True, UUID_OR_NAME)],
+                        "description": (
+                            "Choose one option to specify the pool or pools to unbind"
+                        ),
+                        "mut_ex_args": [(True, UUID_OR_NAME + ENCRYPTED_POOLS)],
                     },
                 )
             ],
             "args": [
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": EncryptedPoolsOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
                 (
                     "method",
                     {
@@ -462,8 +662,10 @@ ENCRYPTION_SUBCMDS = [
                         "type": ensure_nat,
                     },
                 ),
-            ],
+            ]
+            + BATCH,
             "func": BindActions.unbind,
+            "mutates": True,
         },
     ),
 ]
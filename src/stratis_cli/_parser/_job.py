@@ -0,0 +1,54 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Job command parser for Stratis CLI.
+"""
+
+from .._actions import JobActions
+from ._shared import parse_duration
+
+JOB_SUBCMDS = [
+    (
+        "status",
+        {
+            "help": "Show the state and the output of a job",
+            "args": [("job_id", {"help": "job id"})],
+            "func": JobActions.job_status,
+            "check_version": False,
+        },
+    ),
+    (
+        "wait",
+        {
+            "help": ("Wait until jobs have completed; fail if any job did not succeed"),
+            "args": [
+                ("job_ids", {"help": "job ids", "metavar": "job_id", "nargs": "+"}),
+                (
+                    "--timeout",
+                    {
+                        "metavar": "DURATION",
+                        "type": parse_duration,
+                        "help": 'Wait no longer than this, e.g., "30m"',
+                    },
+                ),
+            ],
+            "func": JobActions.wait_jobs,
+            "check_version": False,
+        },
+    ),
+    (
+        "list",
+        {"help": "List jobs", "func": JobActions.list_jobs, "check_version": False},
+    ),
+]
@@ -34,6 +34,7 @@ KEY_SUBCMDS = [
                 )
             ],
             "func": TopActions.set_key,
+            "mutates": True,
         },
     ),
     (
@@ -51,6 +52,7 @@ KEY_SUBCMDS = [
                 )
             ],
             "func": TopActions.reset_key,
+            "mutates": True,
         },
     ),
     (
@@ -59,6 +61,7 @@ KEY_SUBCMDS = [
             "help": "Unset a key in the kernel keyring",
             "args": [("keydesc", {"help": "key description"})],
             "func": TopActions.unset_key,
+            "mutates": True,
         },
     ),
     (
@@ -15,14 +15,36 @@
 Definition of filesystem actions to display in the CLI.
 """
 
-from argparse import SUPPRESS, ArgumentParser, Namespace
-from typing import Optional, Tuple
+import csv
+import fnmatch
+import io
+import json
+import re
+import sys
+from argparse import SUPPRESS, ArgumentParser, ArgumentTypeError, Namespace
+from typing import Any, List, Optional, Tuple
 
 from justbytes import Range
 
 from .._actions import LogicalActions
 from ._debug import FILESYSTEM_DEBUG_SUBCMDS
-from ._shared import UUID_OR_NAME, RejectAction, parse_range
+from ._shared import (
+    ALL_DETAILS,
+    ASYNC,
+    BATCH,
+    UUID_OR_NAME,
+    WATCH,
+    RejectAction,
+    WatchOptions,
+    ensure_nat,
+    ensure_positive,
+    parse_duration,
+    parse_range,
+)
+
+_MANIFEST_MEMBERS = ("pool", "name", "size", "size_limit")
+
+SNAPSHOT_TEMPLATE_FIELDS = ("origin", "pool", "date", "time")
 
 
 def parse_range_or_current(values: str) -> Tuple[Optional[Range], str]:
@@ -36,18 +58,291 @@ def parse_range_or_current(values: str) -> Tuple[Optional[Range], str]:
     return (None if values == "current" else parse_range(values), values)
 
 
-class FilesystemListOptions:
+def _manifest_size(value: Any, number: int) -> Optional[Range]:
     """
-    Verifies filesystem list options.
+    Parse a size in entry number of a manifest; a number is in bytes.
+    """
+    if value is None or value == "":
+        return None
+
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return Range(value)
+
+    try:
+        return parse_range(value if isinstance(value, str) else "")
+    except ArgumentTypeError as err:
+        raise ArgumentTypeError(f"Entry {number} of the manifest: {err}") from err
+
+
+def parse_manifest(
+    path: str,
+) -> List[Tuple[str, str, Optional[Range], Optional[Range]]]:
+    """
+    Parse a manifest of the filesystems to create, read from path, or from
+    stdin if path is "-".
+
+    The manifest is either a JSON list of objects, or CSV with a header row.
+    Each object or row specifies a "pool", a "name", and, optionally, a
+    "size" and a "size_limit".
+
+    :returns: the pool name, name, size, and size limit of each filesystem
+    """
+    try:
+        if path == "-":
+            text = sys.stdin.read()
+        else:
+            with open(path, encoding="utf-8") as manifest_file:
+                text = manifest_file.read()
+    except OSError as err:
+        raise ArgumentTypeError(f"Can not read manifest {path}: {err}") from err
+
+    if text.lstrip().startswith(("[", "{")):
+        try:
+            entries = json.loads(text)
+        except ValueError as err:
+            raise ArgumentTypeError(f"Ill-formed JSON manifest: {err}") from err
+        if not (
+            isinstance(entries, list)
+            and all(isinstance(entry, dict) for entry in entries)
+        ):
+            raise ArgumentTypeError("A JSON manifest must be a list of objects.")
+    else:
+        entries = list(csv.DictReader(io.StringIO(text)))
+
+    specs = []
+    for number, entry in enumerate(entries, start=1):
+        unknown = [str(key) for key in entry if key not in _MANIFEST_MEMBERS]
+        if unknown != []:
+            raise ArgumentTypeError(
+                f"Entry {number} of the manifest has unknown members "
+                f"{', '.join(unknown)}; the members are {', '.join(_MANIFEST_MEMBERS)}."
+            )
+
+        (pool_name, name) = (entry.get("pool"), entry.get("name"))
+        if not (
+            isinstance(pool_name, str) and pool_name and isinstance(name, str) and name
+        ):
+            raise ArgumentTypeError(
+                f"Entry {number} of the manifest does not specify a pool and a name."
+            )
+
+        if any((pool_name, name) == spec[:2] for spec in specs):
+            raise ArgumentTypeError(
+                f"Entry {number} of the manifest repeats filesystem {name} in "
+                f"pool {pool_name}."
+            )
+
+        specs.append(
+            (
+                pool_name,
+                name,
+                _manifest_size(entry.get("size"), number),
+                _manifest_size(entry.get("size_limit"), number),
+            )
+        )
+
+    if specs == []:
+        raise ArgumentTypeError("The manifest does not specify any filesystems.")
+
+    return specs
+
+
+def _compile_match(namespace: Namespace, parser: ArgumentParser):
+    """
+    Compile the --match pattern, a glob unless --regex is specified, if any.
+    """
+    if namespace.match is None:
+        return
+
+    try:
+        namespace.match = re.compile(
+            namespace.match if namespace.regex else fnmatch.translate(namespace.match)
+        )
+    except re.error as err:
+        parser.error(f"argument --match: Invalid regular expression: {err}")
+
+
+class FilesystemCreateOptions:
+    """
+    Verifies the options specified on filesystem create.
+    """
+
+    def __init__(self, _namespace: Namespace):
+        pass
+
+    def verify(self, namespace: Namespace, parser: ArgumentParser):
+        """
+        Verify that the filesystems are specified either by a manifest or on
+        the command line.
+        """
+        if namespace.manifest is None:
+            if namespace.pool_name is None or namespace.fs_name == []:
+                parser.error(
+                    "A pool name and at least one filesystem name are "
+                    "required unless --from is specified."
+                )
+            return
+
+        if not (
+            namespace.pool_name is None
+            and namespace.size is None
+            and namespace.size_limit is None
+        ):
+            parser.error(
+                "--from can not be specified together with a pool name, "
+                "filesystem names, --size, or --size-limit."
+            )
+
+        if namespace.manifest == "-" and namespace.run_async:
+            parser.error("A manifest read from stdin can not be used with --async.")
+
+        try:
+            namespace.manifest = parse_manifest(namespace.manifest)
+        except ArgumentTypeError as err:
+            parser.error(f"argument --from: {err}")
+
+
+class FilesystemSnapshotOptions:
+    """
+    Verifies the options specified on filesystem snapshot.
+    """
+
+    def __init__(self, _namespace: Namespace):
+        pass
+
+    def verify(self, namespace: Namespace, parser: ArgumentParser):
+        """
+        Verify that either an origin and a snapshot name, a pattern that
+        selects the origins, or a group of origins is specified, that only
+        the options that apply to it are specified, and compile the pattern.
+        """
+        jobs = not getattr(namespace, "jobs_default", True)
+        if namespace.group is not None:
+            if not (
+                namespace.origin_name is None
+                and namespace.match is None
+                and not namespace.regex
+            ):
+                parser.error(
+                    "--group can not be specified together with an origin "
+                    "name, --match, or --regex."
+                )
+            if jobs:
+                parser.error(
+                    "--jobs can not be specified together with --group; the "
+                    "filesystems of a group are snapshotted all at once."
+                )
+            namespace.group = namespace.group.split(",")
+            if "" in namespace.group or len(set(namespace.group)) != len(
+                namespace.group
+            ):
+                parser.error(
+                    "argument --group: The filesystem names must be distinct "
+                    "and separated by single commas."
+                )
+        elif namespace.match is None:
+            if namespace.snapshot_name is None:
+                parser.error(
+                    "An origin name and a snapshot name are required unless "
+                    "--match or --group is specified."
+                )
+            if namespace.regex or namespace.name_template is not None:
+                parser.error("--regex and --name-template require --match or --group.")
+            if jobs or namespace.as_json:
+                parser.error("--jobs and --json require --match or --group.")
+            return
+        elif namespace.origin_name is not None:
+            parser.error("--match can not be specified together with an origin name.")
+
+        if namespace.name_template is None:
+            namespace.name_template = "{origin}-{date}"
+
+        try:
+            namespace.name_template.format(
+                **{field: field for field in SNAPSHOT_TEMPLATE_FIELDS}
+            )
+        except (IndexError, KeyError, ValueError) as err:
+            parser.error(
+                f"argument --name-template: Invalid template "
+                f"{namespace.name_template}: {err!r}; the fields are "
+                f"{', '.join(SNAPSHOT_TEMPLATE_FIELDS)}."
+            )
+
+        _compile_match(namespace, parser)
+
+
+class FilesystemDestroyOptions:
+    """
+    Verifies the options specified on filesystem destroy.
     """
 
     def __init__(self, _namespace: Namespace):
         pass
 
+    def verify(self, namespace: Namespace, parser: ArgumentParser):
+        """
+        Verify that the filesystems are specified either by name in a pool or
+        by selectors in a pool or in every pool, and compile the pattern.
+        """
+        if (
+            namespace.match is None
+            and namespace.older_than is None
+            and namespace.snapshots_of is None
+        ):
+            if namespace.pool_name is None or namespace.fs_name == []:
+                parser.error(
+                    "A pool name and at least one filesystem name are required "
+                    "unless --match, --older-than, or --snapshots-of is specified."
+                )
+            if namespace.all_pools or namespace.regex or namespace.dry_run:
+                parser.error(
+                    "--all-pools, --regex, and --dry-run require --match, "
+                    "--older-than, or --snapshots-of."
+                )
+            return
+
+        if namespace.fs_name != []:
+            parser.error(
+                "Filesystem names can not be specified together with --match, "
+                "--older-than, or --snapshots-of."
+            )
+
+        if (namespace.pool_name is None) == (not namespace.all_pools):
+            parser.error("Exactly one of a pool name and --all-pools is required.")
+
+        _compile_match(namespace, parser)
+
+
+class FilesystemPruneOptions:
+    """
+    Verifies the options specified on filesystem prune.
+    """
+
+    def __init__(self, _namespace: Namespace):
+        pass
+
+    def verify(self, namespace: Namespace, parser: ArgumentParser):
+        """
+        Verify that some snapshots are kept, so that prune never destroys
+        every snapshot.
+        """
+        if not (namespace.keep_last or namespace.keep_daily or namespace.keep_weekly):
+            parser.error(
+                "At least one of --keep-last, --keep-daily, and --keep-weekly "
+                "must be positive."
+            )
+
+
+class FilesystemListOptions(WatchOptions):
+    """
+    Verifies filesystem list options.
+    """
+
     def verify(self, namespace: Namespace, parser: ArgumentParser):
         """
         Do supplementary parsing of conditional arguments.
         """
+        super().verify(namespace, parser)
 
         if namespace.pool_name is None and (
             namespace.uuid is not None or namespace.name is not None
@@ -64,12 +359,44 @@ LOGICAL_SUBCMDS = [
         {
             "help": "Create filesystems in a pool",
             "args": [
-                ("pool_name", {"help": "pool name"}),
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": FilesystemCreateOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
+                ("pool_name", {"help": "pool name", "nargs": "?"}),
                 (
                     "fs_name",
                     {
                         "help": "Create filesystems in this pool using the given names",
-                        "nargs": "+",
+                        "nargs": "*",
+                    },
+                ),
+                (
+                    "--from",
+                    {
+                        "dest": "manifest",
+                        "metavar": "FILE",
+                        "help": (
+                            "Create the filesystems specified by a JSON or CSV "
+                            'manifest in FILE, or on stdin if FILE is "-", '
+                            "instead of those named on the command line"
+                        ),
+                    },
+                ),
+                (
+                    "--batch-size",
+                    {
+                        "type": ensure_positive,
+                        "metavar": "N",
+                        "help": (
+                            "Create at most N filesystems of a pool with a "
+                            "single request to the daemon"
+                        ),
                     },
                 ),
                 (
@@ -86,20 +413,141 @@ LOGICAL_SUBCMDS = [
                         "type": parse_range,
                     },
                 ),
-            ],
+            ]
+            + ASYNC,
             "func": LogicalActions.create_volumes,
+            "mutates": True,
         },
     ),
     (
         "snapshot",
         {
-            "help": "Snapshot the named filesystem in a pool",
+            "help": (
+                "Snapshot the named filesystem, or the filesystems matching "
+                "a pattern, in a pool"
+            ),
             "args": [
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": FilesystemSnapshotOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
                 ("pool_name", {"help": "pool name"}),
-                ("origin_name", {"help": "origin name"}),
-                ("snapshot_name", {"help": "snapshot name"}),
-            ],
+                ("origin_name", {"nargs": "?", "help": "origin name"}),
+                ("snapshot_name", {"nargs": "?", "help": "snapshot name"}),
+                (
+                    "--match",
+                    {
+                        "metavar": "PATTERN",
+                        "help": (
+                            "Snapshot every filesystem whose name matches "
+                            "the glob PATTERN"
+                        ),
+                    },
+                ),
+                (
+                    "--group",
+                    {
+                        "metavar": "NAME,NAME,...",
+                        "help": (
+                            "Snapshot the named filesystems together, freezing "
+                            "those that are mounted while they are snapshotted"
+                        ),
+                    },
+                ),
+                (
+                    "--regex",
+                    {
+                        "action": "store_true",
+                        "help": "Interpret the --match pattern as a regular expression",
+                    },
+                ),
+                (
+                    "--name-template",
+                    {
+                        "metavar": "TEMPLATE",
+                        "help": (
+                            "Name each snapshot by TEMPLATE, in which {origin}, "
+                            "{pool}, {date}, and {time} are replaced "
+                            "(default: {origin}-{date})"
+                        ),
+                    },
+                ),
+            ]
+            + BATCH,
             "func": LogicalActions.snapshot_filesystem,
+            "mutates": True,
+        },
+    ),
+    (
+        "prune",
+        {
+            "help": (
+                "Destroy the snapshots of each filesystem that the retention "
+                "rules do not keep"
+            ),
+            "args": [
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": FilesystemPruneOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
+                (
+                    "pool_name",
+                    {"nargs": "?", "help": "Pool name (default: every pool)"},
+                ),
+                (
+                    "--keep-last",
+                    {
+                        "type": ensure_nat,
+                        "default": 0,
+                        "metavar": "N",
+                        "help": "Keep the N newest snapshots of each filesystem",
+                    },
+                ),
+                (
+                    "--keep-daily",
+                    {
+                        "type": ensure_nat,
+                        "default": 0,
+                        "metavar": "D",
+                        "help": (
+                            "Keep the newest snapshot of each of the D most "
+                            "recent days on which a snapshot was taken"
+                        ),
+                    },
+                ),
+                (
+                    "--keep-weekly",
+                    {
+                        "type": ensure_nat,
+                        "default": 0,
+                        "metavar": "W",
+                        "help": (
+                            "Keep the newest snapshot of each of the W most "
+                            "recent weeks in which a snapshot was taken"
+                        ),
+                    },
+                ),
+                (
+                    "--dry-run",
+                    {
+                        "action": "store_true",
+                        "help": "List the snapshots to destroy without destroying them",
+                    },
+                ),
+            ]
+            + BATCH,
+            "func": LogicalActions.prune_snapshots,
+            "mutates": True,
         },
     ),
     (
@@ -112,9 +560,9 @@ LOGICAL_SUBCMDS = [
                     {
                         "description": (
                             "Choose one option to display a detailed listing "
-                            "for a single filesystem"
+                            "for a single filesystem or for all filesystems"
                         ),
-                        "mut_ex_args": [(False, UUID_OR_NAME)],
+                        "mut_ex_args": [(False, UUID_OR_NAME + [ALL_DETAILS])],
                     },
                 )
             ],
@@ -129,25 +577,90 @@ LOGICAL_SUBCMDS = [
                     },
                 ),
                 ("pool_name", {"nargs": "?", "help": "Pool name"}),
-            ],
+            ]
+            + WATCH,
             "func": LogicalActions.list_volumes,
+            "lists": True,
         },
     ),
     (
         "destroy",
         {
-            "help": "Destroy filesystems in a pool",
+            "help": (
+                "Destroy the named filesystems, or the filesystems that the "
+                "selectors match, in a pool"
+            ),
             "args": [
-                ("pool_name", {"help": "pool name"}),
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": FilesystemDestroyOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
+                ("pool_name", {"nargs": "?", "help": "pool name"}),
                 (
                     "fs_name",
                     {
                         "help": "Destroy the named filesystems in this pool",
-                        "nargs": "+",
+                        "nargs": "*",
                     },
                 ),
-            ],
+                (
+                    "--match",
+                    {
+                        "metavar": "PATTERN",
+                        "help": (
+                            "Destroy the filesystems whose names match the glob PATTERN"
+                        ),
+                    },
+                ),
+                (
+                    "--regex",
+                    {
+                        "action": "store_true",
+                        "help": "Interpret the --match pattern as a regular expression",
+                    },
+                ),
+                (
+                    "--older-than",
+                    {
+                        "type": parse_duration,
+                        "metavar": "DURATION",
+                        "help": (
+                            "Destroy the filesystems created more than "
+                            'DURATION ago, e.g., "7d"'
+                        ),
+                    },
+                ),
+                (
+                    "--snapshots-of",
+                    {
+                        "metavar": "ORIGIN",
+                        "help": "Destroy the snapshots of the filesystem ORIGIN",
+                    },
+                ),
+                (
+                    "--all-pools",
+                    {
+                        "action": "store_true",
+                        "help": "Select filesystems in every pool",
+                    },
+                ),
+                (
+                    "--dry-run",
+                    {
+                        "action": "store_true",
+                        "help": "List the selected filesystems without destroying them",
+                    },
+                ),
+            ]
+            + BATCH
+            + ASYNC,
             "func": LogicalActions.destroy_volumes,
+            "mutates": True,
         },
     ),
     (
@@ -160,6 +673,7 @@ LOGICAL_SUBCMDS = [
                 ("new_name", {"help": "New name to give that filesystem"}),
             ],
             "func": LogicalActions.rename_fs,
+            "mutates": True,
         },
     ),
     (
@@ -182,6 +696,7 @@ LOGICAL_SUBCMDS = [
                 ),
             ],
             "func": LogicalActions.set_size_limit,
+            "mutates": True,
         },
     ),
     (
@@ -193,6 +708,7 @@ LOGICAL_SUBCMDS = [
                 ("fs_name", {"help": "Name of the filesystem to change"}),
             ],
             "func": LogicalActions.unset_size_limit,
+            "mutates": True,
         },
     ),
     (
@@ -214,6 +730,7 @@ LOGICAL_SUBCMDS = [
                 ("snapshot_name", {"help": "Name of the snapshot filesystem"}),
             ],
             "func": LogicalActions.schedule_revert,
+            "mutates": True,
         },
     ),
     (
@@ -232,6 +749,7 @@ LOGICAL_SUBCMDS = [
                 ("snapshot_name", {"help": "Name of the snapshot filesystem"}),
             ],
             "func": LogicalActions.cancel_revert,
+            "mutates": True,
         },
     ),
     (
@@ -19,20 +19,25 @@ import argparse
 import sys
 
 from .._actions import (
+    JobActions,
     LogicalActions,
     PhysicalActions,
     PoolActions,
     StratisActions,
     TopActions,
     check_stratisd_version,
+    invalidate_cache,
 )
 from .._stratisd_constants import ReportKey
 from .._version import __version__
 from ._debug import TOP_DEBUG_SUBCMDS
+from ._job import JOB_SUBCMDS
 from ._key import KEY_SUBCMDS
 from ._logical import LOGICAL_SUBCMDS
 from ._physical import PHYSICAL_SUBCMDS
 from ._pool import POOL_SUBCMDS
+from ._report import REPORT_SUBCMDS, report_options
+from ._shared import parse_duration
 
 
 def gen_subparsers(parser, command_line):
@@ -139,17 +144,48 @@ def add_subcommand(subparser, cmd):
     _add_args(parser, info.get("args", []))
     _add_mut_ex_args(parser, info.get("mut_ex_args", []))
 
-    def wrap_func(func):
+    def wrap_func(func, check_version, lists, mutates):
         if func is None:
             return print_help(parser)
 
-        def wrapped_func(*args):
-            check_stratisd_version()
-            func(*args)
+        def wrapped_func(namespace):
+            if namespace.profile_memory and namespace.profile is None:
+                parser.error("--profile-memory requires --profile")
+
+            saved = not (
+                namespace.from_snapshot is None and namespace.max_staleness is None
+            )
+            if saved and not lists:
+                parser.error(
+                    "--from-snapshot and --max-staleness are only supported "
+                    "when listing pools, filesystems, or blockdevs"
+                )
+
+            # If the listing is not obtained directly from stratisd, the
+            # version is checked only if and when stratisd is asked for it.
+            if check_version and not saved:
+                check_stratisd_version()
+
+            # A listing in the cache may no longer be accurate once a command
+            # that changes stratisd's state has run, even if it failed after
+            # changing some objects.
+            try:
+                func(namespace)
+            finally:
+                if mutates:
+                    invalidate_cache()
 
         return wrapped_func
 
-    parser.set_defaults(func=wrap_func(info.get("func")))
+    parser.set_defaults(
+        func=wrap_func(
+            info.get("func"),
+            info.get("check_version", True),
+            info.get("lists", False),
+            info.get("mutates", False),
+        ),
+        **info.get("defaults", {}),
+    )
 
 
 DAEMON_SUBCMDS = [
@@ -169,6 +205,7 @@ ROOT_SUBCOMMANDS = [
             "help": "Perform General Pool Actions",
             "subcmds": POOL_SUBCMDS,
             "func": PoolActions.list_pools,
+            "lists": True,
         },
     ),
     (
@@ -177,6 +214,7 @@ ROOT_SUBCOMMANDS = [
             "help": "Commands related to block devices that make up the pool",
             "subcmds": PHYSICAL_SUBCMDS,
             "func": PhysicalActions.list_devices,
+            "lists": True,
         },
     ),
     (
@@ -186,32 +224,36 @@ ROOT_SUBCOMMANDS = [
             "help": "Commands related to filesystems allocated from a pool",
             "subcmds": LOGICAL_SUBCMDS,
             "func": LogicalActions.list_volumes,
+            "lists": True,
         },
     ),
     (
         "report",
         {
             "help": "Commands related to reports of the daemon state",
+            "subcmds": REPORT_SUBCMDS,
             "func": TopActions.get_report,
-            "args": [
-                (
-                    "report_name",
-                    {
-                        "default": ReportKey.ENGINE_STATE,
-                        "type": ReportKey,
-                        "help": "Name of the report to display",
-                        "nargs": "?",
-                        "choices": list(ReportKey),
-                    },
-                ),
-                (
-                    "--no-sort-keys",
-                    {
-                        "action": "store_true",
-                        "help": "Turn off sorting keys when printing result.",
-                    },
-                ),
-            ],
+            "defaults": {"report_name": ReportKey.ENGINE_STATE},
+        }
+        | report_options(),
+    ),
+    (
+        "monitor",
+        {
+            "help": (
+                "Print a line of JSON for each change to a pool, filesystem, "
+                "or blockdev, until interrupted"
+            ),
+            "func": TopActions.monitor,
+        },
+    ),
+    (
+        "job",
+        {
+            "help": "Commands related to commands run in the background",
+            "subcmds": JOB_SUBCMDS,
+            "func": JobActions.list_jobs,
+            "check_version": False,
         },
     ),
     (
@@ -231,12 +273,97 @@ ROOT_SUBCOMMANDS = [
 
 GEN_ARGS = [
     ("--propagate", {"action": "store_true", "help": "Allow exceptions to propagate"}),
+    (
+        "--bus-address",
+        {
+            "metavar": "ADDRESS",
+            "help": (
+                "Connect to stratisd on the message bus at ADDRESS instead of "
+                "on the system bus"
+            ),
+        },
+    ),
+    (
+        "--deadline",
+        {
+            "type": parse_duration,
+            "metavar": "DURATION",
+            "help": (
+                "Fail if the D-Bus calls of the command have not completed "
+                'within DURATION, e.g., "30s"'
+            ),
+        },
+    ),
+    (
+        "--trace-dbus",
+        {
+            "nargs": "?",
+            "const": sys.stderr,
+            "type": argparse.FileType("a", encoding="utf-8"),
+            "metavar": "FILE",
+            "help": (
+                "Append a line of JSON describing each D-Bus call, with its "
+                "sizes and timings, to FILE or to stderr"
+            ),
+        },
+    ),
+    (
+        "--profile",
+        {
+            "metavar": "FILE",
+            "help": (
+                "Profile the command and write the profile to FILE, as "
+                "collapsed stacks if FILE ends in .folded or .collapsed, "
+                "otherwise in pstats format"
+            ),
+        },
+    ),
+    (
+        "--profile-memory",
+        {
+            "action": "store_true",
+            "help": (
+                "With --profile, also report the peak memory allocated in each "
+                "phase of the command"
+            ),
+        },
+    ),
     (
         "--unhyphenated-uuids",
         {"action": "store_true", "help": "Display UUIDs in unhyphenated format"},
     ),
 ]
 
+GEN_MUT_EX_ARGS = [
+    (
+        False,
+        [
+            (
+                "--from-snapshot",
+                {
+                    "metavar": "FILE",
+                    "help": (
+                        "List pools, filesystems, or blockdevs from a saved "
+                        "managed_objects_report instead of from the daemon"
+                    ),
+                },
+            ),
+            (
+                "--max-staleness",
+                {
+                    "metavar": "DURATION",
+                    "type": parse_duration,
+                    "help": (
+                        "List pools, filesystems, or blockdevs from a cached "
+                        'result that is no older than this, e.g., "5" or '
+                        '"1m"; the cache is shared by concurrent commands'
+                    ),
+                },
+            ),
+        ],
+    )
+]
+
 
 def gen_parser():
     """
@@ -258,6 +385,7 @@ def gen_parser():
     )
 
     _add_args(parser, GEN_ARGS)
+    _add_mut_ex_args(parser, GEN_MUT_EX_ARGS)
 
     subparsers = parser.add_subparsers(title="subcommands", metavar="")
 
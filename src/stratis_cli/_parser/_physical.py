@@ -15,16 +15,32 @@
 Definition of block device actions to display in the CLI.
 """
 
+from argparse import SUPPRESS
+
 from .._actions import PhysicalActions
 from ._debug import BLOCKDEV_DEBUG_SUBCMDS
+from ._shared import WATCH, RejectAction, WatchOptions
 
 PHYSICAL_SUBCMDS = [
     (
         "list",
         {
             "help": "List information about blockdevs in the pool",
-            "args": [("pool_name", {"nargs": "?", "help": "Pool name"})],
+            "args": [
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": WatchOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
+                ("pool_name", {"nargs": "?", "help": "Pool name"}),
+            ]
+            + WATCH,
             "func": PhysicalActions.list_devices,
+            "lists": True,
         },
     ),
     (
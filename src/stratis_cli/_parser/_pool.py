@@ -33,14 +33,19 @@ from .._constants import (
 from ._debug import POOL_DEBUG_SUBCMDS
 from ._encryption import BIND_SUBCMDS, ENCRYPTION_SUBCMDS, REBIND_SUBCMDS
 from ._shared import (
+    ALL_DETAILS,
+    ASYNC,
+    BATCH,
     CLEVIS_AND_KERNEL,
     KEYFILE_PATH_OR_STDIN,
     TRUST_URL_OR_THUMBPRINT,
     UUID_OR_NAME,
+    WATCH,
     ClevisEncryptionOptions,
     DefaultAction,
     MoveNotice,
     RejectAction,
+    WatchOptions,
     ensure_nat,
     parse_range,
 )
@@ -102,6 +107,44 @@ class CreateOptions:
         self.integrity_options.verify(namespace, parser)
 
 
+class ExtendDataOptions:
+    """
+    Verifies the options specified on pool extend-data.
+    """
+
+    def __init__(self, _namespace: Namespace):
+        pass
+
+    def verify(self, namespace: Namespace, parser: ArgumentParser):
+        """
+        Verify that exactly one of a pool name and --all-pools is specified.
+        """
+        if (namespace.pool_name is None) == (not namespace.all_pools):
+            parser.error("Exactly one of a pool name and --all-pools is required.")
+
+
+class ManyPoolsOptions:
+    """
+    Verifies the options specified on a command that may select many pools
+    with --all or --match.
+    """
+
+    def __init__(self, _namespace: Namespace):
+        pass
+
+    def verify(self, namespace: Namespace, parser: ArgumentParser):
+        """
+        Verify that the options that only apply to many pools are specified
+        only when many pools are selected.
+        """
+        if (
+            not namespace.all
+            and namespace.match is None
+            and (not getattr(namespace, "jobs_default", True) or namespace.as_json)
+        ):
+            parser.error("--jobs and --json require --all or --match.")
+
+
 POOL_SUBCMDS = [
     (
         "create",
@@ -219,6 +262,7 @@ POOL_SUBCMDS = [
                 ),
             ],
             "func": PoolActions.create_pool,
+            "mutates": True,
         },
     ),
     (
@@ -227,6 +271,7 @@ POOL_SUBCMDS = [
             "help": "Destroy a pool",
             "args": [("pool_name", {"help": "pool name"})],
             "func": PoolActions.destroy_pool,
+            "mutates": True,
         },
     ),
     (
@@ -234,22 +279,56 @@ POOL_SUBCMDS = [
         {
             "help": "Start a pool.",
             "args": [
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": ManyPoolsOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
                 (
                     "--remove-cache",
                     {
                         "action": "store_true",
                         "help": "While starting the pool, remove its cache",
                     },
-                )
-            ],
+                ),
+            ]
+            + BATCH,
             "groups": [
                 (
                     "Pool Identifier",
                     {
                         "description": (
-                            "Choose one option to specify the pool to start"
+                            "Choose one option to specify the pool or pools to start"
                         ),
-                        "mut_ex_args": [(True, UUID_OR_NAME)],
+                        "mut_ex_args": [
+                            (
+                                True,
+                                UUID_OR_NAME
+                                + [
+                                    (
+                                        "--all",
+                                        {
+                                            "action": "store_true",
+                                            "help": "Start every stopped pool",
+                                        },
+                                    ),
+                                    (
+                                        "--match",
+                                        {
+                                            "metavar": "PATTERN",
+                                            "help": (
+                                                "Start the stopped pools whose "
+                                                "names match the glob PATTERN"
+                                            ),
+                                        },
+                                    ),
+                                ],
+                            )
+                        ],
                     },
                 ),
                 (
@@ -299,6 +378,7 @@ POOL_SUBCMDS = [
                 ),
             ],
             "func": PoolActions.start_pool,
+            "mutates": True,
         },
     ),
     (
@@ -313,13 +393,50 @@ POOL_SUBCMDS = [
                     "Pool Identifier",
                     {
                         "description": (
-                            "Choose one option to specify the pool to stop"
+                            "Choose one option to specify the pool or pools to stop"
                         ),
-                        "mut_ex_args": [(True, UUID_OR_NAME)],
+                        "mut_ex_args": [
+                            (
+                                True,
+                                UUID_OR_NAME
+                                + [
+                                    (
+                                        "--all",
+                                        {
+                                            "action": "store_true",
+                                            "help": "Stop every pool",
+                                        },
+                                    ),
+                                    (
+                                        "--match",
+                                        {
+                                            "metavar": "PATTERN",
+                                            "help": (
+                                                "Stop the pools whose names "
+                                                "match the glob PATTERN"
+                                            ),
+                                        },
+                                    ),
+                                ],
+                            )
+                        ],
                     },
                 )
             ],
+            "args": [
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": ManyPoolsOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                )
+            ]
+            + BATCH,
             "func": PoolActions.stop_pool,
+            "mutates": True,
         },
     ),
     (
@@ -328,27 +445,38 @@ POOL_SUBCMDS = [
             "help": "List pools",
             "description": "List Stratis pools",
             "args": [
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": WatchOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
                 (
                     "--stopped",
                     {
                         "action": "store_true",
                         "help": "Display information about stopped pools only.",
                     },
-                )
-            ],
+                ),
+            ]
+            + WATCH,
             "groups": [
                 (
                     "Optional Pool Identifier",
                     {
                         "description": (
                             "Choose one option to display a detailed listing "
-                            "for a single pool"
+                            "for a single pool or for all pools"
                         ),
-                        "mut_ex_args": [(False, UUID_OR_NAME)],
+                        "mut_ex_args": [(False, UUID_OR_NAME + [ALL_DETAILS])],
                     },
                 )
             ],
             "func": PoolActions.list_pools,
+            "lists": True,
         },
     ),
     (
@@ -360,6 +488,7 @@ POOL_SUBCMDS = [
                 ("new", {"help": "New pool name"}),
             ],
             "func": PoolActions.rename_pool,
+            "mutates": True,
         },
     ),
     (
@@ -386,8 +515,10 @@ POOL_SUBCMDS = [
                         "nargs": "+",
                     },
                 ),
-            ],
+            ]
+            + ASYNC,
             "func": PoolActions.init_cache,
+            "mutates": True,
         },
     ),
     (
@@ -406,6 +537,7 @@ POOL_SUBCMDS = [
                 ),
             ],
             "func": PoolActions.add_data_devices,
+            "mutates": True,
         },
     ),
     (
@@ -424,6 +556,7 @@ POOL_SUBCMDS = [
                 ),
             ],
             "func": PoolActions.add_cache_devices,
+            "mutates": True,
         },
     ),
     (
@@ -435,7 +568,23 @@ POOL_SUBCMDS = [
                 "expansion of a component RAID device."
             ),
             "args": [
-                ("pool_name", {"help": "Pool name"}),
+                (
+                    "--post-parser",
+                    {
+                        "action": RejectAction,
+                        "default": ExtendDataOptions,
+                        "help": SUPPRESS,
+                        "nargs": "?",
+                    },
+                ),
+                ("pool_name", {"help": "Pool name", "nargs": "?"}),
+                (
+                    "--all-pools",
+                    {
+                        "action": "store_true",
+                        "help": "Extend every pool instead of the named pool",
+                    },
+                ),
                 (
                     "--device-uuid",
                     {
@@ -451,8 +600,11 @@ POOL_SUBCMDS = [
                         ),
                     },
                 ),
-            ],
+            ]
+            + BATCH
+            + ASYNC,
             "func": PoolActions.extend_data,
+            "mutates": True,
         },
     ),
     (
@@ -495,6 +647,7 @@ POOL_SUBCMDS = [
             ],
             "epilog": str(MoveNotice("unbind", "pool", "pool encryption", "3.10.0")),
             "func": BindActions.unbind,
+            "mutates": True,
         },
     ),
     (
@@ -506,6 +659,7 @@ POOL_SUBCMDS = [
                 ("amount", {"type": ensure_nat, "help": "Number of filesystems."}),
             ],
             "func": PoolActions.set_fs_limit,
+            "mutates": True,
         },
     ),
     (
@@ -524,6 +678,7 @@ POOL_SUBCMDS = [
                 ),
             ],
             "func": PoolActions.set_overprovisioning_mode,
+            "mutates": True,
         },
     ),
     (
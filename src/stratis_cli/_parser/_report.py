@@ -0,0 +1,216 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Report command parser for Stratis CLI.
+"""
+
+import argparse
+from argparse import ArgumentParser, Namespace
+
+from .._actions import TopActions
+from .._stratisd_constants import ReportKey
+from ._shared import RejectAction, ensure_nat, parse_duration, parse_report_path
+
+_REPORT_HELP = {
+    ReportKey.ENGINE_STATE: "Report of the state of the stratisd engine",
+    ReportKey.MANAGED_OBJECTS: "Result of the D-Bus GetManagedObjects method",
+    ReportKey.STOPPED_POOLS: "Report of stopped pools",
+}
+
+
+class ReportOptions:
+    """
+    Verifies report options.
+    """
+
+    def __init__(self, _namespace: Namespace):
+        pass
+
+    def verify(self, namespace: Namespace, parser: ArgumentParser):
+        """
+        Do supplementary parsing of conditional arguments.
+        """
+        # The options may be split between the two positions, where they are
+        # mutually exclusive only within each.
+        if namespace.raw and namespace.no_sort_keys:
+            parser.error(
+                "The --raw and --no-sort-keys options can not be specified together."
+            )
+
+        if namespace.every is None:
+            if any(
+                value is not None
+                for value in (namespace.dir, namespace.keep, namespace.count)
+            ):
+                parser.error(
+                    "The --dir, --keep, and --count options may only be "
+                    "specified with the --every option."
+                )
+            return
+
+        if namespace.dir is None:
+            parser.error("The --every option requires the --dir option.")
+
+        if namespace.every == 0:
+            parser.error("The interval specified by --every must be positive.")
+
+        if namespace.keep == 0 or namespace.count == 0:
+            parser.error("The values of --keep and --count must be positive.")
+
+
+def report_options(default=None):
+    """
+    Options for displaying a report.
+
+    The options are accepted both before and after the report name. The
+    options that follow the report name must have argparse.SUPPRESS as
+    their default so that they do not overwrite the options that precede
+    the report name. The options are verified only once, by the parser
+    for the options that precede the report name.
+
+    :param default: the default value for every option
+    :returns: keyword arguments for add_subcommand
+    :rtype: dict
+    """
+    post_parser = (
+        []
+        if default is argparse.SUPPRESS
+        else [
+            (
+                "--post-parser",
+                {
+                    "action": RejectAction,
+                    "default": ReportOptions,
+                    "help": argparse.SUPPRESS,
+                    "nargs": "?",
+                },
+            )
+        ]
+    )
+
+    return {
+        "args": post_parser
+        + [
+            (
+                "--path",
+                {
+                    "default": default,
+                    "type": parse_report_path,
+                    "help": (
+                        "Display only the value at this JSONPath-like "
+                        'location, e.g., "$.pools[0].name"'
+                    ),
+                },
+            ),
+            (
+                "--every",
+                {
+                    "default": default,
+                    "type": parse_duration,
+                    "help": (
+                        "Instead of printing the report, save it in the "
+                        "directory specified by --dir at this interval, "
+                        'e.g., "30", "5m", or "1h"'
+                    ),
+                },
+            ),
+            (
+                "--dir",
+                {"default": default, "help": "Directory in which to save reports"},
+            ),
+            (
+                "--keep",
+                {
+                    "default": default,
+                    "type": ensure_nat,
+                    "help": "Number of most recent saved reports to retain",
+                },
+            ),
+            (
+                "--count",
+                {
+                    "default": default,
+                    "type": ensure_nat,
+                    "help": "Number of times to obtain the report before exiting",
+                },
+            ),
+        ],
+        "mut_ex_args": [
+            (
+                False,
+                [
+                    (
+                        "--no-sort-keys",
+                        {
+                            "action": "store_true",
+                            "default": False if default is None else default,
+                            "help": "Turn off sorting keys when printing result.",
+                        },
+                    ),
+                    (
+                        "--raw",
+                        {
+                            "action": "store_true",
+                            "default": False if default is None else default,
+                            "help": (
+                                "Print the report exactly as received, "
+                                "without reformatting"
+                            ),
+                        },
+                    ),
+                ],
+            )
+        ],
+    }
+
+
+REPORT_SUBCMDS = [
+    (
+        str(report_name),
+        {
+            "help": _REPORT_HELP[report_name],
+            "func": TopActions.get_report,
+            "defaults": {"report_name": report_name},
+        }
+        | report_options(argparse.SUPPRESS),
+    )
+    for report_name in ReportKey
+] + [
+    (
+        "diff",
+        {
+            "help": (
+                "Show the differences between two saved engine_state_report "
+                "or managed_objects_report reports, or between a saved report "
+                "and the current report"
+            ),
+            "args": [
+                ("old", {"help": 'Path of the old report, or "-" for stdin'}),
+                (
+                    "new",
+                    {
+                        "help": (
+                            'Path of the new report, or "-" for stdin; if '
+                            "omitted, the current report is obtained from "
+                            "stratisd"
+                        ),
+                        "nargs": "?",
+                    },
+                ),
+            ],
+            "func": TopActions.diff_reports,
+            "check_version": False,
+        },
+    )
+]
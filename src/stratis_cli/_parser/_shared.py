@@ -17,6 +17,8 @@ Shared parser operations.
 
 import argparse
 import copy
+import json
+import math
 import re
 from uuid import UUID
 
@@ -88,6 +90,53 @@ def parse_range(values):
     return result
 
 
+_PATH_COMPONENT_RE = re.compile(
+    r"\.(?P<name>[A-Za-z_][A-Za-z0-9_-]*)"
+    r"|\[(?P<index>[0-9]+)\]"
+    r'|\[(?P<key>"(?:[^"\\]|\\.)*")\]'
+)
+
+_PATH_SPECIFICATION = (
+    'Path must begin with "$" followed by any number of components, each '
+    'of which is ".<name>", "[<index>]", or \'["<key>"]\' where <index> is '
+    "a natural number and <key> is a JSON string."
+)
+
+
+def parse_report_path(values):
+    """
+    Parse a JSONPath-like selector for a report.
+
+    :param str values: string to parse
+    :returns: the sequence of keys and indices that make up the path
+    :rtype: tuple of str or int
+    """
+    if not values.startswith("$"):
+        raise argparse.ArgumentTypeError(
+            f"Ill-formed path specification: {_PATH_SPECIFICATION}"
+        )
+
+    components = []
+    position = 1
+    while position < len(values):
+        match = _PATH_COMPONENT_RE.match(values, position)
+        if match is None:
+            raise argparse.ArgumentTypeError(
+                f"Ill-formed path specification: {_PATH_SPECIFICATION}"
+            )
+
+        if match.group("name") is not None:
+            components.append(match.group("name"))
+        elif match.group("index") is not None:
+            components.append(int(match.group("index")))
+        else:
+            components.append(json.loads(match.group("key")))
+
+        position = match.end()
+
+    return tuple(components)
+
+
 class RejectAction(argparse.Action):
     """
     Just reject any use of the option.
@@ -125,6 +174,40 @@ def ensure_nat(arg):
     return result
 
 
+def ensure_positive(arg):
+    """
+    Raise error if argument is not a positive integer.
+    """
+    if ensure_nat(arg) == 0:
+        raise argparse.ArgumentTypeError(f"Argument {arg} is not a positive integer.")
+    return int(arg)
+
+
+_DURATION_RE = re.compile(r"^(?P<magnitude>[0-9]+(\.[0-9]+)?)(?P<units>[smhd]?)$")
+
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(values):
+    """
+    Parse a duration, in seconds unless followed by the unit "s", "m", "h",
+    or "d".
+
+    :param str values: string to parse
+    :returns: the duration in seconds
+    :rtype: float
+    """
+    match = _DURATION_RE.search(values)
+    if match is None:
+        raise argparse.ArgumentTypeError(
+            f"Ill-formed duration specification: {values}. Duration must be "
+            "specified as a non-negative decimal number optionally followed by "
+            'one of the units "s", "m", "h", or "d".'
+        )
+
+    return float(match.group("magnitude")) * _DURATION_UNITS[match.group("units")]
+
+
 class MoveNotice:
     """
     Constructs a move notice, for printing.
@@ -159,6 +242,77 @@ UUID_OR_NAME = [
     ("--uuid", {"type": UUID, "help": "UUID"}),
 ]
 
+ALL_DETAILS = (
+    "--all-details",
+    {
+        "action": "store_true",
+        "help": "Display a detailed listing for every item that would be listed",
+    },
+)
+
+WATCH = [
+    (
+        "--watch",
+        {
+            "action": "store_true",
+            "help": (
+                "Display the table and redisplay it whenever the listed "
+                "items change, until interrupted"
+            ),
+        },
+    ),
+    (
+        "--throttle",
+        {
+            "action": DefaultAction,
+            "default": 1.0,
+            "type": parse_duration,
+            "help": (
+                "Minimum interval between redisplays with --watch, e.g., "
+                '"0.5s". The default is %(default)s seconds.'
+            ),
+        },
+    ),
+]
+
+
+class WatchOptions:
+    """
+    Verifies the options for watching a listing.
+    """
+
+    def __init__(self, _namespace):
+        pass
+
+    def verify(self, namespace, parser):
+        """
+        Do supplementary parsing of conditional arguments.
+        """
+        if not namespace.watch:
+            if not getattr(namespace, "throttle_default", True):
+                parser.error(
+                    "The --throttle option may only be specified with the "
+                    "--watch option."
+                )
+            return
+
+        if any(
+            getattr(namespace, name, None) not in (None, False)
+            for name in ("name", "uuid", "all_details", "stopped")
+        ):
+            parser.error(
+                "The --watch option can only be used to display the table of "
+                "all items; it can not be used with --name, --uuid, "
+                "--all-details, or --stopped."
+            )
+
+        if not (namespace.from_snapshot is None and namespace.max_staleness is None):
+            parser.error(
+                "The --watch option obtains its information from stratisd; it "
+                "can not be used with --from-snapshot or --max-staleness."
+            )
+
+
 KEYFILE_PATH_OR_STDIN = [
     ("--keyfile-path", {"help": "Path to a key file containing a key"}),
     (
@@ -282,3 +436,58 @@ IN_PLACE = [
         },
     )
 ]
+
+ASYNC = [
+    (
+        "--async",
+        {
+            "action": "store_true",
+            "dest": "run_async",
+            "help": (
+                "Run the command in the background and print a job id, to be "
+                "given to the stratis job commands"
+            ),
+        },
+    )
+]
+
+WAIT = [
+    (
+        "--wait",
+        {
+            "nargs": "?",
+            "const": math.inf,
+            "type": parse_duration,
+            "metavar": "DURATION",
+            "help": (
+                "Wait until the operation has completed or failed, displaying "
+                "its progress; optionally, wait no longer than DURATION, "
+                'e.g., "2h"'
+            ),
+        },
+    )
+]
+
+BATCH_JSON = [
+    (
+        "--json",
+        {
+            "action": "store_true",
+            "dest": "as_json",
+            "help": "Print the result for each item as JSON instead of as a table",
+        },
+    )
+]
+
+BATCH = [
+    (
+        "--jobs",
+        {
+            "action": DefaultAction,
+            "type": ensure_positive,
+            "default": 1,
+            "metavar": "N",
+            "help": "Perform the operation on at most N items at once",
+        },
+    )
+] + BATCH_JSON
@@ -0,0 +1,180 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Profiling of a run of the program.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+PROFILE_VARIABLE = "STRATIS_PROFILE"
+PROFILE_MEMORY_VARIABLE = "STRATIS_PROFILE_MEMORY"
+
+# A profile written to a file with one of these suffixes is written as
+# collapsed stacks, one stack per line, as read by flamegraph tools.
+COLLAPSED_SUFFIXES = (".folded", ".collapsed")
+
+# Stacks that account for less time than this, in microseconds, are omitted.
+_MINIMUM_MICROSECONDS = 1
+
+# The key of a function in the profile statistics: (file, line, name)
+Function = Tuple[str, int, str]
+
+
+def _frame(function: Function) -> str:
+    """
+    Format a function as a frame of a collapsed stack.
+    """
+    (filename, line, name) = function
+    return (
+        name
+        if filename == "~"
+        else f"{name} ({os.path.basename(filename)}:{line})".replace(";", ":")
+    )
+
+
+def collapsed_stacks(stats: Dict[Function, Any]) -> Dict[str, int]:
+    """
+    Calculate the time spent in each stack from profile statistics.
+
+    A profile records the time spent in each function, and in each function
+    when called by each of its callers, but not the whole stack. The time of
+    each stack is estimated by dividing the time spent in a function among
+    its callers in proportion to the time spent in it when called by each.
+
+    :param stats: the profile statistics, as recorded by pstats.Stats
+    :returns: the time in microseconds spent in each stack, not in its callees
+    """
+    callees: Dict[Function, Dict[Function, float]] = defaultdict(dict)
+    for function, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, cumulative_time) in callers.items():
+            callees[caller][function] = cumulative_time
+
+    result: Dict[str, int] = defaultdict(int)
+
+    def walk(function: Function, stack: List[Function], share: float):
+        """
+        Add the stacks that end in function.
+
+        :param share: the share of the time spent in function due to stack
+        """
+        (_, _, own_time, cumulative_time, _) = stats[function]
+        if cumulative_time * share * 1e6 < _MINIMUM_MICROSECONDS:
+            return
+
+        stack = stack + [function]
+        microseconds = round(own_time * share * 1e6)
+        if microseconds >= _MINIMUM_MICROSECONDS:
+            result[";".join(_frame(frame) for frame in stack)] += microseconds
+
+        for callee, time in callees[function].items():
+            callee_time = stats[callee][3]
+            if callee in stack or callee_time == 0:
+                continue
+            walk(callee, stack, share * time / callee_time)
+
+    # A function that is only called by itself, or not at all, is the bottom
+    # of a stack.
+    for function, (_, _, _, _, callers) in stats.items():
+        if set(callers) <= {function}:
+            walk(function, [], 1.0)
+
+    return dict(result)
+
+
+class Profiler:
+    """
+    Profiles a run of the program, and optionally records the peak memory
+    allocated in each of its phases.
+    """
+
+    def __init__(self, path: str, *, memory: bool = False):
+        """
+        Initializer.
+
+        :param str path: the file to which the profile is written
+        :param bool memory: whether to record the peak memory of each phase
+        """
+        self.path = path
+        self.memory = memory
+        self.profile = cProfile.Profile()
+        self.phase = None
+        self.peaks: List[Tuple[str, int]] = []
+
+    @staticmethod
+    def from_environment() -> "Profiler | None":
+        """
+        Get the profiler requested by the environment, if any.
+        """
+        path = os.environ.get(PROFILE_VARIABLE, "")
+        return (
+            None
+            if path == ""
+            else Profiler(
+                path, memory=os.environ.get(PROFILE_MEMORY_VARIABLE, "") != ""
+            )
+        )
+
+    def start(self, phase: str):
+        """
+        Start profiling.
+
+        :param str phase: the first phase
+        """
+        if self.memory:
+            tracemalloc.start()
+        self.phase = phase
+        self.profile.enable()
+
+    def next_phase(self, phase: str):
+        """
+        Record the peak memory of the current phase and begin another.
+        """
+        if self.memory and self.phase is not None:
+            self.peaks.append((self.phase, tracemalloc.get_traced_memory()[1]))
+            tracemalloc.reset_peak()
+        self.phase = phase
+
+    def stop(self):
+        """
+        Stop profiling, write the profile, and report the peak memory of
+        each phase on stderr.
+        """
+        self.profile.disable()
+        if self.memory:
+            self.next_phase("")
+            tracemalloc.stop()
+            for phase, peak in self.peaks:
+                print(
+                    f"Peak memory allocated while {phase}: {peak / 1024:.1f} KiB",
+                    file=sys.stderr,
+                )
+
+        try:
+            if self.path.endswith(COLLAPSED_SUFFIXES):
+                stacks = collapsed_stacks(
+                    pstats.Stats(self.profile).stats  # pyright: ignore [reportAttributeAccessIssue]
+                )
+                with open(self.path, "w", encoding="utf-8") as profile_file:
+                    for stack, microseconds in sorted(stacks.items()):
+                        print(f"{stack} {microseconds}", file=profile_file)
+            else:
+                self.profile.dump_stats(self.path)
+        except OSError as err:
+            print(f"Could not write profile to {self.path}: {err}", file=sys.stderr)
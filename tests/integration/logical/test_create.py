@@ -15,8 +15,17 @@
 Test 'create'.
 """
 
+import json
+import os
+from tempfile import TemporaryDirectory
+
 from stratis_cli import StratisCliErrorCodes
-from stratis_cli._errors import StratisCliEngineError, StratisCliPartialChangeError
+from stratis_cli._errors import (
+    StratisCliBatchError,
+    StratisCliEngineError,
+    StratisCliPartialChangeError,
+    StratisCliResourceNotFoundError,
+)
 
 from .._misc import RUNNER, TEST_RUNNER, SimTestCase, device_name_list
 
@@ -204,3 +213,93 @@ class Create7TestCase(SimTestCase):
             "--size=1TiB",
         ]
         TEST_RUNNER(command_line)
+
+
+class CreateFromManifestTestCase(SimTestCase):
+    """
+    Test creating filesystems listed in a manifest.
+    """
+
+    _MENU = ["--propagate", "filesystem", "create"]
+    _POOLNAME = "deadpool"
+
+    def setUp(self):
+        """
+        Start the stratisd daemon with the simulator and write a manifest.
+        """
+        super().setUp()
+        command_line = ["pool", "create", self._POOLNAME] + _DEVICE_STRATEGY()
+        RUNNER(command_line)
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self._manifest = os.path.join(directory.name, "manifest.json")
+
+    def _write(self, entries):
+        with open(self._manifest, "w", encoding="utf-8") as manifest_file:
+            json.dump(entries, manifest_file)
+
+    def test_create(self):
+        """
+        The simulator creates only one filesystem per call, so a batch size
+        of 1 is required.
+        """
+        self._write(
+            [
+                {"pool": self._POOLNAME, "name": "a", "size": "1TiB"},
+                {"pool": self._POOLNAME, "name": "b", "size_limit": "2TiB"},
+            ]
+        )
+        TEST_RUNNER(self._MENU + ["--from", self._manifest, "--batch-size=1"])
+
+    def test_later_request_fails(self):
+        """
+        If a request fails after some filesystems have been created, the
+        filesystems that were not created are reported.
+        """
+        self._write(
+            [
+                {"pool": self._POOLNAME, "name": "a"},
+                {
+                    "pool": self._POOLNAME,
+                    "name": "b",
+                    "size": "1TiB",
+                    "size_limit": "512GiB",
+                },
+                {"pool": self._POOLNAME, "name": "c"},
+            ]
+        )
+        self.check_error(
+            StratisCliBatchError,
+            self._MENU + ["--from", self._manifest, "--batch-size=1"],
+            _ERROR,
+        )
+
+    def test_missing_pool(self):
+        """
+        Nothing is created if some pool in the manifest does not exist.
+        """
+        self._write(
+            [{"pool": self._POOLNAME, "name": "a"}, {"pool": "nopool", "name": "a"}]
+        )
+        self.check_error(
+            StratisCliResourceNotFoundError,
+            self._MENU + ["--from", self._manifest],
+            _ERROR,
+        )
+
+    def test_existing(self):
+        """
+        Nothing is created if some filesystem in the manifest exists.
+        """
+        RUNNER(["filesystem", "create", self._POOLNAME, "a"])
+        self._write(
+            [
+                {"pool": self._POOLNAME, "name": "a"},
+                {"pool": self._POOLNAME, "name": "b"},
+            ]
+        )
+        self.check_error(
+            StratisCliPartialChangeError,
+            self._MENU + ["--from", self._manifest, "--batch-size=1"],
+            _ERROR,
+        )
@@ -16,9 +16,13 @@ Test 'destroy'.
 """
 
 from stratis_cli import StratisCliErrorCodes
-from stratis_cli._errors import StratisCliEngineError, StratisCliPartialChangeError
+from stratis_cli._errors import (
+    StratisCliEngineError,
+    StratisCliPartialChangeError,
+    StratisCliResourceNotFoundError,
+)
 
-from .._misc import RUNNER, SimTestCase, device_name_list
+from .._misc import RUNNER, TEST_RUNNER, SimTestCase, device_name_list
 
 _DEVICE_STRATEGY = device_name_list(1)
 _ERROR = StratisCliErrorCodes.ERROR
@@ -158,3 +162,66 @@ class Destroy5TestCase(SimTestCase):
 
         command_line = self._MENU + [self._POOLNAME, self._SNAPSHOT]
         self.check_error(StratisCliEngineError, command_line, _ERROR)
+
+
+class DestroySelectedTestCase(SimTestCase):
+    """
+    Test destroying the filesystems that selectors match.
+    """
+
+    _MENU = ["--propagate", "filesystem", "destroy"]
+    _POOLNAMES = ["deadpool", "livepool"]
+
+    def setUp(self):
+        """
+        Start the stratisd daemon with the simulator.
+        """
+        super().setUp()
+        for pool_name, device in zip(self._POOLNAMES, device_name_list(2, 2, True)()):
+            RUNNER(["pool", "create", pool_name, device])
+            for fs_name in ["test-1", "test-2", "home"]:
+                RUNNER(["filesystem", "create", pool_name, fs_name])
+        RUNNER(["filesystem", "snapshot", self._POOLNAMES[0], "home", "home-snap"])
+
+    def test_match_all_pools(self):
+        """
+        Destroying the matching filesystems in every pool should succeed.
+        """
+        TEST_RUNNER(self._MENU + ["--all-pools", "--match=test-*", "--jobs=2"])
+
+    def test_snapshots_of(self):
+        """
+        Destroying the snapshots of a filesystem should succeed.
+        """
+        TEST_RUNNER(self._MENU + [self._POOLNAMES[0], "--snapshots-of=home"])
+
+    def test_older_than_dry_run(self):
+        """
+        Listing the filesystems older than some time should succeed.
+        """
+        TEST_RUNNER(
+            self._MENU
+            + ["--all-pools", "--older-than=0", "--regex", "--match=.*"]
+            + ["--dry-run"]
+        )
+
+    def test_no_origin(self):
+        """
+        Destroying the snapshots of a filesystem that does not exist must
+        fail.
+        """
+        command_line = self._MENU + [self._POOLNAMES[1], "--snapshots-of=nofs"]
+        self.check_error(StratisCliResourceNotFoundError, command_line, _ERROR)
+
+    def test_no_match(self):
+        """
+        Destroying with selectors that match no filesystem must fail.
+        """
+        for options in [
+            ["--match=tset-*"],
+            ["--snapshots-of=test-1"],
+            ["--older-than=1d", "--dry-run"],
+        ]:
+            with self.subTest(options=options):
+                command_line = self._MENU + ["--all-pools"] + options
+                self.check_error(StratisCliResourceNotFoundError, command_line, _ERROR)
@@ -200,6 +200,20 @@ class List5TestCase(SimTestCase):
             DbusClientUniqueResultError, command_line, StratisCliErrorCodes.ERROR
         )
 
+    def test_list_all_details(self):
+        """
+        Test detailed view of all filesystems in all pools.
+        """
+        command_line = self._MENU + ["--all-details"]
+        TEST_RUNNER(command_line)
+
+    def test_list_all_details_one_pool(self):
+        """
+        Test detailed view of all filesystems in one pool.
+        """
+        command_line = self._MENU + [self._POOLNAMES[0], "--all-details"]
+        TEST_RUNNER(command_line)
+
     def test_list_fs_name_snapshot(self):
         """
         Test list detailed view of a snapshot to test printing of revert information.
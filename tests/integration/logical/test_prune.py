@@ -0,0 +1,61 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test 'prune'.
+"""
+
+from .._misc import RUNNER, TEST_RUNNER, SimTestCase, device_name_list
+
+_DEVICE_STRATEGY = device_name_list(1)
+
+
+class PruneTestCase(SimTestCase):
+    """
+    Test pruning the snapshots of a filesystem.
+    """
+
+    _MENU = ["--propagate", "filesystem", "prune"]
+    _POOLNAME = "deadpool"
+    _FSNAME = "fs"
+
+    def setUp(self):
+        """
+        Start the stratisd daemon with the simulator and take some snapshots.
+        """
+        super().setUp()
+        command_line = ["pool", "create", self._POOLNAME] + _DEVICE_STRATEGY()
+        RUNNER(command_line)
+        RUNNER(["filesystem", "create", self._POOLNAME, self._FSNAME])
+        for snapshot_name in ["snap1", "snap2", "snap3"]:
+            RUNNER(
+                ["filesystem", "snapshot", self._POOLNAME, self._FSNAME, snapshot_name]
+            )
+
+    def test_dry_run(self):
+        """
+        Listing the snapshots to destroy should succeed.
+        """
+        TEST_RUNNER(self._MENU + ["--keep-last=1", "--dry-run"])
+
+    def test_prune(self):
+        """
+        Pruning the snapshots in the pool should succeed.
+        """
+        TEST_RUNNER(self._MENU + [self._POOLNAME, "--keep-last=1", "--json"])
+
+    def test_keep_all(self):
+        """
+        Pruning should succeed if every snapshot is kept.
+        """
+        TEST_RUNNER(self._MENU + ["--keep-daily=1", "--keep-last=3"])
@@ -15,9 +15,21 @@
 Test 'snapshot'.
 """
 
+import errno
+from contextlib import redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import mock
+
 from dbus_client_gen import DbusClientUniqueResultError
 from stratis_cli import StratisCliErrorCodes
-from stratis_cli._errors import StratisCliNoChangeError
+from stratis_cli._actions._freeze import FITHAW
+from stratis_cli._errors import (
+    StratisCliFreezeError,
+    StratisCliNameConflictError,
+    StratisCliNoChangeError,
+    StratisCliResourceNotFoundError,
+)
 
 from .._misc import RUNNER, TEST_RUNNER, SimTestCase, device_name_list
 
@@ -102,3 +114,110 @@ class Snapshot2TestCase(SimTestCase):
         """
         command_line = self._MENU + [self._POOLNAME, self._FSNAME, self._SNAPNAME]
         self.check_error(DbusClientUniqueResultError, command_line, _ERROR)
+
+
+class SnapshotMatchTestCase(SimTestCase):
+    """
+    Test snapshotting the filesystems whose names match a pattern.
+    """
+
+    _MENU = ["--propagate", "filesystem", "snapshot"]
+    _POOLNAME = "deadpool"
+    _FSNAMES = ["db-1", "db-2", "home"]
+
+    def setUp(self):
+        """
+        Start the stratisd daemon with the simulator.
+        """
+        super().setUp()
+        command_line = ["pool", "create", self._POOLNAME] + _DEVICE_STRATEGY()
+        RUNNER(command_line)
+        for fs_name in self._FSNAMES:
+            RUNNER(["filesystem", "create", self._POOLNAME, fs_name])
+
+    def test_match(self):
+        """
+        Snapshotting the matching filesystems concurrently should succeed.
+        """
+        command_line = self._MENU + [self._POOLNAME, "--match=db-*", "--jobs=2"]
+        TEST_RUNNER(command_line)
+
+    def test_regex_json(self):
+        """
+        Snapshotting the filesystems matching a regular expression should
+        succeed.
+        """
+        command_line = self._MENU + [
+            self._POOLNAME,
+            "--match=db-[0-9]+|home",
+            "--regex",
+            "--name-template={origin}.{date}.{time}",
+            "--json",
+        ]
+        TEST_RUNNER(command_line)
+
+    def test_no_match(self):
+        """
+        Snapshotting must fail if no filesystem matches.
+        """
+        command_line = self._MENU + [self._POOLNAME, "--match=db"]
+        self.check_error(StratisCliResourceNotFoundError, command_line, _ERROR)
+
+    def test_existing_name(self):
+        """
+        Snapshotting must fail if a snapshot would have the name of an
+        existing filesystem.
+        """
+        command_line = self._MENU + [
+            self._POOLNAME,
+            "--match=db-1",
+            "--name-template=home",
+        ]
+        self.check_error(StratisCliNameConflictError, command_line, _ERROR)
+
+    def test_group(self):
+        """
+        Snapshotting a group of filesystems that are not mounted should
+        succeed.
+        """
+        command_line = self._MENU + [
+            self._POOLNAME,
+            "--group=db-1,home",
+            "--name-template={origin}-snap",
+        ]
+        TEST_RUNNER(command_line)
+
+    def test_group_thaw_failed(self):
+        """
+        If a filesystem of a group can not be thawed, the results of the
+        snapshots are printed before the error is raised.
+        """
+
+        def fail_thaw(_fd, request, _arg):
+            if request == FITHAW:
+                raise OSError(errno.EIO, "thaw failed")
+
+        command_line = self._MENU + [
+            self._POOLNAME,
+            "--group=db-1,home",
+            "--name-template={origin}-snap",
+        ]
+        with TemporaryDirectory() as directory:
+            stdout = StringIO()
+            with (
+                mock.patch(
+                    "stratis_cli._actions._logical.mount_points",
+                    side_effect=lambda devnodes: {devnodes[0]: directory},
+                ),
+                mock.patch("stratis_cli._actions._freeze.ioctl", side_effect=fail_thaw),
+                redirect_stdout(stdout),
+            ):
+                self.check_error(StratisCliFreezeError, command_line, _ERROR)
+        self.assertIn("db-1-snap", stdout.getvalue())
+
+    def test_group_missing(self):
+        """
+        Snapshotting a group must fail if some filesystem does not exist.
+        """
+        command_line = self._MENU + [self._POOLNAME, "--group=db-1,db-3"]
+        self.check_error(StratisCliResourceNotFoundError, command_line, _ERROR)
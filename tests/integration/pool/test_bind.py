@@ -16,7 +16,12 @@ Test 'bind'.
 """
 
 from stratis_cli import StratisCliErrorCodes
-from stratis_cli._errors import StratisCliEngineError, StratisCliNoChangeError
+from stratis_cli._errors import (
+    StratisCliBatchError,
+    StratisCliEngineError,
+    StratisCliNoChangeError,
+    StratisCliResourceNotFoundError,
+)
 
 from .._keyutils import RandomKeyTmpFile
 from .._misc import RUNNER, TEST_RUNNER, SimTestCase, device_name_list
@@ -184,3 +189,59 @@ class BindTestCase3(SimTestCase):
                 RUNNER(command_line)
             else:
                 self.check_error(StratisCliEngineError, command_line, _ERROR)
+
+
+class BindManyTestCase(SimTestCase):
+    """
+    Test binding, rebinding, and unbinding many encrypted pools at once.
+    """
+
+    _MENU = ["--propagate", "pool", "encryption"]
+    _POOLNAMES = ["pool-1", "pool-2"]
+    _KEY_DESC = "keydesc"
+
+    def setUp(self):
+        super().setUp()
+        with RandomKeyTmpFile() as fname:
+            RUNNER(
+                ["--propagate", "key", "set", "--keyfile-path", fname, self._KEY_DESC]
+            )
+
+        for pool_name, device in zip(
+            self._POOLNAMES + ["plain"], device_name_list(3, 3, True)()
+        ):
+            RUNNER(
+                ["--propagate", "pool", "create"]
+                + ([] if pool_name == "plain" else ["--clevis=tpm2"])
+                + [pool_name, device]
+            )
+
+    def test_bind_all_encrypted(self):
+        """
+        Binding every encrypted pool with a key should succeed; binding
+        again makes no change for any.
+        """
+        command_line = self._MENU + [
+            "bind",
+            "keyring",
+            "--all-encrypted",
+            self._KEY_DESC,
+            "--jobs=2",
+        ]
+        TEST_RUNNER(command_line)
+        self.check_error(StratisCliBatchError, command_line, _ERROR)
+
+    def test_rebind_and_unbind_match(self):
+        """
+        Rebinding and unbinding the matching encrypted pools should succeed.
+        """
+        TEST_RUNNER(self._MENU + ["rebind", "clevis", "--match=pool-*", "--json"])
+        TEST_RUNNER(self._MENU + ["bind", "keyring", "--match=pool-*", self._KEY_DESC])
+        TEST_RUNNER(self._MENU + ["unbind", "clevis", "--match=pool-*"])
+
+    def test_match_unencrypted(self):
+        """
+        Only encrypted pools are selected.
+        """
+        command_line = self._MENU + ["bind", "tpm2", "--match=plain"]
+        self.check_error(StratisCliResourceNotFoundError, command_line, _ERROR)
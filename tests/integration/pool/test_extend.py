@@ -89,3 +89,10 @@ class ExtendDataTestCase(SimTestCase):
             f"{uuid4()}",
         ]
         self.check_error(StratisCliResourceNotFoundError, command_line, _ERROR)
+
+    def test_all_pools(self):
+        """
+        Test trying to extend every pool when no device has changed size.
+        """
+        command_line = self._MENU + ["--all-pools", "--jobs=4"]
+        self.check_error(StratisCliNoDeviceSizeChangeError, command_line, _ERROR)
@@ -118,6 +118,13 @@ class List2TestCase(SimTestCase):
         command_line = self._MENU + [f"--uuid={uuid4()}"]
         self.check_error(DbusClientUniqueResultError, command_line, _ERROR)
 
+    def test_list_all_details(self):
+        """
+        Test detailed list view for all pools.
+        """
+        command_line = self._MENU + ["--all-details"]
+        TEST_RUNNER(command_line)
+
     def test_list_with_uuid(self):
         """
         Test detailed list view for a specific uuid.
@@ -247,6 +254,14 @@ class List4TestCase(SimTestCase):
         RUNNER(command_line)
         TEST_RUNNER(self._MENU + ["--stopped", f"--name={self._POOLNAME}"])
 
+    def test_list_stopped_all_details(self):
+        """
+        Test detailed view on all stopped pools.
+        """
+        command_line = ["pool", "stop", f"--name={self._POOLNAME}"]
+        RUNNER(command_line)
+        TEST_RUNNER(self._MENU + ["--stopped", "--all-details"])
+
     def test_list_running(self):
         """
         Test list all running pools.
@@ -259,6 +274,12 @@ class List4TestCase(SimTestCase):
         """
         TEST_RUNNER(self._MENU + [f"--name={self._POOLNAME}"])
 
+    def test_list_all_details(self):
+        """
+        Test detail view on all running pools.
+        """
+        TEST_RUNNER(self._MENU + ["--all-details"])
+
 
 class List5TestCase(SimTestCase):
     """
@@ -20,13 +20,14 @@ from uuid import uuid4
 from stratis_cli import StratisCliErrorCodes
 from stratis_cli._constants import UnlockMethod
 from stratis_cli._errors import (
+    StratisCliBatchError,
     StratisCliEngineError,
     StratisCliInvalidCommandLineOptionValue,
     StratisCliNoChangeError,
     StratisCliResourceNotFoundError,
 )
 
-from .._misc import RUNNER, SimTestCase, device_name_list, stop_pool
+from .._misc import RUNNER, TEST_RUNNER, SimTestCase, device_name_list, stop_pool
 
 _ERROR = StratisCliErrorCodes.ERROR
 _DEVICE_STRATEGY = device_name_list(1, 1)
@@ -150,6 +151,22 @@ class StartTestCase(SimTestCase):
         ]
         self.check_error(StratisCliResourceNotFoundError, command_line, _ERROR)
 
+    def test_method_keyring_unknown_pool_capture_key(self):
+        """
+        Test that an unknown pool is reported before the passphrase is asked
+        for.
+        """
+        command_line = ["pool", "stop", f"--name={self._POOLNAME}"]
+        RUNNER(command_line)
+        command_line = self._MENU + [
+            "--name=bogus",
+            f"--unlock-method={UnlockMethod.KEYRING}",
+            "--capture-key",
+        ]
+        self.check_error(
+            StratisCliResourceNotFoundError, command_line, _ERROR, stdin=""
+        )
+
     def test_method_keyring_good_uuid(self):
         """
         Test trying to start an unencrypted pool with unlock method keyring, no
@@ -159,3 +176,45 @@ class StartTestCase(SimTestCase):
 
         command_line = self._MENU + [f"--uuid={pool_uuid}", "--unlock-method=keyring"]
         self.check_error(StratisCliInvalidCommandLineOptionValue, command_line, _ERROR)
+
+
+class StartAllTestCase(SimTestCase):
+    """
+    Test 'start' on many stopped sim pools.
+    """
+
+    _MENU = ["--propagate", "pool", "start"]
+    _POOLNAMES = ["pool-1", "pool-2", "other"]
+
+    def setUp(self):
+        super().setUp()
+        for pool_name, device in zip(self._POOLNAMES, device_name_list(3, 3, True)()):
+            RUNNER(["pool", "create", pool_name, device])
+            RUNNER(["pool", "stop", f"--name={pool_name}"])
+
+    def test_all(self):
+        """
+        Test starting every stopped pool.
+        """
+        TEST_RUNNER(self._MENU + ["--all", "--jobs=3"])
+
+    def test_match(self):
+        """
+        Test starting the stopped pools whose names match a pattern.
+        """
+        TEST_RUNNER(self._MENU + ["--match=pool-*", "--json"])
+        self.check_error(
+            StratisCliResourceNotFoundError, self._MENU + ["--match=pool-*"], _ERROR
+        )
+
+    def test_capture_key(self):
+        """
+        Test starting unencrypted pools with a passphrase, which is read
+        once, and which stratisd rejects for each pool.
+        """
+        self.check_error(
+            StratisCliBatchError,
+            self._MENU + ["--all", "--capture-key"],
+            _ERROR,
+            stdin="password\n",
+        )
@@ -18,7 +18,11 @@ Test 'stop'.
 from uuid import uuid4
 
 from stratis_cli import StratisCliErrorCodes
-from stratis_cli._errors import StratisCliEngineError, StratisCliNoChangeError
+from stratis_cli._errors import (
+    StratisCliEngineError,
+    StratisCliNoChangeError,
+    StratisCliResourceNotFoundError,
+)
 
 from .._misc import RUNNER, TEST_RUNNER, SimTestCase, device_name_list
 
@@ -60,3 +64,33 @@ class StopTestCase(SimTestCase):
         """
         command_line = self._MENU + [f"--uuid={uuid4()}"]
         self.check_error(StratisCliEngineError, command_line, _ERROR)
+
+
+class StopAllTestCase(SimTestCase):
+    """
+    Test 'stop' on many sim pools.
+    """
+
+    _MENU = ["--propagate", "pool", "stop"]
+    _POOLNAMES = ["pool-1", "pool-2", "other"]
+
+    def setUp(self):
+        super().setUp()
+        for pool_name, device in zip(self._POOLNAMES, device_name_list(3, 3, True)()):
+            RUNNER(["pool", "create", pool_name, device])
+
+    def test_all(self):
+        """
+        Stopping every pool should succeed.
+        """
+        TEST_RUNNER(self._MENU + ["--all", "--jobs=3"])
+
+    def test_match(self):
+        """
+        Stopping the pools whose names match should succeed; once they are
+        stopped, no pool matches.
+        """
+        TEST_RUNNER(self._MENU + ["--match=pool-*", "--json"])
+        self.check_error(
+            StratisCliResourceNotFoundError, self._MENU + ["--match=pool-*"], _ERROR
+        )
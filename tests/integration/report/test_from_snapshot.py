@@ -0,0 +1,220 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test listing from a saved managed_objects_report.
+"""
+
+import gzip
+import os
+from contextlib import redirect_stdout
+from io import StringIO
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from unittest import mock
+
+from stratis_cli import StratisCliErrorCodes
+from stratis_cli._actions import _cache
+from stratis_cli._errors import (
+    StratisCliInvalidCommandLineOptionValue,
+    StratisCliReportFileError,
+    StratisCliResourceNotFoundError,
+)
+from stratis_cli._stratisd_constants import ReportKey
+
+from .._misc import RUNNER, SimTestCase, device_name_list
+
+_ERROR = StratisCliErrorCodes.ERROR
+_DEVICE_STRATEGY = device_name_list(2)
+
+
+class FromSnapshotTestCase(SimTestCase):
+    """
+    Test listing from a saved managed_objects_report.
+    """
+
+    _POOLNAME = "deadpool"
+    _FSNAME = "fs"
+
+    def setUp(self):
+        """
+        Start the stratisd daemon with the simulator and create a pool with
+        a filesystem.
+        """
+        super().setUp()
+        RUNNER(["pool", "create", self._POOLNAME] + _DEVICE_STRATEGY())
+        RUNNER(["filesystem", "create", self._POOLNAME, self._FSNAME])
+
+    def _output(self, command_line):
+        """
+        Run a command and return its output.
+        """
+        with redirect_stdout(StringIO()) as output:
+            RUNNER(["--propagate"] + command_line)
+        return output.getvalue()
+
+    def _save_report(self, report_name, *, compress=False):
+        """
+        Save the current report in a temporary file.
+
+        :param ReportKey report_name: the report to save
+        :param bool compress: whether to gzip compress the report
+        :returns: the temporary file
+        """
+        report = self._output(["report", report_name.value])
+        report_file = NamedTemporaryFile("wb", suffix=".json")
+        report_file.write(
+            gzip.compress(report.encode()) if compress else report.encode()
+        )
+        report_file.flush()
+        self.addCleanup(report_file.close)
+        return report_file
+
+    def test_same_output(self):
+        """
+        Test that listing from a saved report is the same as listing from
+        stratisd.
+        """
+        for compress in (False, True):
+            snapshot = self._save_report(ReportKey.MANAGED_OBJECTS, compress=compress)
+            for command_line in [
+                ["pool"],
+                ["pool", "list", f"--name={self._POOLNAME}"],
+                ["pool", "list", "--all-details"],
+                ["filesystem"],
+                ["filesystem", "list", self._POOLNAME, f"--name={self._FSNAME}"],
+                ["blockdev", "list", self._POOLNAME],
+            ]:
+                with self.subTest(command_line=command_line, compress=compress):
+                    self.assertEqual(
+                        self._output(
+                            [f"--from-snapshot={snapshot.name}"] + command_line
+                        ),
+                        self._output(command_line),
+                    )
+
+    def test_snapshot_unchanged(self):
+        """
+        Test that a listing from a saved report does not show later changes.
+        """
+        snapshot = self._save_report(ReportKey.MANAGED_OBJECTS)
+        before = self._output(["filesystem"])
+        RUNNER(["filesystem", "create", self._POOLNAME, "fs2"])
+        self.assertEqual(
+            self._output([f"--from-snapshot={snapshot.name}", "filesystem"]), before
+        )
+
+    def test_not_managed_objects(self):
+        """
+        Test that a report of another kind is rejected.
+        """
+        snapshot = self._save_report(ReportKey.ENGINE_STATE)
+        self.check_error(
+            StratisCliReportFileError,
+            ["--propagate", f"--from-snapshot={snapshot.name}", "pool"],
+            _ERROR,
+        )
+
+    def test_stopped(self):
+        """
+        Test that stopped pools can not be listed from a saved report.
+        """
+        snapshot = self._save_report(ReportKey.MANAGED_OBJECTS)
+        self.check_error(
+            StratisCliInvalidCommandLineOptionValue,
+            ["--propagate", f"--from-snapshot={snapshot.name}"]
+            + ["pool", "list", "--stopped"],
+            _ERROR,
+        )
+
+
+class MaxStalenessTestCase(SimTestCase):
+    """
+    Test listing from the cache.
+    """
+
+    _POOLNAME = "deadpool"
+
+    def setUp(self):
+        """
+        Start the stratisd daemon with the simulator, create a pool, and
+        use a temporary cache directory.
+        """
+        super().setUp()
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self._cache_path = os.path.join(directory.name, "managed_objects.json")
+        patcher = mock.patch.object(_cache, "CACHE_DIRECTORY", directory.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        RUNNER(["pool", "create", self._POOLNAME] + _DEVICE_STRATEGY())
+
+    def _output(self, command_line):
+        """
+        Run a command and return its output.
+        """
+        with redirect_stdout(StringIO()) as output:
+            RUNNER(["--propagate"] + command_line)
+        return output.getvalue()
+
+    def test_same_output(self):
+        """
+        Test that listing from the cache is the same as listing from
+        stratisd.
+        """
+        for command_line in [
+            ["pool"],
+            ["pool", "list", f"--name={self._POOLNAME}"],
+            ["filesystem"],
+            ["blockdev"],
+        ]:
+            for _ in range(2):
+                with self.subTest(command_line=command_line):
+                    self.assertEqual(
+                        self._output(["--max-staleness=1h"] + command_line),
+                        self._output(command_line),
+                    )
+
+    def test_invalidate(self):
+        """
+        Test that a change made with this CLI is listed immediately.
+        """
+        self._output(["--max-staleness=1h", "filesystem"])
+        RUNNER(["filesystem", "create", self._POOLNAME, "fs"])
+        self.assertIn("fs", self._output(["--max-staleness=1h", "filesystem"]))
+
+    def test_invalidated_on_failure(self):
+        """
+        Test that the cache is kept after a command that changes nothing, and
+        removed after a command that may change something, even if it fails.
+        """
+        self._output(["--max-staleness=1h", "filesystem"])
+        self._output(["daemon", "version"])
+        self._output(["report", "engine_state_report"])
+        self.assertTrue(os.path.exists(self._cache_path))
+
+        self.check_error(
+            StratisCliResourceNotFoundError,
+            ["--propagate", "filesystem", "create", "nopool", "fs"],
+            _ERROR,
+        )
+        self.assertFalse(os.path.exists(self._cache_path))
+
+    def test_stopped(self):
+        """
+        Test that stopped pools can not be listed from the cache.
+        """
+        self.check_error(
+            StratisCliInvalidCommandLineOptionValue,
+            ["--propagate", "--max-staleness=1h", "pool", "list", "--stopped"],
+            _ERROR,
+        )
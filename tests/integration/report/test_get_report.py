@@ -15,15 +15,24 @@
 Test 'stratis report'.
 """
 
+import json
 import os
 import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 
 from stratis_cli import StratisCliErrorCodes
+from stratis_cli._errors import (
+    StratisCliReportFileError,
+    StratisCliResourceNotFoundError,
+)
 from stratis_cli._stratisd_constants import ReportKey
 
-from .._misc import TEST_RUNNER, SimTestCase
+from .._misc import RUNNER, TEST_RUNNER, SimTestCase, device_name_list
 
 _ERROR = StratisCliErrorCodes.ERROR
+_DEVICE_STRATEGY = device_name_list(1)
 
 
 class ReportTestCase(SimTestCase):
@@ -62,3 +71,198 @@ class ReportTestCase(SimTestCase):
         Test getting managed_objects report.
         """
         TEST_RUNNER(self._MENU + [ReportKey.MANAGED_OBJECTS.value])
+
+
+class ReportPathTestCase(SimTestCase):
+    """
+    Test selecting a part of a report and printing reports unformatted.
+    """
+
+    _MENU = ["--propagate", "report"]
+    _POOLNAME = "reportpool"
+
+    def setUp(self):
+        """
+        Start the stratisd daemon with the simulator and create a pool.
+        """
+        super().setUp()
+        command_line = ["pool", "create", self._POOLNAME] + _DEVICE_STRATEGY()
+        RUNNER(command_line)
+
+    def test_engine_state_report_raw(self):
+        """
+        Test getting engine state report without reformatting.
+        """
+        TEST_RUNNER(self._MENU + [ReportKey.ENGINE_STATE.value, "--raw"])
+
+    def test_managed_objects_report_raw(self):
+        """
+        Test getting managed_objects report without reformatting.
+        """
+        TEST_RUNNER(self._MENU + [ReportKey.MANAGED_OBJECTS.value, "--raw"])
+
+    def test_engine_state_report_path(self):
+        """
+        Test getting a part of the engine state report.
+        """
+        for path in ["$", "$.pools", "$.pools[0]", '$["pools"][0]']:
+            for extra in [[], ["--raw"], ["--no-sort-keys"]]:
+                TEST_RUNNER(
+                    self._MENU + [ReportKey.ENGINE_STATE.value, "--path", path] + extra
+                )
+
+    def test_managed_objects_report_path(self):
+        """
+        Test getting a part of the managed_objects report.
+        """
+        TEST_RUNNER(
+            self._MENU
+            + [ReportKey.MANAGED_OBJECTS.value, "--path", '$["/org/storage/stratis3"]']
+        )
+
+    def test_engine_state_report_path_not_found(self):
+        """
+        Test that a path that does not exist in the report is an error.
+        """
+        for path in ["$.nonexistent", "$.pools[1000]", "$.pools.name"]:
+            self.check_error(
+                StratisCliResourceNotFoundError,
+                self._MENU + [ReportKey.ENGINE_STATE.value, "--path", path],
+                _ERROR,
+            )
+
+    def test_managed_objects_report_path_not_found(self):
+        """
+        Test that a path that does not exist in the report is an error.
+        """
+        self.check_error(
+            StratisCliResourceNotFoundError,
+            self._MENU + [ReportKey.MANAGED_OBJECTS.value, "--path", "$.nonexistent"],
+            _ERROR,
+        )
+
+
+class ReportDiffTestCase(SimTestCase):
+    """
+    Test comparing reports.
+    """
+
+    _MENU = ["--propagate", "report"]
+    _POOLNAME = "diffpool"
+
+    def _save_report(self, report_name):
+        """
+        Save the current report in a temporary file.
+
+        :param ReportKey report_name: the report to save
+        :returns: the temporary file
+        """
+        with redirect_stdout(StringIO()) as output:
+            RUNNER(self._MENU + [report_name.value])
+        report_file = NamedTemporaryFile("w", suffix=".json")
+        report_file.write(output.getvalue())
+        report_file.flush()
+        self.addCleanup(report_file.close)
+        return report_file
+
+    def _diff(self, command_line):
+        """
+        Run a diff command and return its decoded output.
+        """
+        with redirect_stdout(StringIO()) as output:
+            RUNNER(self._MENU + ["diff"] + command_line)
+        return json.loads(output.getvalue())
+
+    def test_diff_engine_state_live(self):
+        """
+        Test that creating a pool shows up as an added pool.
+        """
+        old = self._save_report(ReportKey.ENGINE_STATE)
+        self.assertEqual(
+            self._diff([old.name]), {"added": {}, "removed": {}, "changed": {}}
+        )
+
+        RUNNER(["pool", "create", self._POOLNAME] + _DEVICE_STRATEGY())
+
+        result = self._diff([old.name])
+        self.assertIn("$.pools[0]", result["added"])
+
+    def test_diff_managed_objects_live(self):
+        """
+        Test that creating a pool shows up as added objects.
+        """
+        old = self._save_report(ReportKey.MANAGED_OBJECTS)
+        self.assertEqual(
+            self._diff([old.name]), {"added": {}, "removed": {}, "changed": {}}
+        )
+
+        RUNNER(["pool", "create", self._POOLNAME] + _DEVICE_STRATEGY())
+
+        self.assertNotEqual(self._diff([old.name])["added"], {})
+
+    def test_diff_files(self):
+        """
+        Test comparing two saved reports.
+        """
+        old = self._save_report(ReportKey.ENGINE_STATE)
+        RUNNER(["pool", "create", self._POOLNAME] + _DEVICE_STRATEGY())
+        new = self._save_report(ReportKey.ENGINE_STATE)
+
+        self.assertIn("$.pools[0]", self._diff([old.name, new.name])["added"])
+        self.assertIn("$.pools[0]", self._diff([new.name, old.name])["removed"])
+
+    def test_diff_no_file(self):
+        """
+        Test that a report file that does not exist is an error.
+        """
+        new = self._save_report(ReportKey.ENGINE_STATE)
+        self.check_error(
+            StratisCliReportFileError,
+            self._MENU + ["diff", "/nonexistent/report.json", new.name],
+            _ERROR,
+        )
+
+
+class ReportEveryTestCase(SimTestCase):
+    """
+    Test saving reports periodically.
+    """
+
+    _MENU = ["--propagate", "report"]
+
+    def test_every(self):
+        """
+        Test that an unchanging report is saved once.
+        """
+        for report_name in (ReportKey.ENGINE_STATE, ReportKey.MANAGED_OBJECTS):
+            with TemporaryDirectory() as directory:
+                TEST_RUNNER(
+                    self._MENU
+                    + [report_name.value]
+                    + ["--every=0.01", f"--dir={directory}", "--count=3"]
+                )
+                self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_every_keep(self):
+        """
+        Test saving a selected part of a report with --keep.
+        """
+        with TemporaryDirectory() as directory:
+            TEST_RUNNER(
+                self._MENU
+                + ["--every=0.01", f"--dir={directory}", "--keep=1", "--count=2"]
+                + ["--path=$.pools"]
+            )
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_every_bad_dir(self):
+        """
+        Test that a directory that can not be created is an error.
+        """
+        with NamedTemporaryFile() as not_a_directory:
+            self.check_error(
+                StratisCliReportFileError,
+                self._MENU
+                + ["--every=1", f"--dir={not_a_directory.name}", "--count=1"],
+                _ERROR,
+            )
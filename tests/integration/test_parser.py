@@ -66,6 +66,155 @@ class ParserTestCase(RunTestCase):
         """
         self._do_test(["report", "notreport"])
 
+    def test_report_bad_path(self):
+        """
+        Verify that an ill-formed report path is rejected.
+        """
+        for path in ["pools", "$pools", "$.pools[-1]", "$.pools[name]"]:
+            self._do_test(["report", "--path", path])
+
+    def test_report_every_options(self):
+        """
+        Verify that the options for saving reports periodically are
+        checked.
+        """
+        for command_line in [
+            ["report", "--every=60"],
+            ["report", "--dir=/tmp"],
+            ["report", "engine_state_report", "--keep=3"],
+            ["report", "--every=0", "--dir=/tmp"],
+            ["report", "--every=1x", "--dir=/tmp"],
+            ["report", "--every=1", "--dir=/tmp", "--keep=0"],
+        ]:
+            self._do_test(command_line)
+
+    def test_from_snapshot_not_list(self):
+        """
+        Verify that --from-snapshot is rejected by commands that do not list.
+        """
+        for command_line in [
+            ["--from-snapshot=report.json", "pool", "create", "pn", "/dev/n"],
+            ["--from-snapshot=report.json", "report"],
+            ["--from-snapshot=report.json", "key", "list"],
+            ["--max-staleness=5", "pool", "create", "pn", "/dev/n"],
+            ["--max-staleness=5", "report"],
+        ]:
+            self._do_test(command_line)
+
+    def test_profile_memory_without_profile(self):
+        """
+        Verify that --profile-memory requires --profile.
+        """
+        self._do_test(["--profile-memory", "pool", "list"])
+
+    def test_max_staleness_options(self):
+        """
+        Verify that --max-staleness is checked.
+        """
+        for command_line in [
+            ["--max-staleness=5x", "pool"],
+            ["--max-staleness=-5", "pool"],
+            ["--max-staleness=5", "--from-snapshot=report.json", "pool"],
+        ]:
+            self._do_test(command_line)
+
+    def test_watch_options(self):
+        """
+        Verify that --watch is only accepted for a table of all items.
+        """
+        for command_line in [
+            ["pool", "list", "--throttle=2"],
+            ["pool", "list", "--watch", "--throttle=2x"],
+            ["pool", "list", "--watch", "--name=pn"],
+            ["pool", "list", "--watch", "--all-details"],
+            ["pool", "list", "--watch", "--stopped"],
+            ["--max-staleness=5", "pool", "list", "--watch"],
+            ["--from-snapshot=report.json", "blockdev", "list", "--watch"],
+            ["blockdev", "list", "--throttle=2"],
+            ["filesystem", "list", "pn", "--watch", "--name=fn"],
+            ["filesystem", "list", "--throttle=0.5"],
+        ]:
+            self._do_test(command_line)
+
+    def test_wait_bad_duration(self):
+        """
+        Verify that --wait only accepts a well-formed duration.
+        """
+        for command_line in [
+            ["pool", "encryption", "on", "--in-place", "--name=pn", "--wait=2x"],
+            ["pool", "encryption", "off", "--in-place", "--name=pn", "--wait=-1"],
+            ["pool", "encryption", "reencrypt", "--in-place", "--name=pn", "--wait="],
+        ]:
+            self._do_test(command_line)
+
+    def test_job_wait(self):
+        """
+        Verify that job wait requires a job id and a well-formed timeout.
+        """
+        for command_line in [
+            ["job", "wait"],
+            ["job", "wait", "0" * 32, "--timeout=1x"],
+            ["filesystem", "rename", "pn", "fn", "fn2", "--async"],
+        ]:
+            self._do_test(command_line)
+
+    def test_trace_dbus_bad_file(self):
+        """
+        Verify that the trace file must be writable.
+        """
+        self._do_test(["--trace-dbus=/", "pool", "list"])
+
+    def test_bus_address_misplaced(self):
+        """
+        Verify that the bus address requires a value and is accepted only
+        before the subcommand.
+        """
+        for command_line in [
+            ["pool", "list", "--bus-address=unix:path=/run/example/bus"],
+            ["--bus-address"],
+        ]:
+            self._do_test(command_line)
+
+    def test_deadline_bad_duration(self):
+        """
+        Verify that the deadline must be a duration.
+        """
+        self._do_test(["--deadline", "soon", "pool", "list"])
+
+    def test_extend_data_pools(self):
+        """
+        Verify that exactly one of a pool name and --all-pools is accepted.
+        """
+        for command_line in [
+            ["pool", "extend-data"],
+            ["pool", "extend-data", "poolname", "--all-pools"],
+        ]:
+            self._do_test(command_line)
+
+    def test_extend_data_bad_jobs(self):
+        """
+        Verify that the number of jobs must be positive.
+        """
+        self._do_test(["pool", "extend-data", "--all-pools", "--jobs=0"])
+
+    def test_report_diff_no_report(self):
+        """
+        Verify that report diff requires at least one report.
+        """
+        self._do_test(["report", "diff"])
+
+    def test_report_raw_no_sort_keys(self):
+        """
+        Verify that --raw can not be combined with --no-sort-keys.
+        """
+        for command_line in [
+            ["report", "--raw", "--no-sort-keys"],
+            ["report", "engine_state_report", "--raw", "--no-sort-keys"],
+            ["report", "--raw", "managed_objects_report", "--no-sort-keys"],
+            ["report", "--no-sort-keys", "engine_state_report", "--raw"],
+        ]:
+            self._do_test(command_line)
+
     def test_negative_filesystem_limit(self):
         """
         Verify that a negative integer filesystem limit is rejected.
@@ -97,6 +246,16 @@ class ParserTestCase(RunTestCase):
         """
         self._do_test(["fs", "list", "--name=bogus"])
 
+    def test_stratis_list_all_details_with_name(self):
+        """
+        Verify that --all-details can not be combined with a name or UUID.
+        """
+        for command_line in [
+            ["pool", "list", "--all-details", "--name=bogus"],
+            ["fs", "list", "pn", "--all-details", "--name=bogus"],
+        ]:
+            self._do_test(command_line)
+
     def test_stratis_list_filesystem_with_post_parser_1(self):
         """
         Verify that parser error is returned if unsettable option is assigned.
@@ -109,6 +268,149 @@ class ParserTestCase(RunTestCase):
         """
         self._do_test(["fs", "list", "--post-parser"])
 
+    def test_filesystem_create_from(self):
+        """
+        Verify that a manifest can not be combined with a pool name or size,
+        and that a filesystem name is required without one.
+        """
+        for command_line in [
+            ["filesystem", "create", "pn"],
+            ["filesystem", "create", "pn", "fn", "--from=manifest.json"],
+            ["filesystem", "create", "--from=manifest.json", "--size=2GiB"],
+            ["filesystem", "create", "--from=-", "--async"],
+            ["filesystem", "create", "--from=/nonexistent/manifest.json"],
+            ["filesystem", "create", "pn", "fn", "--batch-size=0"],
+        ]:
+            self._do_test(command_line)
+
+    def test_filesystem_snapshot_match(self):
+        """
+        Verify that snapshot requires either an origin and a snapshot name
+        or a valid pattern and template, and rejects the options that have
+        no effect.
+        """
+        for command_line in [
+            ["filesystem", "snapshot", "pn", "fn"],
+            ["filesystem", "snapshot", "pn", "fn", "--match=*"],
+            ["filesystem", "snapshot", "pn", "fn", "sn", "--regex"],
+            ["filesystem", "snapshot", "pn", "--match=(", "--regex"],
+            ["filesystem", "snapshot", "pn", "--match=*", "--name-template={bad}"],
+            ["filesystem", "snapshot", "pn", "--match=*", "--name-template={"],
+            ["filesystem", "snapshot", "pn", "--match=*", "--jobs=0"],
+            ["filesystem", "snapshot", "pn", "--group=a,b", "--match=*"],
+            ["filesystem", "snapshot", "pn", "fn", "--group=a,b"],
+            ["filesystem", "snapshot", "pn", "--group=a,,b"],
+            ["filesystem", "snapshot", "pn", "--group=a,b,a"],
+            ["filesystem", "snapshot", "pn", "fn", "sn", "--jobs=2"],
+            ["filesystem", "snapshot", "pn", "fn", "sn", "--json"],
+            ["filesystem", "snapshot", "pn", "--group=a,b", "--jobs=2"],
+        ]:
+            self._do_test(command_line)
+
+    def test_filesystem_destroy_selectors(self):
+        """
+        Verify that destroy requires either names in a pool, or selectors in
+        exactly one of a pool and every pool.
+        """
+        for command_line in [
+            ["filesystem", "destroy", "pn"],
+            ["filesystem", "destroy", "pn", "fn", "--all-pools"],
+            ["filesystem", "destroy", "pn", "fn", "--dry-run"],
+            ["filesystem", "destroy", "pn", "fn", "--match=*"],
+            ["filesystem", "destroy", "--match=*"],
+            ["filesystem", "destroy", "pn", "--match=*", "--all-pools"],
+            ["filesystem", "destroy", "pn", "--match=(", "--regex"],
+            ["filesystem", "destroy", "--all-pools", "--older-than=7w"],
+        ]:
+            self._do_test(command_line)
+
+    def test_pool_start_all(self):
+        """
+        Verify that --all and --match are alternatives to a pool identifier,
+        and that --jobs and --json require them.
+        """
+        for command_line in [
+            ["pool", "start", "--all", "--name=pn"],
+            ["pool", "start", "--all", "--match=p*"],
+            ["pool", "start", "--all", "--jobs=0"],
+            ["pool", "start", "--name=pn", "--jobs=2"],
+            ["pool", "start", "--name=pn", "--json"],
+        ]:
+            self._do_test(command_line)
+
+    def test_pool_stop_all(self):
+        """
+        Verify that --all and --match are alternatives to a pool identifier,
+        and that --jobs and --json require them.
+        """
+        for command_line in [
+            ["pool", "stop"],
+            ["pool", "stop", "--match=p*", "--name=pn"],
+            ["pool", "stop", "--all", "--jobs=0"],
+            ["pool", "stop", "--name=pn", "--jobs=2"],
+            ["pool", "stop", "--name=pn", "--json"],
+        ]:
+            self._do_test(command_line)
+
+    def test_bind_many(self):
+        """
+        Verify that --all-encrypted and --match are alternatives to a pool
+        identifier, and that --jobs and --json require them.
+        """
+        for command_line in [
+            ["pool", "encryption", "bind", "tpm2", "--all-encrypted", "--name=pn"],
+            ["pool", "encryption", "unbind", "clevis", "--all-encrypted", "--match=*"],
+            ["pool", "encryption", "rebind", "clevis", "--all-encrypted", "--jobs=0"],
+            ["pool", "encryption", "bind", "tpm2", "--name=pn", "--jobs=2"],
+            [
+                "pool",
+                "encryption",
+                "bind",
+                "nbde",
+                "--name=pn",
+                "--trust-url",
+                "u",
+                "--json",
+            ],
+            ["pool", "encryption", "bind", "keyring", "--name=pn", "kd", "--json"],
+            ["pool", "encryption", "rebind", "clevis", "--name=pn", "--jobs=2"],
+            ["pool", "encryption", "rebind", "keyring", "--name=pn", "kd", "--json"],
+            ["pool", "encryption", "unbind", "clevis", "--name=pn", "--json"],
+        ]:
+            self._do_test(command_line)
+
+    def test_reencrypt_many(self):
+        """
+        Verify that --all-encrypted is an alternative to a pool identifier,
+        that --max-inflight must be positive, and that --max-inflight and
+        --json require many pools.
+        """
+        for command_line in [
+            ["pool", "encryption", "reencrypt", "--all-encrypted", "--name=pn"],
+            ["pool", "encryption", "reencrypt", "--all-encrypted", "--max-inflight=0"],
+            [
+                "pool",
+                "encryption",
+                "reencrypt",
+                "--in-place",
+                "--name=pn",
+                "--max-inflight=2",
+            ],
+            ["pool", "encryption", "reencrypt", "--in-place", "--name=pn", "--json"],
+        ]:
+            self._do_test(command_line)
+
+    def test_filesystem_prune_keep_nothing(self):
+        """
+        Verify that prune requires some retention rule.
+        """
+        for command_line in [
+            ["filesystem", "prune"],
+            ["filesystem", "prune", "pn", "--keep-last=0"],
+            ["filesystem", "prune", "--keep-daily=-1"],
+        ]:
+            self._do_test(command_line)
+
 
 class TestFilesystemSizeParsing(ParserTestCase):
     """
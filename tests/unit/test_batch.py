@@ -0,0 +1,92 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test operations performed on many items at once.
+"""
+
+import json
+import threading
+import unittest
+from io import StringIO
+from unittest import mock
+
+from stratis_cli._actions._batch import run_batch
+from stratis_cli._errors import StratisCliBatchError, StratisCliEngineError
+
+
+def _fail():
+    raise RuntimeError("failed") from StratisCliEngineError(1, "no space")
+
+
+class BatchTestCase(unittest.TestCase):
+    """
+    Test performing tasks and printing their results.
+    """
+
+    def test_failure(self):
+        """
+        A failure does not prevent the other tasks from being performed, and
+        the message of the error that caused it is reported.
+        """
+        done = []
+        tasks = [
+            (("p1", "a"), lambda: done.append("a")),
+            (("p1", "b"), _fail),
+            (("p2", "c"), lambda: done.append("c")),
+        ]
+        with mock.patch("sys.stdout", new_callable=StringIO) as stdout:
+            with self.assertRaises(StratisCliBatchError) as context:
+                run_batch("op", ["Pool", "Device"], tasks, jobs=2, as_json=True)
+
+        self.assertEqual(sorted(done), ["a", "c"])
+        self.assertEqual(context.exception.failed, [("p1 b", "ERROR: no space")])
+        self.assertEqual(
+            json.loads(stdout.getvalue()),
+            [
+                {"pool": "p1", "device": "a", "error": None},
+                {"pool": "p1", "device": "b", "error": "ERROR: no space"},
+                {"pool": "p2", "device": "c", "error": None},
+            ],
+        )
+
+    def test_concurrency(self):
+        """
+        At most the specified number of tasks are performed at once.
+        """
+        lock = threading.Lock()
+        running = [0]
+        maximum = [0]
+
+        def task():
+            with lock:
+                running[0] += 1
+                maximum[0] = max(maximum[0], running[0])
+            threading.Event().wait(0.01)
+            with lock:
+                running[0] -= 1
+
+        with mock.patch("sys.stdout", new_callable=StringIO) as stdout:
+            run_batch(
+                "op",
+                ["Item"],
+                [((str(i),), task) for i in range(8)],
+                jobs=3,
+                as_json=True,
+            )
+
+        self.assertLessEqual(maximum[0], 3)
+        self.assertEqual(
+            [result["item"] for result in json.loads(stdout.getvalue())],
+            [str(i) for i in range(8)],
+        )
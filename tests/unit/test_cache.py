@@ -0,0 +1,151 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test the cache of the GetManagedObjects result.
+"""
+
+import fcntl
+import os
+import threading
+import time
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from stratis_cli._actions import _cache
+from stratis_cli._actions._cache import get_managed_objects, invalidate_cache
+
+
+class CacheTestCase(unittest.TestCase):
+    """
+    Test the cache of the GetManagedObjects result.
+    """
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = mock.patch.object(_cache, "CACHE_DIRECTORY", directory.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.fetches = 0
+        patcher = mock.patch.object(
+            _cache, "_fetch_managed_objects", side_effect=self._fetch
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _fetch(self):
+        """
+        Count and delay the requests to stratisd.
+        """
+        self.fetches += 1
+        time.sleep(0.05)
+        return {"/org/storage/stratis3/1": {"fetch": self.fetches}}
+
+    def test_fresh(self):
+        """
+        A fresh result is obtained from the cache.
+        """
+        first = get_managed_objects(60)
+        self.assertEqual(get_managed_objects(60), first)
+        self.assertEqual(self.fetches, 1)
+
+    def test_stale(self):
+        """
+        A stale result is obtained again.
+        """
+        get_managed_objects(60)
+        self.assertEqual(
+            get_managed_objects(0), {"/org/storage/stratis3/1": {"fetch": 2}}
+        )
+        self.assertEqual(self.fetches, 2)
+
+    def test_invalidate(self):
+        """
+        The result is obtained again after the cache is invalidated.
+        """
+        invalidate_cache()
+        get_managed_objects(60)
+        invalidate_cache()
+        get_managed_objects(60)
+        self.assertEqual(self.fetches, 2)
+
+    def test_single_flight(self):
+        """
+        Concurrent callers share a single request to stratisd.
+        """
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_managed_objects(60)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.fetches, 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result == results[0] for result in results))
+
+    def test_unusable_directory(self):
+        """
+        The result is obtained from stratisd if the cache can not be used.
+        """
+        with TemporaryDirectory() as directory:
+            not_a_directory = os.path.join(directory, "file")
+            with open(not_a_directory, "w", encoding="utf-8"):
+                pass
+            with mock.patch.object(_cache, "CACHE_DIRECTORY", not_a_directory):
+                get_managed_objects(60)
+                get_managed_objects(60)
+                invalidate_cache()
+        self.assertEqual(self.fetches, 2)
+
+    def test_lock_held(self):
+        """
+        A lock that is held for too long is not waited for: the result is
+        obtained from stratisd, and the cache is invalidated without it.
+        """
+        get_managed_objects(60)
+        lock_fd = os.open(
+            os.path.join(_cache.CACHE_DIRECTORY, "managed_objects.lock"), os.O_RDONLY
+        )
+        self.addCleanup(os.close, lock_fd)
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+
+        with mock.patch.object(_cache, "_LOCK_TIMEOUT", 0.1):
+            self.assertEqual(
+                get_managed_objects(0), {"/org/storage/stratis3/1": {"fetch": 2}}
+            )
+            invalidate_cache()
+            self.assertEqual(
+                get_managed_objects(60), {"/org/storage/stratis3/1": {"fetch": 3}}
+            )
+
+    def test_bus_address(self):
+        """
+        A result obtained on one message bus is not listed for another.
+        """
+        get_managed_objects(60)
+        with mock.patch.object(_cache, "bus_address", return_value="unix:path=/b"):
+            self.assertEqual(
+                get_managed_objects(60), {"/org/storage/stratis3/1": {"fetch": 2}}
+            )
+            get_managed_objects(60)
+        self.assertEqual(
+            get_managed_objects(60), {"/org/storage/stratis3/1": {"fetch": 1}}
+        )
+        self.assertEqual(self.fetches, 2)
@@ -0,0 +1,94 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test selecting the message bus on which stratisd is found.
+"""
+
+import os
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from stratis_cli import run
+from stratis_cli._actions import _jobs
+from stratis_cli._actions._connection import Bus, set_bus_address
+
+_ADDRESS = "unix:path=/run/example/bus"
+
+
+class BusAddressTestCase(unittest.TestCase):
+    """
+    Test STRATIS_DBUS_ADDRESS and --bus-address.
+    """
+
+    def setUp(self):
+        for name in ("_ADDRESS", "_BUS"):
+            patcher = mock.patch.object(Bus, name, None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop("STRATIS_DBUS_ADDRESS", None)
+
+        self.system_bus = mock.patch("dbus.SystemBus").start()
+        self.bus_connection = mock.patch("dbus.bus.BusConnection").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_system_bus(self):
+        """
+        The system bus is used by default.
+        """
+        set_bus_address(None)
+        self.assertIs(Bus.get_bus(), self.system_bus.return_value)
+        self.bus_connection.assert_not_called()
+
+    def test_environment(self):
+        """
+        STRATIS_DBUS_ADDRESS selects the bus.
+        """
+        os.environ["STRATIS_DBUS_ADDRESS"] = _ADDRESS
+        set_bus_address(None)
+        self.assertIs(Bus.get_bus(), self.bus_connection.return_value)
+        self.bus_connection.assert_called_once_with(_ADDRESS)
+
+    def test_option(self):
+        """
+        --bus-address overrides STRATIS_DBUS_ADDRESS, and the connection is
+        kept while the address is unchanged.
+        """
+        os.environ["STRATIS_DBUS_ADDRESS"] = "unix:path=/run/other/bus"
+        set_bus_address(_ADDRESS)
+        Bus.get_bus()
+        set_bus_address(_ADDRESS)
+        Bus.get_bus()
+        self.bus_connection.assert_called_once_with(_ADDRESS)
+
+    def test_not_kept(self):
+        """
+        A command run after one with --bus-address uses the default bus.
+        """
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        mock.patch.object(_jobs, "JOB_DIRECTORY", directory.name).start()
+
+        with redirect_stdout(StringIO()):
+            run()([f"--bus-address={_ADDRESS}", "job", "list"])
+            self.assertEqual(Bus._ADDRESS, _ADDRESS)
+            run()(["job", "list"])
+        self.assertIsNone(Bus._ADDRESS)
+        self.assertIs(Bus.get_bus(), self.system_bus.return_value)
@@ -0,0 +1,99 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test freezing mounted filesystems.
+"""
+
+import errno
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from stratis_cli._actions._freeze import FIFREEZE, FITHAW, Freeze, mount_points
+from stratis_cli._errors import StratisCliFreezeError
+
+
+class MountPointsTestCase(unittest.TestCase):
+    """
+    Test finding the mount points of devices.
+    """
+
+    def test_mount_points(self):
+        """
+        The first mount point of a mounted device is found; devices that
+        are not mounted or do not exist are omitted.
+        """
+        rdev = os.stat("/dev/null").st_rdev
+        device = f"{os.major(rdev)}:{os.minor(rdev)}"
+        with TemporaryDirectory() as directory:
+            mountinfo = os.path.join(directory, "mountinfo")
+            with open(mountinfo, "w", encoding="utf-8") as mountinfo_file:
+                mountinfo_file.write(
+                    "22 1 8:1 / / rw - xfs /dev/sda1 rw\n"
+                    f"40 22 {device} / /mnt/my\\040db rw - xfs /dev/null rw\n"
+                    f"41 22 {device} / /mnt/other rw - xfs /dev/null rw\n"
+                )
+            self.assertEqual(
+                mount_points(["/dev/null", "/nonexistent"], mountinfo),
+                {"/dev/null": "/mnt/my db"},
+            )
+
+
+class FreezeTestCase(unittest.TestCase):
+    """
+    Test freezing and thawing.
+    """
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.paths = [os.path.join(directory.name, name) for name in ["a", "b"]]
+        for path in self.paths:
+            os.mkdir(path)
+
+    def test_freeze(self):
+        """
+        Every filesystem is thawed on exit, even if an error occurred.
+        """
+        with mock.patch("stratis_cli._actions._freeze.ioctl") as ioctl:
+            with self.assertRaises(RuntimeError):
+                with Freeze(self.paths):
+                    raise RuntimeError("snapshot failed")
+
+        requests = [call.args[1] for call in ioctl.call_args_list]
+        self.assertEqual(sorted(requests), [FIFREEZE] * 2 + [FITHAW] * 2)
+
+    def test_freeze_failed(self):
+        """
+        If some filesystem can not be frozen, the others are thawed.
+        """
+
+        def fail_b(fd, request, _arg):
+            if (
+                request == FIFREEZE
+                and os.fstat(fd).st_ino == os.stat(self.paths[1]).st_ino
+            ):
+                raise OSError(errno.EPERM, os.strerror(errno.EPERM))
+
+        with mock.patch(
+            "stratis_cli._actions._freeze.ioctl", side_effect=fail_b
+        ) as ioctl:
+            with self.assertRaises(StratisCliFreezeError) as context:
+                with Freeze(self.paths):
+                    self.fail("entered")
+
+        self.assertEqual(context.exception.mount_point, self.paths[1])
+        self.assertEqual(ioctl.call_args_list[-1].args[1], FITHAW)
+        self.assertEqual(len(ioctl.call_args_list), 3)
@@ -0,0 +1,156 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test the records of jobs.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from argparse import Namespace
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from stratis_cli._actions import _jobs
+from stratis_cli._actions._jobs import JobActions, read_job, start_job
+from stratis_cli._errors import (
+    StratisCliDeadlineError,
+    StratisCliJobFailedError,
+    StratisCliJobNotFoundError,
+)
+
+_SUCCEEDED = "0" * 32
+_FAILED = "1" * 32
+_RUNNING = "2" * 32
+_LOST = "3" * 32
+
+
+class JobsTestCase(unittest.TestCase):
+    """
+    Test reading and waiting for recorded jobs.
+    """
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        patcher = mock.patch.object(_jobs, "JOB_DIRECTORY", self.directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(_jobs, "_POLL_INTERVAL", 0.01)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # A process that has exited, and has been reaped.
+        with subprocess.Popen([sys.executable, "-c", ""]) as process:
+            pass
+        lost_pid = process.pid
+
+        for job_id, pid, result in [
+            (_SUCCEEDED, lost_pid, {"state": "succeeded", "message": None}),
+            (_FAILED, lost_pid, {"state": "failed", "message": "no pool"}),
+            (_RUNNING, os.getpid(), None),
+            (_LOST, lost_pid, None),
+        ]:
+            self._write(
+                job_id,
+                "job",
+                {"id": job_id, "command": ["pool"], "pid": pid, "started": 1.0},
+            )
+            if result is not None:
+                self._write(job_id, "result", result | {"finished": 2.0})
+
+    def _write(self, job_id, kind, value):
+        with open(
+            os.path.join(self.directory, f"{job_id}.{kind}"), "w", encoding="utf-8"
+        ) as job_file:
+            json.dump(value, job_file)
+
+    def test_state(self):
+        """
+        A job without an outcome is running while its process exists.
+        """
+        self.assertEqual(
+            [
+                read_job(job_id)["state"]
+                for job_id in (_SUCCEEDED, _FAILED, _RUNNING, _LOST)
+            ],
+            ["succeeded", "failed", "running", "lost"],
+        )
+
+    def test_not_found(self):
+        """
+        An unrecorded or ill-formed job id is not found.
+        """
+        for job_id in ("4" * 32, "../" + _SUCCEEDED):
+            with self.assertRaises(StratisCliJobNotFoundError):
+                read_job(job_id)
+
+    def test_wait(self):
+        """
+        Waiting fails if any job did not succeed.
+        """
+        with mock.patch("sys.stdout", new_callable=StringIO) as stdout:
+            with self.assertRaises(StratisCliJobFailedError) as context:
+                JobActions.wait_jobs(
+                    Namespace(job_ids=[_SUCCEEDED, _FAILED, _LOST], timeout=None)
+                )
+        self.assertEqual(
+            [job_id for (job_id, _, _) in context.exception.failed], [_FAILED, _LOST]
+        )
+        self.assertEqual(
+            stdout.getvalue(),
+            f"{_SUCCEEDED} succeeded\n{_FAILED} failed\n{_LOST} lost\n",
+        )
+
+    def test_wait_timeout(self):
+        """
+        Waiting for a running job stops after the timeout.
+        """
+        with self.assertRaises(StratisCliDeadlineError):
+            JobActions.wait_jobs(Namespace(job_ids=[_RUNNING], timeout=0.05))
+
+        self._write(_RUNNING, "result", {"state": "succeeded", "finished": 3.0})
+        with mock.patch("sys.stdout", new_callable=StringIO):
+            JobActions.wait_jobs(Namespace(job_ids=[_RUNNING], timeout=0.05))
+
+    def test_start_not_profiled(self):
+        """
+        A job is not profiled, whether by its options or by the environment.
+        """
+        with (
+            mock.patch.dict(os.environ, {"STRATIS_PROFILE": "env.prof"}),
+            mock.patch("subprocess.Popen") as popen,
+            mock.patch("sys.stdout", new_callable=StringIO) as stdout,
+        ):
+            popen.return_value.pid = os.getpid()
+            start_job(
+                [
+                    "--profile",
+                    "out.prof",
+                    "--profile-mem",
+                    "--profile=out.folded",
+                    "pool",
+                    "list",
+                ]
+            )
+
+        self.assertEqual(popen.call_args.args[0][-2:], ["pool", "list"])
+        self.assertNotIn("STRATIS_PROFILE", popen.call_args.kwargs["env"])
+        self.assertEqual(
+            read_job(stdout.getvalue().strip())["command"], ["pool", "list"]
+        )
@@ -0,0 +1,78 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test parsing manifests of filesystems to create.
+"""
+
+import os
+import unittest
+from argparse import ArgumentTypeError
+from tempfile import TemporaryDirectory
+
+from justbytes import GiB, Range
+
+from stratis_cli._parser._logical import parse_manifest
+
+
+class ManifestTestCase(unittest.TestCase):
+    """
+    Test parsing JSON and CSV manifests.
+    """
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "manifest")
+
+    def _parse(self, text):
+        with open(self.path, "w", encoding="utf-8") as manifest_file:
+            manifest_file.write(text)
+        return parse_manifest(self.path)
+
+    def test_json(self):
+        """
+        Sizes may be given with units, or as a number of bytes.
+        """
+        self.assertEqual(
+            self._parse(
+                '[{"pool": "p1", "name": "a", "size": "2GiB"},'
+                ' {"pool": "p2", "name": "a", "size_limit": 1024}]'
+            ),
+            [("p1", "a", Range(2, GiB), None), ("p2", "a", None, Range(1024))],
+        )
+
+    def test_csv(self):
+        """
+        Empty columns are not specified.
+        """
+        self.assertEqual(
+            self._parse("pool,name,size,size_limit\np1,a,,4GiB\np1,b,1GiB,\n"),
+            [("p1", "a", None, Range(4, GiB)), ("p1", "b", Range(1, GiB), None)],
+        )
+
+    def test_invalid(self):
+        """
+        Ill-formed manifests are rejected.
+        """
+        for text in [
+            "",
+            "{}",
+            '[{"pool": "p1"}]',
+            '[{"pool": "p1", "name": "a", "size": "2"}]',
+            '[{"pool": "p1", "name": "a", "sizes": "2GiB"}]',
+            '[{"pool": "p1", "name": "a"}, {"pool": "p1", "name": "a"}]',
+            "pool,name\np1,a,extra\n",
+        ]:
+            with self.assertRaises(ArgumentTypeError):
+                self._parse(text)
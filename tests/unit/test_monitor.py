@@ -0,0 +1,163 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test the events written by stratis monitor.
+"""
+
+import unittest
+
+from stratis_cli._actions._constants import (
+    BLOCKDEV_INTERFACE,
+    FILESYSTEM_INTERFACE,
+    POOL_INTERFACE,
+)
+from stratis_cli._actions._monitor import EventWatcher
+
+_POOL = "/org/storage/stratis3/1"
+_FILESYSTEM = "/org/storage/stratis3/2"
+_BLOCKDEV = "/org/storage/stratis3/3"
+
+
+class _Bus:
+    """
+    Records signal subscriptions and method calls.
+    """
+
+    def __init__(self):
+        self.receivers = {}
+        self.reply_handler = None
+        self.get_all = []
+
+    def add_signal_receiver(self, handler, signal_name, **_kwargs):
+        """
+        Record a signal subscription.
+        """
+        self.receivers[signal_name] = handler
+
+    def get_object(self, _bus_name, _object_path, **_kwargs):
+        """
+        Get a proxy that records method calls.
+        """
+        return self
+
+    def GetManagedObjects(self, **kwargs):
+        """
+        Record the reply handler.
+        """
+        self.reply_handler = kwargs["reply_handler"]
+
+    def GetAll(self, interface, **_kwargs):
+        """
+        Record the interface.
+        """
+        self.get_all.append(interface)
+
+
+class EventWatcherTestCase(unittest.TestCase):
+    """
+    Test that signals are described as events with resolved names.
+    """
+
+    def setUp(self):
+        self.bus = _Bus()
+        self.events = []
+        EventWatcher(self.bus, 120, self.events.append, self.fail).start()
+        assert self.bus.reply_handler is not None
+        self.bus.reply_handler(
+            {
+                _POOL: {POOL_INTERFACE: {"Name": "pool"}},
+                _FILESYSTEM: {FILESYSTEM_INTERFACE: {"Name": "fs", "Pool": _POOL}},
+                _BLOCKDEV: {BLOCKDEV_INTERFACE: {"Devnode": "/dev/a", "Pool": _POOL}},
+            }
+        )
+
+    def _summary(self):
+        return [
+            (
+                event["event"],
+                event["object_path"],
+                event["object_type"],
+                event["pool_name"],
+                event["filesystem_name"],
+                event["properties"],
+                event["invalidated"],
+            )
+            for event in self.events
+        ]
+
+    def test_changed(self):
+        """
+        Property changes are described with the names of the object.
+        """
+        self.bus.receivers["PropertiesChanged"](
+            FILESYSTEM_INTERFACE, {"Used": "1"}, ["Size"], object_path=_FILESYSTEM
+        )
+        self.bus.receivers["PropertiesChanged"](
+            POOL_INTERFACE, {"Name": "renamed"}, [], object_path=_POOL
+        )
+        self.bus.receivers["PropertiesChanged"](
+            BLOCKDEV_INTERFACE, {"Tier": 1}, [], object_path=_BLOCKDEV
+        )
+        self.assertEqual(
+            self._summary(),
+            [
+                (
+                    "changed",
+                    _FILESYSTEM,
+                    "filesystem",
+                    "pool",
+                    "fs",
+                    {"Used": "1"},
+                    ["Size"],
+                ),
+                ("changed", _POOL, "pool", "renamed", None, {"Name": "renamed"}, []),
+                ("changed", _BLOCKDEV, "blockdev", "renamed", None, {"Tier": 1}, []),
+            ],
+        )
+        self.assertEqual(self.bus.get_all, [FILESYSTEM_INTERFACE])
+        self.assertTrue(
+            all(event["timestamp"].endswith("+00:00") for event in self.events)
+        )
+
+    def test_added_and_removed(self):
+        """
+        Added and removed objects are described, and other interfaces ignored.
+        """
+        added = "/org/storage/stratis3/4"
+        self.bus.receivers["InterfacesAdded"](
+            added,
+            {
+                FILESYSTEM_INTERFACE: {"Name": "fs2", "Pool": _POOL},
+                "org.freedesktop.DBus.Properties": {},
+            },
+        )
+        self.bus.receivers["InterfacesRemoved"](_FILESYSTEM, [FILESYSTEM_INTERFACE])
+        self.bus.receivers["PropertiesChanged"](
+            "org.storage.stratis3.Manager.r9", {"Version": "3.9.0"}, [], object_path="/"
+        )
+        self.assertEqual(
+            self._summary(),
+            [
+                (
+                    "added",
+                    added,
+                    "filesystem",
+                    "pool",
+                    "fs2",
+                    {"Name": "fs2", "Pool": _POOL},
+                    [],
+                ),
+                ("removed", _FILESYSTEM, "filesystem", "pool", "fs", {}, []),
+            ],
+        )
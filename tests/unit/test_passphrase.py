@@ -0,0 +1,69 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test getting a passphrase for more than one D-Bus call.
+"""
+
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from stratis_cli._actions._utils import get_passphrase_fds
+from stratis_cli._errors import StratisCliKeyfileNotFoundError
+
+
+class PassphraseFdsTestCase(unittest.TestCase):
+    """
+    Test that each file descriptor yields the whole key.
+    """
+
+    def _read_twice(self, get_fd):
+        keys = []
+        for _ in range(2):
+            (fd_argument, fd_to_close) = get_fd()
+            if fd_to_close != fd_argument:
+                os.close(fd_to_close)
+            keys.append(os.read(fd_argument, 1024))
+            os.close(fd_argument)
+        return keys
+
+    def test_keyfile(self):
+        """
+        The keyfile is opened anew for each call.
+        """
+        with TemporaryDirectory() as directory:
+            keyfile_path = os.path.join(directory, "key")
+            with open(keyfile_path, "wb") as keyfile:
+                keyfile.write(b"secret")
+            get_fd = get_passphrase_fds(keyfile_path=keyfile_path)
+            self.assertEqual(self._read_twice(get_fd), [b"secret", b"secret"])
+
+    def test_missing_keyfile(self):
+        """
+        A missing keyfile is reported before any call is made.
+        """
+        with self.assertRaises(StratisCliKeyfileNotFoundError):
+            get_passphrase_fds(keyfile_path="/nonexistent/key")
+
+    def test_passphrase(self):
+        """
+        The passphrase is read only once.
+        """
+        with mock.patch(
+            "stratis_cli._actions._utils.get_pass", return_value="secret"
+        ) as get_pass:
+            get_fd = get_passphrase_fds()
+            self.assertEqual(self._read_twice(get_fd), [b"secret", b"secret"])
+        get_pass.assert_called_once()
@@ -0,0 +1,137 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test the timeouts and retries of D-Bus calls.
+"""
+
+import unittest
+from unittest import mock
+
+from dbus.exceptions import DBusException
+
+from dbus_python_client_gen import DPClientInvocationError
+from stratis_cli._actions import _policy
+from stratis_cli._actions._constants import POOL_INTERFACE
+from stratis_cli._actions._policy import set_deadline, with_policy
+from stratis_cli._errors import StratisCliDeadlineError
+
+_NO_REPLY = "org.freedesktop.DBus.Error.NoReply"
+_SERVICE_UNKNOWN = "org.freedesktop.DBus.Error.ServiceUnknown"
+
+
+class _Method:
+    """
+    A generated method which fails with the given D-Bus errors, and then
+    succeeds.
+    """
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.timeouts = []
+
+    def __call__(self, _proxy, _args, *, timeout):
+        self.timeouts.append(timeout)
+        if self.errors != []:
+            raise DPClientInvocationError("fake", POOL_INTERFACE, None) from (
+                DBusException(name=self.errors.pop(0))
+            )
+        return "value"
+
+
+class PolicyTestCase(unittest.TestCase):
+    """
+    Test calls made according to their policy.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(_policy.time, "sleep")
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(set_deadline, None)
+
+    def test_service_unknown(self):
+        """
+        A call is retried with backoff until stratisd is on the bus.
+        """
+        method = _Method(_SERVICE_UNKNOWN, _SERVICE_UNKNOWN)
+        call = with_policy(POOL_INTERFACE, "AddDataDevs", "call", method, 120)
+        self.assertEqual(call(None, {}), "value")
+        self.assertEqual(method.timeouts, [120, 120, 120])
+        self.assertEqual(self.sleep.call_args_list, [mock.call(0.25), mock.call(0.5)])
+
+    def test_no_reply(self):
+        """
+        A call which changes something is not retried if there is no reply,
+        but one which only obtains information is.
+        """
+        method = _Method(_NO_REPLY)
+        call = with_policy(POOL_INTERFACE, "AddDataDevs", "call", method, 120)
+        with self.assertRaises(DPClientInvocationError):
+            call(None, {})
+
+        method = _Method(_NO_REPLY)
+        call = with_policy(POOL_INTERFACE, "Metadata", "call", method, 120)
+        self.assertEqual(call(None, {}), "value")
+
+    def test_policy_timeout(self):
+        """
+        The timeout of the policy overrides the default timeout, and is
+        reduced by the deadline.
+        """
+        method = _Method()
+        call = with_policy(POOL_INTERFACE, "EncryptPool", "call", method, 120)
+        call(None, {})
+        set_deadline(5)
+        call(None, {})
+        self.assertEqual(method.timeouts[0], 10)
+        self.assertLessEqual(method.timeouts[1], 5)
+
+    def test_deadline(self):
+        """
+        A call is not made, or retried, once the deadline would pass.
+        """
+        method = _Method(_SERVICE_UNKNOWN)
+        call = with_policy(POOL_INTERFACE, "AddDataDevs", "call", method, 120)
+        set_deadline(0.1)
+        with self.assertRaises(StratisCliDeadlineError):
+            call(None, {})
+        self.assertEqual(len(method.timeouts), 1)
+
+        set_deadline(0)
+        with self.assertRaises(StratisCliDeadlineError):
+            call(None, {})
+        self.assertEqual(len(method.timeouts), 1)
+
+    def test_deadline_initiated(self):
+        """
+        If the deadline passes while waiting for the reply to a call that
+        initiates an operation, the error is not a deadline error, so that
+        the operation is reported as initiated.
+        """
+
+        def method(_proxy, _args, *, timeout):
+            set_deadline(-timeout)
+            raise DPClientInvocationError("fake", POOL_INTERFACE, None) from (
+                DBusException(name=_NO_REPLY)
+            )
+
+        set_deadline(5)
+        call = with_policy(POOL_INTERFACE, "EncryptPool", "call", method, 120)
+        with self.assertRaises(DPClientInvocationError):
+            call(None, {})
+
+        set_deadline(5)
+        call = with_policy(POOL_INTERFACE, "AddDataDevs", "call", method, 120)
+        with self.assertRaises(StratisCliDeadlineError):
+            call(None, {})
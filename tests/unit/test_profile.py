@@ -0,0 +1,139 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test profiling.
+"""
+
+import os
+import pstats
+import unittest
+from io import StringIO
+from tempfile import TemporaryDirectory
+from typing import Any, Dict
+from unittest import mock
+
+from stratis_cli._profile import Profiler, collapsed_stacks
+
+_MAIN = ("main.py", 1, "main")
+_PARSE = ("parse.py", 2, "parse")
+_READ = ("~", 0, "<built-in method read>")
+
+
+class CollapsedStacksTestCase(unittest.TestCase):
+    """
+    Test calculating collapsed stacks from profile statistics.
+    """
+
+    def test_shared_callee(self):
+        """
+        The time of a function is divided among its callers.
+        """
+        stats: Dict[Any, Any] = {
+            _MAIN: (1, 1, 0.001, 0.010, {}),
+            _PARSE: (1, 1, 0.002, 0.006, {_MAIN: (1, 1, 0.002, 0.006)}),
+            _READ: (
+                2,
+                2,
+                0.005,
+                0.005,
+                {_MAIN: (1, 1, 0.001, 0.001), _PARSE: (1, 1, 0.004, 0.004)},
+            ),
+        }
+        self.assertEqual(
+            collapsed_stacks(stats),
+            {
+                "main (main.py:1)": 1000,
+                "main (main.py:1);<built-in method read>": 1000,
+                "main (main.py:1);parse (parse.py:2)": 2000,
+                "main (main.py:1);parse (parse.py:2);<built-in method read>": 4000,
+            },
+        )
+
+    def test_recursion(self):
+        """
+        A recursive call is not followed.
+        """
+        stats: Dict[Any, Any] = {
+            _MAIN: (1, 2, 0.002, 0.002, {_MAIN: (1, 1, 0.001, 0.001)})
+        }
+        self.assertEqual(collapsed_stacks(stats), {"main (main.py:1)": 2000})
+
+        stats[_PARSE] = (1, 1, 0.001, 0.003, {})
+        stats[_MAIN][4][_PARSE] = (1, 1, 0.002, 0.002)
+        self.assertEqual(
+            collapsed_stacks(stats),
+            {"parse (parse.py:2)": 1000, "parse (parse.py:2);main (main.py:1)": 2000},
+        )
+
+
+class ProfilerTestCase(unittest.TestCase):
+    """
+    Test writing a profile.
+    """
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def _profile(self, name, *, memory=False):
+        path = os.path.join(self.directory, name)
+        profiler = Profiler(path, memory=memory)
+        profiler.start("first")
+        sorted(range(1000), key=str)
+        profiler.next_phase("second")
+        with mock.patch("sys.stderr", new_callable=StringIO) as stderr:
+            profiler.stop()
+        return (path, stderr.getvalue())
+
+    def test_pstats(self):
+        """
+        The profile is written in the pstats format by default.
+        """
+        (path, output) = self._profile("profile")
+        self.assertIn(
+            "<built-in method builtins.sorted>",
+            [name for (_, _, name) in pstats.Stats(path).stats],  # pyright: ignore [reportAttributeAccessIssue]
+        )
+        self.assertEqual(output, "")
+
+    def test_collapsed(self):
+        """
+        The profile is written as collapsed stacks for a .folded file, and
+        the peak memory of each phase is reported.
+        """
+        (path, output) = self._profile("profile.folded", memory=True)
+        with open(path, encoding="utf-8") as profile_file:
+            lines = profile_file.read().splitlines()
+        self.assertTrue(
+            any(line.startswith("<built-in method builtins.sorted>") for line in lines)
+        )
+        self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in lines))
+        self.assertEqual(
+            [line.split(":")[0] for line in output.splitlines()],
+            ["Peak memory allocated while first", "Peak memory allocated while second"],
+        )
+
+    def test_environment(self):
+        """
+        A profile is requested by the environment.
+        """
+        with mock.patch.dict(os.environ, {"STRATIS_PROFILE": ""}):
+            self.assertIsNone(Profiler.from_environment())
+        with mock.patch.dict(
+            os.environ, {"STRATIS_PROFILE": "out", "STRATIS_PROFILE_MEMORY": "1"}
+        ):
+            profiler = Profiler.from_environment()
+            assert profiler is not None
+            self.assertEqual((profiler.path, profiler.memory), ("out", True))
@@ -0,0 +1,63 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test the snapshot retention policy.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from stratis_cli._actions._prune import select_expired
+
+# Two snapshots a day, at 01:00 and 13:00, from Monday 2025-03-03 for 14 days
+_SNAPSHOTS = [
+    (f"s{index}", datetime(2025, 3, 3, 1) + timedelta(hours=12 * index))
+    for index in range(28)
+]
+
+
+class SelectExpiredTestCase(unittest.TestCase):
+    """
+    Test selecting the snapshots that no rule keeps.
+    """
+
+    def _kept(self, **keep):
+        expired = select_expired(_SNAPSHOTS, **keep)
+        return [name for (name, _) in _SNAPSHOTS if name not in expired]
+
+    def test_keep_last(self):
+        """
+        The newest snapshots are kept.
+        """
+        self.assertEqual(
+            self._kept(keep_last=3, keep_daily=0, keep_weekly=0), ["s25", "s26", "s27"]
+        )
+
+    def test_keep_daily_and_weekly(self):
+        """
+        The newest snapshot of each recent day and week is kept; a snapshot
+        kept by more than one rule is counted by each.
+        """
+        self.assertEqual(
+            self._kept(keep_last=1, keep_daily=2, keep_weekly=2), ["s13", "s25", "s27"]
+        )
+
+    def test_keep_more_than_exist(self):
+        """
+        Nothing expires if the rules keep more snapshots than exist.
+        """
+        self.assertEqual(
+            select_expired(_SNAPSHOTS, keep_last=0, keep_daily=30, keep_weekly=0),
+            [f"s{index}" for index in range(26, -1, -2)],
+        )
@@ -0,0 +1,428 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test reencrypting many pools.
+"""
+
+import json
+import os
+import unittest
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from dbus.exceptions import DBusException
+
+from stratis_cli._actions._constants import BLOCKDEV_INTERFACE, POOL_INTERFACE
+from stratis_cli._actions._reencrypt import (
+    COMPLETED,
+    FAILED,
+    PENDING,
+    RUNNING,
+    Reencryption,
+    ReencryptQueue,
+    disks_of,
+    select_next,
+)
+from stratis_cli._actions._watch import SignalLoop
+from stratis_cli._errors import (
+    StratisCliIncoherenceError,
+    StratisCliReencryptQueueError,
+)
+
+
+class _Bus:
+    """
+    Records the GetManagedObjects reply handler and the pools on which
+    ReencryptPool was called.
+    """
+
+    def __init__(self):
+        self.reply_handler = None
+        self.name_owner_changed = None
+        self.object_path = None
+        self.calls = []
+
+    def add_signal_receiver(self, handler, **kwargs):
+        """
+        Record the NameOwnerChanged handler and ignore other subscriptions.
+        """
+        if kwargs["signal_name"] == "NameOwnerChanged":
+            self.name_owner_changed = handler
+
+    def get_name_owner(self, _bus_name):
+        """
+        Get stratisd's connection.
+        """
+        return _OWNER
+
+    def get_object(self, _bus_name, object_path, **_kwargs):
+        """
+        Get a proxy that records method calls.
+        """
+        self.object_path = object_path
+        return self
+
+    def get_dbus_method(self, _method_name, **_kwargs):
+        """
+        Get a method that records the object on which it was called.
+        """
+        object_path = self.object_path
+        return lambda **kwargs: self.calls.append(
+            (object_path, kwargs["reply_handler"], kwargs["error_handler"])
+        )
+
+    def GetManagedObjects(self, **kwargs):
+        """
+        Record the reply handler.
+        """
+        self.reply_handler = kwargs["reply_handler"]
+
+
+_OWNER = ":1.7"
+
+
+class _SignalLoop(SignalLoop):
+    """
+    Records how the loop was stopped, without a main loop.
+    """
+
+    def __init__(self):
+        self.bus = _Bus()
+        self.error = None
+        self.stopped = False
+
+    def fail(self, error):
+        """
+        Record an error.
+        """
+        self.error = error
+        self.stopped = True
+
+    def quit(self):
+        """
+        Record that the loop was stopped.
+        """
+        self.stopped = True
+
+
+def _entry(uuid, state=PENDING):
+    return {
+        "uuid": uuid,
+        "name": f"p{uuid}",
+        "state": state,
+        "previous": None,
+        "started": None,
+        "owner": None,
+        "message": None,
+    }
+
+
+class DisksTestCase(unittest.TestCase):
+    """
+    Test finding the disks on which a block device is stored.
+    """
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        devices = os.path.join(directory.name, "devices")
+        self.sys_class_block = os.path.join(directory.name, "block")
+        os.makedirs(self.sys_class_block)
+
+        for path in ["sda/sda1", "sda/sda2", "sdb", "sdc", "dm-0/slaves"]:
+            os.makedirs(os.path.join(devices, path))
+        for partition in ["sda1", "sda2"]:
+            with open(
+                os.path.join(devices, "sda", partition, "partition"),
+                "w",
+                encoding="utf-8",
+            ) as partition_file:
+                partition_file.write("1\n")
+        for name, path in [
+            ("sda", "sda"),
+            ("sda1", "sda/sda1"),
+            ("sda2", "sda/sda2"),
+            ("sdb", "sdb"),
+            ("sdc", "sdc"),
+            ("dm-0", "dm-0"),
+        ]:
+            os.symlink(
+                os.path.join(devices, path), os.path.join(self.sys_class_block, name)
+            )
+        for slave in ["sda2", "sdb"]:
+            os.symlink(
+                os.path.join(self.sys_class_block, slave),
+                os.path.join(devices, "dm-0", "slaves", slave),
+            )
+
+    def test_disks(self):
+        """
+        A partition is stored on the disk that contains it and a
+        device-mapper device on the disks of the devices it is built on.
+        """
+        self.assertEqual(disks_of("/dev/sdc", self.sys_class_block), {"sdc"})
+        self.assertEqual(disks_of("/dev/sda1", self.sys_class_block), {"sda"})
+        self.assertEqual(disks_of("/dev/dm-0", self.sys_class_block), {"sda", "sdb"})
+        self.assertEqual(disks_of("/dev/nvme9n1", self.sys_class_block), {"nvme9n1"})
+
+
+class SelectTestCase(unittest.TestCase):
+    """
+    Test selecting the pools to start reencrypting.
+    """
+
+    def test_max_inflight(self):
+        """
+        No more than max_inflight pools are reencrypted at once.
+        """
+        entries = [_entry("1", RUNNING), _entry("2"), _entry("3"), _entry("4")]
+        disks = {str(i): frozenset([f"sd{i}"]) for i in range(1, 5)}
+        self.assertEqual(select_next(entries, disks, max_inflight=3), ["2", "3"])
+        self.assertEqual(select_next(entries, disks, max_inflight=1), [])
+
+    def test_shared_disks(self):
+        """
+        Pools that share a disk with a pool being reencrypted, or with a
+        pool selected before them, are passed over.
+        """
+        entries = [_entry("1", RUNNING), _entry("2"), _entry("3"), _entry("4")]
+        disks = {
+            "1": frozenset(["sda"]),
+            "2": frozenset(["sda", "sdb"]),
+            "3": frozenset(["sdc"]),
+            "4": frozenset(["sdc"]),
+        }
+        self.assertEqual(select_next(entries, disks, max_inflight=4), ["3"])
+
+
+class QueueTestCase(unittest.TestCase):
+    """
+    Test recording the queue.
+    """
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "run", "queue.json")
+
+    def test_resume(self):
+        """
+        The queue is read again, and pools already in it are not added again.
+        """
+        with ReencryptQueue(self.path) as queue:
+            queue.add([("p1", "1"), ("p2", "2")])
+            queue.entries[0]["state"] = RUNNING
+            queue.save()
+
+        with ReencryptQueue(self.path) as queue:
+            queue.add([("p2", "2"), ("p3", "3")])
+            self.assertEqual(
+                [(entry["uuid"], entry["state"]) for entry in queue.entries],
+                [("1", RUNNING), ("2", PENDING), ("3", PENDING)],
+            )
+
+    def test_finished(self):
+        """
+        The queue file is removed once the queue is finished.
+        """
+        with ReencryptQueue(self.path) as queue:
+            queue.add([("p1", "1")])
+            queue.save()
+            self.assertTrue(os.path.exists(self.path))
+            queue.entries[0]["state"] = FAILED
+            queue.save()
+            self.assertFalse(os.path.exists(self.path))
+
+    def test_locked(self):
+        """
+        Only one command works through the queue at a time.
+        """
+        with ReencryptQueue(self.path):
+            with self.assertRaises(StratisCliReencryptQueueError):
+                with ReencryptQueue(self.path):
+                    pass
+
+    def test_ill_formed(self):
+        """
+        An ill-formed queue file is reported.
+        """
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as queue_file:
+            queue_file.write("[")
+        with self.assertRaises(StratisCliReencryptQueueError):
+            with ReencryptQueue(self.path):
+                pass
+
+
+class ReencryptionTestCase(unittest.TestCase):
+    """
+    Test working through the queue.
+    """
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "queue.json")
+
+        self.signal_loop = _SignalLoop()
+        self.stream = StringIO()
+
+        self.queue = ReencryptQueue(self.path)
+        self.queue.__enter__()
+        self.addCleanup(self.queue.__exit__)
+        self.queue.add([("p1", "1"), ("p2", "2"), ("p3", "3")])
+
+    def _start(self):
+        self.reencryption = Reencryption(
+            self.signal_loop, self.queue, max_inflight=2, stream=self.stream
+        )
+        self.reencryption.start()
+
+    def _receive(self):
+        """
+        Pools p1 and p2 share the disk sdx.
+        """
+        managed_objects = {}
+        for uuid, devnode in [("1", "/dev/sdx"), ("2", "/dev/sdx"), ("3", "/dev/sdy")]:
+            managed_objects[f"/p{uuid}"] = {
+                POOL_INTERFACE: {
+                    "Name": f"p{uuid}",
+                    "Uuid": uuid,
+                    "LastReencryptedTimestamp": (False, ""),
+                    "Encrypted": True,
+                    "AvailableActions": "fully_operational",
+                }
+            }
+            managed_objects[f"/d{uuid}"] = {
+                BLOCKDEV_INTERFACE: {"Pool": f"/p{uuid}", "PhysicalPath": devnode}
+            }
+        reply_handler = self.signal_loop.bus.reply_handler
+        assert reply_handler is not None
+        reply_handler(managed_objects)
+
+    def _states(self):
+        return [entry["state"] for entry in self.queue.entries]
+
+    def test_shared_disk(self):
+        """
+        Pools that share a disk are reencrypted one after the other.
+        """
+        self._start()
+        self._receive()
+        calls = self.signal_loop.bus.calls
+        self.assertEqual([call[0] for call in calls], ["/p1", "/p3"])
+        with open(self.path, encoding="utf-8") as queue_file:
+            self.assertEqual(
+                [entry["state"] for entry in json.load(queue_file)],
+                [RUNNING, PENDING, RUNNING],
+            )
+
+        calls[0][1](True, 0, "")
+        self.assertEqual(self._states(), [COMPLETED, RUNNING, RUNNING])
+        self.assertEqual(calls[-1][0], "/p2")
+
+        calls[2][1](False, 1, "no")
+        calls[1][1](True, 0, "")
+        self.assertEqual(self._states(), [COMPLETED, FAILED, COMPLETED])
+        self.assertEqual(self.queue.entries[1]["message"], "ERROR: no")
+        self.assertTrue(self.signal_loop.stopped)
+        self.assertIsNone(self.signal_loop.error)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_timestamp(self):
+        """
+        If the bus gives up, a pool is reencrypted when its
+        LastReencryptedTimestamp property changes.
+        """
+        self._start()
+        self._receive()
+        calls = self.signal_loop.bus.calls
+        calls[0][2](DBusException(name="org.freedesktop.DBus.Error.NoReply"))
+        self.assertEqual(self._states(), [RUNNING, PENDING, RUNNING])
+
+        self.reencryption.watcher.properties_changed(
+            POOL_INTERFACE,
+            {"LastReencryptedTimestamp": (True, "2025-01-01T00:00:00Z")},
+            [],
+            object_path="/p1",
+        )
+        self.assertEqual(self._states(), [COMPLETED, RUNNING, RUNNING])
+        self.assertIn("Reencrypting pool p1: completed", self.stream.getvalue())
+
+    def test_pool_removed(self):
+        """
+        The reencryption of a pool that is removed fails.
+        """
+        self._start()
+        self._receive()
+        self.reencryption.watcher.interfaces_removed("/p3", [POOL_INTERFACE])
+        self.assertEqual(self._states(), [RUNNING, PENDING, FAILED])
+        self.assertEqual(self.queue.entries[2]["message"], "The pool was removed")
+
+    def test_not_operational(self):
+        """
+        The reencryption of a pool that is no longer fully operational fails.
+        """
+        self._start()
+        self._receive()
+        self.reencryption.watcher.properties_changed(
+            POOL_INTERFACE,
+            {"AvailableActions": "no_ipc_requests"},
+            [],
+            object_path="/p1",
+        )
+        self.assertEqual(self._states(), [FAILED, RUNNING, RUNNING])
+
+    def test_earlier_stratisd(self):
+        """
+        The reencryption of a pool that was started by an earlier command,
+        before stratisd was restarted, fails.
+        """
+        self.queue.entries[0] |= {"state": RUNNING, "owner": ":1.3"}
+        self.queue.entries[2] |= {"state": RUNNING, "owner": _OWNER}
+        self._start()
+        self._receive()
+        self.assertEqual(self._states(), [FAILED, RUNNING, RUNNING])
+        self.assertEqual([call[0] for call in self.signal_loop.bus.calls], ["/p2"])
+
+    def test_restarted(self):
+        """
+        The reencryptions in progress fail if stratisd is restarted, and the
+        pools that remain are kept in the queue.
+        """
+        self._start()
+        self._receive()
+        name_owner_changed = self.signal_loop.bus.name_owner_changed
+        assert name_owner_changed is not None
+        name_owner_changed("org.storage.stratis3", _OWNER, "")
+        self.assertEqual(self._states(), [FAILED, PENDING, FAILED])
+        self.assertIsInstance(self.signal_loop.error, StratisCliIncoherenceError)
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_disks_found_once(self):
+        """
+        The disks of a pool are found only once.
+        """
+        with mock.patch(
+            "stratis_cli._actions._reencrypt.disks_of",
+            side_effect=lambda devnode: frozenset([devnode]),
+        ) as found:
+            self._start()
+            self._receive()
+            for name in ["a", "b"]:
+                self.reencryption.watcher.properties_changed(
+                    POOL_INTERFACE, {"Name": name}, [], object_path="/p3"
+                )
+        self.assertEqual(found.call_count, 3)
@@ -0,0 +1,364 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test selecting parts of a report.
+"""
+
+import gzip
+import io
+import json
+import os
+import unittest
+from contextlib import redirect_stderr
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import dbus
+
+from stratis_cli._actions._report import (
+    collect_snapshots,
+    diff_values,
+    extract_json_text,
+    format_path,
+    select_value,
+    snapshot_paths,
+    subtree_digest,
+    write_json,
+)
+from stratis_cli._parser._shared import parse_report_path
+
+_REPORT = {
+    "pools": [
+        {"name": "p]1", "uuid": "a{b", "devs": [{"path": "/dev/x"}], "empty": {}},
+        {"name": 'p"2', "flags": [True, False, None], "size": -1.5e3},
+    ],
+    "a.b": {"": []},
+}
+
+
+def _paths(value, prefix=()):
+    """
+    Yield every path in value.
+    """
+    yield prefix
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _paths(item, prefix + (key,))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _paths(item, prefix + (index,))
+
+
+class ReportPathTestCase(unittest.TestCase):
+    """
+    Test extraction of values from report text.
+    """
+
+    def test_extract_all_paths(self):
+        """
+        Extracting the text at any path must agree with the decoded value.
+        """
+        for indent in (None, 4):
+            text = json.dumps(_REPORT, indent=indent)
+            for path in _paths(_REPORT):
+                with self.subTest(indent=indent, path=path):
+                    self.assertEqual(
+                        json.loads(extract_json_text(text, path)),
+                        select_value(_REPORT, path),
+                    )
+
+    def test_extract_is_verbatim(self):
+        """
+        The extracted text must be exactly the text in the document.
+        """
+        text = '{"a" : [ 1, {"b":"x]"} ] }'
+        self.assertEqual(extract_json_text(text, ("a", 1)), '{"b":"x]"}')
+
+    def test_not_found(self):
+        """
+        Paths that do not exist raise KeyError.
+        """
+        text = json.dumps(_REPORT)
+        for path in [("nopools",), ("pools", 2), ("pools", "name"), ("a.b", 0)]:
+            with self.subTest(path=path):
+                with self.assertRaises(KeyError):
+                    extract_json_text(text, path)
+                with self.assertRaises(KeyError):
+                    select_value(_REPORT, path)
+
+    def test_format_parse_round_trip(self):
+        """
+        Formatting and then parsing a path must yield the original path.
+        """
+        for path in _paths(_REPORT):
+            with self.subTest(path=path):
+                self.assertEqual(parse_report_path(format_path(path)), path)
+
+
+class WriteJsonTestCase(unittest.TestCase):
+    """
+    Test that write_json writes exactly what json.dump does.
+    """
+
+    def _check(self, value, sort_keys_values=(True, False)):
+        """
+        Compare the output of write_json and json.dump for value.
+        """
+        for sort_keys in sort_keys_values:
+            expected = io.StringIO()
+            json.dump(value, expected, indent=4, sort_keys=sort_keys)
+            actual = io.StringIO()
+            write_json(value, actual, sort_keys=sort_keys)
+            self.assertEqual(actual.getvalue(), expected.getvalue())
+
+    def test_dbus_values(self):
+        """
+        Test a structure like the result of GetManagedObjects.
+        """
+        self._check(
+            dbus.Dictionary(
+                {
+                    dbus.ObjectPath("/org/storage/stratis3/1"): dbus.Dictionary(
+                        {
+                            dbus.String(
+                                "org.storage.stratis3.pool.r8"
+                            ): dbus.Dictionary(
+                                {
+                                    dbus.String("Name"): dbus.String("pn\u00e9"),
+                                    dbus.String("Encrypted"): dbus.Boolean(True),
+                                    dbus.String("FsLimit"): dbus.UInt64(100),
+                                    dbus.String("MetadataVersion"): dbus.UInt16(2),
+                                    dbus.String("Used"): dbus.Struct(
+                                        (dbus.Boolean(False), dbus.String(""))
+                                    ),
+                                    dbus.String("ClevisInfos"): dbus.Array(
+                                        [], signature="(u(b(ss)))"
+                                    ),
+                                    dbus.String("Ratio"): dbus.Double(0.5),
+                                    dbus.String("Signature"): dbus.Signature("a{sv}"),
+                                }
+                            ),
+                            dbus.String("org.freedesktop.DBus.Properties"): (
+                                dbus.Dictionary({}, signature="sv")
+                            ),
+                        }
+                    )
+                }
+            )
+        )
+
+    def test_python_values(self):
+        """
+        Test constants, special floats, non-string keys, and nesting.
+        """
+        for value in [
+            None,
+            True,
+            '\n"',
+            float("nan"),
+            [float("inf"), -float("inf"), 1.5, -3],
+            {1: [], 2.5: {}, 3: [[{}]]},
+            {"a": ({"b": [1, [2]]},), "c": []},
+        ]:
+            with self.subTest(value=value):
+                self._check(value)
+
+        # Keys of different types can not be sorted.
+        self._check({1: [], 2.5: {}, False: 0, None: "x", "a": 1}, (False,))
+
+    def test_not_serializable(self):
+        """
+        Values that json.dump rejects are rejected.
+        """
+        for value in [{"a": {1, 2}}, {(1, 2): 1}]:
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    write_json(value, io.StringIO())
+
+
+class DiffTestCase(unittest.TestCase):
+    """
+    Test finding the differences between reports.
+    """
+
+    def test_digest_key_order(self):
+        """
+        The order of keys does not affect the digest.
+        """
+        for size in (2, 100):
+            keys = [str(key) for key in range(size)]
+            self.assertEqual(
+                subtree_digest({key: [key] for key in keys}),
+                subtree_digest({key: [key] for key in reversed(keys)}),
+            )
+
+    def test_digest_types(self):
+        """
+        Values that are equal in Python but not in JSON have different
+        digests.
+        """
+        for size in (1, 100):
+            self.assertNotEqual(
+                subtree_digest([1] * size), subtree_digest([True] * size)
+            )
+            self.assertNotEqual(
+                subtree_digest([1] * size), subtree_digest([1.0] * size)
+            )
+
+    def test_digest_nested(self):
+        """
+        Nested containers are distinguished from the scalars that encode
+        the same way, and each scalar is encoded once for each document.
+        """
+        self.assertNotEqual(subtree_digest([[1], 2]), subtree_digest([[1, 2]]))
+        self.assertNotEqual(subtree_digest({"a": [1]}), subtree_digest({"a": "[1]"}))
+
+        def nested(leaf):
+            value = leaf
+            for depth in range(20):
+                value = {"depth": depth, "next": [value]}
+            return value
+
+        with mock.patch(
+            "stratis_cli._actions._report._CANONICAL_ENCODER",
+            wraps=json.JSONEncoder(sort_keys=True, separators=(",", ":")),
+        ) as encoder:
+            self.assertEqual(
+                list(diff_values(nested("old"), nested("new"))["changed"]),
+                [format_path(("next", 0) * 20)],
+            )
+        self.assertEqual(encoder.encode.call_count, 2 * 21)
+
+    def test_no_change(self):
+        """
+        Equal reports have no differences.
+        """
+        self.assertEqual(
+            diff_values(_REPORT, json.loads(json.dumps(_REPORT))),
+            {"added": {}, "removed": {}, "changed": {}},
+        )
+
+    def test_changes(self):
+        """
+        Added, removed, and changed values are found in objects and lists.
+        """
+        old = {
+            "pools": [{"name": "a", "n": 1}, {"name": "b"}],
+            "big": {str(key): key for key in range(100)},
+            "gone": {},
+        }
+        new = {
+            "pools": [{"name": "a", "n": True}, {"name": "c"}, {"name": "d"}],
+            "big": {str(key): key for key in range(1, 101)},
+            "extra": None,
+        }
+        self.assertEqual(
+            diff_values(old, new),
+            {
+                "added": {
+                    "$.pools[2]": {"name": "d"},
+                    '$.big["100"]': 100,
+                    "$.extra": None,
+                },
+                "removed": {'$.big["0"]': 0, "$.gone": {}},
+                "changed": {
+                    "$.pools[0].n": {"old": 1, "new": True},
+                    "$.pools[1].name": {"old": "b", "new": "c"},
+                },
+            },
+        )
+
+    def test_change_type(self):
+        """
+        A value that changes between a container and a scalar is changed.
+        """
+        self.assertEqual(
+            diff_values({"a": [1]}, {"a": {"b": 1}}),
+            {
+                "added": {},
+                "removed": {},
+                "changed": {"$.a": {"old": [1], "new": {"b": 1}}},
+            },
+        )
+
+
+class CollectSnapshotsTestCase(unittest.TestCase):
+    """
+    Test saving reports periodically.
+    """
+
+    def _contents(self, directory):
+        """
+        Return the decompressed contents of the saved reports, oldest first.
+        """
+        result = []
+        for path in snapshot_paths(directory, "report"):
+            with gzip.open(path, "rt") as snapshot:
+                result.append(snapshot.read())
+        return result
+
+    def test_skip_unchanged(self):
+        """
+        A report is saved only when it differs from the previous one.
+        """
+        reports = iter(["a", "a", "b", "b", "a"])
+        with TemporaryDirectory() as directory:
+            collect_snapshots(
+                lambda: next(reports), directory, "report", every=0.001, count=5
+            )
+            self.assertEqual(self._contents(directory), ["a", "b", "a"])
+
+            # The last saved report is remembered between runs.
+            collect_snapshots(lambda: "a", directory, "report", every=1, count=1)
+            self.assertEqual(self._contents(directory), ["a", "b", "a"])
+
+    def test_dbus_error(self):
+        """
+        A sample that can not be obtained is skipped and reported, and the
+        next sample is taken.
+        """
+
+        reports = iter(["a", None, "b"])
+
+        def render():
+            report = next(reports)
+            if report is None:
+                raise dbus.exceptions.DBusException("no reply")
+            return report
+
+        with TemporaryDirectory() as directory:
+            stderr = io.StringIO()
+            with redirect_stderr(stderr):
+                collect_snapshots(render, directory, "report", every=0.001, count=3)
+            self.assertEqual(self._contents(directory), ["a", "b"])
+            self.assertIn("Skipped the sample", stderr.getvalue())
+
+    def test_keep(self):
+        """
+        Only the specified number of reports is kept.
+        """
+        reports = iter(["a", "b", "c", "d"])
+        with TemporaryDirectory() as directory:
+            with open(
+                os.path.join(directory, "other.json.gz"), "w", encoding="utf-8"
+            ) as other:
+                other.write("other")
+            collect_snapshots(
+                lambda: next(reports), directory, "report", every=0.001, keep=2, count=4
+            )
+            self.assertEqual(self._contents(directory), ["c", "d"])
+            self.assertIn("other.json.gz", os.listdir(directory))
+            self.assertEqual(
+                [name for name in os.listdir(directory) if name.endswith(".tmp")], []
+            )
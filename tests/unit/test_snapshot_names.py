@@ -0,0 +1,48 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test naming the snapshots of many filesystems.
+"""
+
+import unittest
+from datetime import datetime
+
+from stratis_cli._actions._logical import snapshot_names
+from stratis_cli._errors import StratisCliInvalidCommandLineOptionValue
+
+_NOW = datetime(2025, 3, 4, 5, 6, 7)
+
+
+class SnapshotNamesTestCase(unittest.TestCase):
+    """
+    Test expanding the name template.
+    """
+
+    def test_template(self):
+        """
+        Every field of the template is replaced.
+        """
+        self.assertEqual(
+            snapshot_names(
+                ["db-1", "db-2"], "p1", "{pool}-{origin}-{date}T{time}", _NOW
+            ),
+            {"db-1": "p1-db-1-2025-03-04T050607", "db-2": "p1-db-2-2025-03-04T050607"},
+        )
+
+    def test_repeated_name(self):
+        """
+        A template that gives two snapshots the same name is rejected.
+        """
+        with self.assertRaises(StratisCliInvalidCommandLineOptionValue):
+            snapshot_names(["a", "b"], "p1", "snap-{date}", _NOW)
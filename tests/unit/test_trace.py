@@ -0,0 +1,185 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test tracing of D-Bus calls.
+"""
+
+import json
+import os
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import dbus
+
+from stratis_cli import run
+from stratis_cli._actions import _jobs, _trace
+from stratis_cli._actions._trace import (
+    DBusTracer,
+    TracedProxy,
+    marshalled_size,
+    summarize,
+    traced,
+    tracing,
+)
+
+
+class MarshalledSizeTestCase(unittest.TestCase):
+    """
+    Test calculating the size of a marshalled message body.
+    """
+
+    def test_basic(self):
+        """
+        Basic types are aligned to their size.
+        """
+        self.assertEqual(marshalled_size("", []), 0)
+        self.assertEqual(marshalled_size("s", ["abc"]), 8)
+        self.assertEqual(marshalled_size("yq", [1, 2]), 4)
+        self.assertEqual(marshalled_size("bt", [True, 1]), 16)
+
+    def test_containers(self):
+        """
+        Arrays, structs, dict entries, and variants are aligned.
+        """
+        self.assertEqual(marshalled_size("a((bu)s)", [[((False, 0), "desc")]]), 25)
+        self.assertEqual(
+            marshalled_size(
+                "a{sv}", [dbus.Dictionary({"a": dbus.Boolean(True, variant_level=1)})]
+            ),
+            24,
+        )
+        self.assertEqual(marshalled_size("ao", [[]]), 4)
+
+
+class SummarizeTestCase(unittest.TestCase):
+    """
+    Test summarizing arguments.
+    """
+
+    def test_summarize(self):
+        """
+        Containers are summarized by their size, long values are shortened.
+        """
+        self.assertEqual(summarize({"a": 1}), "{1 entries}")
+        self.assertEqual(summarize(((False, 0), [1, 2])), "((False, 0), [2 items])")
+        self.assertEqual(len(summarize("x" * 100)), 64)
+
+
+class TracerTestCase(unittest.TestCase):
+    """
+    Test the records written by the tracer.
+    """
+
+    def setUp(self):
+        self.stream = StringIO()
+        patcher = mock.patch.object(_trace, "_TRACER", DBusTracer(self.stream))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(
+            DBusTracer, "_call_blocking", side_effect=self._call_blocking, autospec=True
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _call_blocking(_tracer, frame, object_path, _interface, member, args, **_):
+        """
+        Record the call without making it.
+        """
+        frame.setdefault("object_path", object_path)
+        frame.setdefault("arguments", [summarize(arg) for arg in args])
+        frame |= {
+            "marshal_seconds": 0.0,
+            "request_bytes": 0,
+            "round_trip_seconds": 0.0,
+            "unmarshal_seconds": 0.0,
+            "trace_seconds": 0.0,
+            "reply_bytes": 4,
+        }
+        if member == "Fail":
+            raise dbus.exceptions.DBusException(name="org.example.Error")
+        return "value"
+
+    def _records(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_generated(self):
+        """
+        A generated accessor's record is completed by its D-Bus call.
+        """
+        proxy = TracedProxy(None, "/org/storage/stratis3/1")
+
+        def get(proxy_object):
+            return proxy_object.Get(
+                "org.example.Pool", "Name", dbus_interface=dbus.PROPERTIES_IFACE
+            )
+
+        self.assertEqual(traced("org.example.Pool", "Name", "get", get)(proxy), "value")
+        records = self._records()
+        self.assertEqual(
+            [
+                (record["operation"], record["interface"], record["member"])
+                for record in records
+            ],
+            [
+                ("ping", "org.freedesktop.DBus.Peer", "Ping"),
+                ("get", "org.example.Pool", "Name"),
+            ],
+        )
+        self.assertEqual(records[1]["object_path"], "/org/storage/stratis3/1")
+        self.assertEqual(records[1]["arguments"], ["'org.example.Pool'", "'Name'"])
+        self.assertIn("convert_seconds", records[1])
+
+    def test_error(self):
+        """
+        A call that is not made by a generated method is recorded with its
+        error.
+        """
+        proxy = TracedProxy(None, "/")
+        with self.assertRaises(dbus.exceptions.DBusException):
+            proxy.get_dbus_method("Fail", dbus_interface="org.example.Manager")(1)
+        record = self._records()[-1]
+        self.assertEqual(
+            (record["operation"], record["member"], record["error"]),
+            ("call", "Fail", "org.example.Error"),
+        )
+
+
+class TraceOptionTestCase(unittest.TestCase):
+    """
+    Test the --trace-dbus option.
+    """
+
+    def test_not_kept(self):
+        """
+        A command run after one with --trace-dbus is not traced.
+        """
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = mock.patch.object(_jobs, "JOB_DIRECTORY", directory.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(_trace, "_TRACER", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        trace_path = os.path.join(directory.name, "trace")
+        with redirect_stdout(StringIO()):
+            run()([f"--trace-dbus={trace_path}", "job", "list"])
+            self.assertTrue(tracing())
+            run()(["job", "list"])
+            self.assertFalse(tracing())
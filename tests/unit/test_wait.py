@@ -0,0 +1,171 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test waiting for a long-running pool operation.
+"""
+
+import unittest
+from io import StringIO
+
+from dbus.exceptions import DBusException
+
+from stratis_cli._actions._constants import POOL_INTERFACE
+from stratis_cli._actions._wait import _in_args, _PoolOperation, format_elapsed
+from stratis_cli._actions._watch import SignalLoop
+from stratis_cli._errors import StratisCliEngineError, StratisCliIncoherenceError
+
+_POOL = "/org/storage/stratis3/1"
+
+
+class _Bus:
+    """
+    Records the GetManagedObjects reply handler.
+    """
+
+    def __init__(self):
+        self.reply_handler = None
+
+    def add_signal_receiver(self, *_args, **_kwargs):
+        """
+        Ignore a signal subscription.
+        """
+
+    def get_object(self, _bus_name, _object_path, **_kwargs):
+        """
+        Get a proxy that records method calls.
+        """
+        return self
+
+    def GetManagedObjects(self, **kwargs):
+        """
+        Record the reply handler.
+        """
+        self.reply_handler = kwargs["reply_handler"]
+
+
+class _SignalLoop(SignalLoop):
+    """
+    Records how the loop was stopped, without a main loop.
+    """
+
+    def __init__(self):
+        self.bus = _Bus()
+        self.error = None
+        self.stopped = False
+
+    def fail(self, error):
+        """
+        Record an error.
+        """
+        self.error = error
+        self.stopped = True
+
+    def quit(self):
+        """
+        Record that the loop was stopped.
+        """
+        self.stopped = True
+
+
+class FormatTestCase(unittest.TestCase):
+    """
+    Test formatting of elapsed times and method arguments.
+    """
+
+    def test_format_elapsed(self):
+        """
+        Hours are only shown if necessary.
+        """
+        self.assertEqual(format_elapsed(5.9), "00:05")
+        self.assertEqual(format_elapsed(3599), "59:59")
+        self.assertEqual(format_elapsed(3725), "1:02:05")
+
+    def test_in_args(self):
+        """
+        The arguments are obtained from the introspection data.
+        """
+        self.assertEqual(
+            _in_args(POOL_INTERFACE, "EncryptPool"),
+            (["key_descs", "clevis_infos"], "a((bu)s)a((bu)ss)"),
+        )
+        self.assertEqual(_in_args(POOL_INTERFACE, "DecryptPool"), ([], ""))
+
+
+class PoolOperationTestCase(unittest.TestCase):
+    """
+    Test following a pool operation.
+    """
+
+    def setUp(self):
+        self.signal_loop = _SignalLoop()
+        self.stream = StringIO()
+        self.operation = _PoolOperation(
+            self.signal_loop,
+            _POOL,
+            lambda mopool: bool(mopool.Encrypted()),
+            "Encrypting pool",
+            stream=self.stream,
+        )
+        self.operation.watcher.start()
+
+    def _receive(self, encrypted):
+        reply_handler = self.signal_loop.bus.reply_handler
+        assert reply_handler is not None
+        reply_handler({_POOL: {POOL_INTERFACE: {"Encrypted": encrypted}}})
+
+    def test_reply(self):
+        """
+        The operation completes when the method returns successfully.
+        """
+        self._receive(False)
+        self.assertFalse(self.signal_loop.stopped)
+        self.operation.on_reply(True, 0, "")
+        self.assertEqual(self.operation.outcome, "completed")
+        self.assertIsNone(self.signal_loop.error)
+        self.assertEqual(
+            self.stream.getvalue().splitlines()[:2],
+            ["Encrypting pool: in progress", "Encrypting pool: completed after 00:00"],
+        )
+
+    def test_engine_error(self):
+        """
+        The operation fails if stratisd returns an error.
+        """
+        self.operation.on_reply(False, 1, "failed")
+        self.assertEqual(self.operation.outcome, "failed")
+        self.assertIsInstance(self.signal_loop.error, StratisCliEngineError)
+
+    def test_no_reply(self):
+        """
+        If the bus gives up, the operation completes when the pool's
+        properties show that it is complete.
+        """
+        self._receive(False)
+        self.operation.on_error(
+            DBusException(name="org.freedesktop.DBus.Error.NoReply")
+        )
+        self.assertFalse(self.signal_loop.stopped)
+        self.operation.watcher.properties_changed(
+            POOL_INTERFACE, {"Encrypted": True}, [], object_path=_POOL
+        )
+        self.assertEqual(self.operation.outcome, "completed")
+        self.assertIn("Encrypted changed to True", self.stream.getvalue())
+
+    def test_pool_removed(self):
+        """
+        The operation fails if the pool is removed.
+        """
+        self._receive(False)
+        self.operation.watcher.interfaces_removed(_POOL, [POOL_INTERFACE])
+        self.assertIsInstance(self.signal_loop.error, StratisCliIncoherenceError)
@@ -0,0 +1,228 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test watching for changes to stratisd's objects.
+"""
+
+import unittest
+from io import StringIO
+
+from stratis_cli._actions._watch import ManagedObjectsWatcher, Screen
+
+_POOL = "/org/storage/stratis3/1"
+_FILESYSTEM = "/org/storage/stratis3/2"
+_OTHER_POOL = "/org/storage/stratis3/3"
+_POOL_INTERFACE = "org.storage.stratis3.pool.r9"
+_FILESYSTEM_INTERFACE = "org.storage.stratis3.filesystem.r9"
+
+
+class _Proxy:
+    """
+    Records asynchronous method calls.
+    """
+
+    def __init__(self, calls, object_path):
+        self._calls = calls
+        self._object_path = object_path
+
+    def GetManagedObjects(self, **kwargs):
+        """
+        Record a GetManagedObjects call.
+        """
+        self._calls.append((self._object_path, "GetManagedObjects", (), kwargs))
+
+    def GetAll(self, *args, **kwargs):
+        """
+        Record a GetAll call.
+        """
+        self._calls.append((self._object_path, "GetAll", args, kwargs))
+
+
+class _Bus:
+    """
+    Records signal subscriptions and method calls.
+    """
+
+    def __init__(self):
+        self.receivers = {}
+        self.calls = []
+
+    def add_signal_receiver(self, handler, signal_name, **_kwargs):
+        """
+        Record a signal subscription.
+        """
+        self.receivers[signal_name] = handler
+
+    def get_object(self, _bus_name, object_path, **_kwargs):
+        """
+        Get a proxy that records method calls.
+        """
+        return _Proxy(self.calls, object_path)
+
+
+class ManagedObjectsWatcherTestCase(unittest.TestCase):
+    """
+    Test that signals are applied to the GetManagedObjects result.
+    """
+
+    def setUp(self):
+        self.bus = _Bus()
+        self.changes = 0
+        self.watcher = ManagedObjectsWatcher(self.bus, 120, self._on_change, self.fail)
+        self.watcher.start()
+
+        self.assertEqual(
+            set(self.bus.receivers),
+            {"InterfacesAdded", "InterfacesRemoved", "PropertiesChanged"},
+        )
+        (_, method, _, kwargs) = self.bus.calls.pop()
+        self.assertEqual(method, "GetManagedObjects")
+        kwargs["reply_handler"](
+            {
+                _POOL: {_POOL_INTERFACE: {"Name": "pool"}},
+                _OTHER_POOL: {_POOL_INTERFACE: {"Name": "other"}},
+                _FILESYSTEM: {_FILESYSTEM_INTERFACE: {"Name": "fs", "Pool": _POOL}},
+            }
+        )
+        self.assertEqual(
+            self.watcher.take_changed(), frozenset((_POOL, _OTHER_POOL, _FILESYSTEM))
+        )
+
+    def _on_change(self):
+        self.changes += 1
+
+    def test_pool_changed(self):
+        """
+        A change to a pool also changes the objects that belong to it.
+        """
+        self.bus.receivers["PropertiesChanged"](
+            _POOL_INTERFACE, {"Name": "renamed"}, [], object_path=_POOL
+        )
+        self.assertEqual(
+            self.watcher.managed_objects[_POOL][_POOL_INTERFACE]["Name"], "renamed"
+        )
+        self.assertEqual(self.watcher.take_changed(), frozenset((_POOL, _FILESYSTEM)))
+        self.assertEqual(self.watcher.take_changed(), frozenset())
+
+    def test_filesystem_changed(self):
+        """
+        A change to a filesystem also changes the pool it belongs to.
+        """
+        self.bus.receivers["PropertiesChanged"](
+            _FILESYSTEM_INTERFACE, {"Used": "1"}, [], object_path=_FILESYSTEM
+        )
+        self.assertEqual(self.watcher.take_changed(), frozenset((_POOL, _FILESYSTEM)))
+
+    def test_invalidated(self):
+        """
+        Invalidated properties are obtained from stratisd.
+        """
+        self.bus.receivers["PropertiesChanged"](
+            _FILESYSTEM_INTERFACE, {}, ["Name"], object_path=_FILESYSTEM
+        )
+        (object_path, method, args, kwargs) = self.bus.calls.pop()
+        self.assertEqual(
+            (object_path, method, args),
+            (_FILESYSTEM, "GetAll", (_FILESYSTEM_INTERFACE,)),
+        )
+        self.assertEqual(
+            self.watcher.managed_objects[_FILESYSTEM][_FILESYSTEM_INTERFACE]["Name"],
+            "fs",
+        )
+        kwargs["reply_handler"]({"Name": "new", "Pool": _POOL})
+        self.assertEqual(
+            self.watcher.managed_objects[_FILESYSTEM][_FILESYSTEM_INTERFACE]["Name"],
+            "new",
+        )
+
+    def test_moved(self):
+        """
+        A change to the Pool property changes both pools.
+        """
+        self.bus.receivers["PropertiesChanged"](
+            _FILESYSTEM_INTERFACE, {"Pool": _OTHER_POOL}, [], object_path=_FILESYSTEM
+        )
+        self.assertEqual(
+            self.watcher.take_changed(), frozenset((_POOL, _OTHER_POOL, _FILESYSTEM))
+        )
+
+    def test_added_and_removed(self):
+        """
+        Objects are added and removed.
+        """
+        added = "/org/storage/stratis3/4"
+        self.bus.receivers["InterfacesAdded"](
+            added, {_FILESYSTEM_INTERFACE: {"Name": "fs2", "Pool": _OTHER_POOL}}
+        )
+        self.assertEqual(self.watcher.take_changed(), frozenset((added, _OTHER_POOL)))
+
+        self.bus.receivers["InterfacesRemoved"](_FILESYSTEM, [_FILESYSTEM_INTERFACE])
+        self.assertNotIn(_FILESYSTEM, self.watcher.managed_objects)
+        self.assertEqual(self.watcher.take_changed(), frozenset((_FILESYSTEM, _POOL)))
+        self.assertEqual(self.changes, 3)
+
+    def test_unknown_object(self):
+        """
+        Signals about unknown objects are ignored.
+        """
+        self.bus.receivers["PropertiesChanged"](
+            _FILESYSTEM_INTERFACE, {"Used": "1"}, [], object_path="/unknown"
+        )
+        self.bus.receivers["InterfacesRemoved"]("/unknown", [_FILESYSTEM_INTERFACE])
+        self.assertEqual(self.watcher.take_changed(), frozenset())
+        self.assertEqual(self.changes, 1)
+
+
+class _Stream(StringIO):
+    """
+    A stream that may claim to be a terminal.
+    """
+
+    def __init__(self, terminal):
+        super().__init__()
+        self._terminal = terminal
+
+    def isatty(self):
+        return self._terminal
+
+
+class ScreenTestCase(unittest.TestCase):
+    """
+    Test displaying successive versions of a table.
+    """
+
+    def test_terminal(self):
+        """
+        On a terminal, only changed lines are rewritten.
+        """
+        stream = _Stream(True)
+        screen = Screen(stream)
+        screen.show(["a", "b", "c"])
+        screen.show(["a", "B", "c"])
+        screen.show(["a", "B", "c"])
+        screen.show(["a"])
+        self.assertEqual(
+            stream.getvalue(), "a\nb\nc\n" + "\x1b[3F\n\x1b[2KB\n\n" + "\x1b[3F\n\x1b[J"
+        )
+
+    def test_not_terminal(self):
+        """
+        Otherwise, every changed version is written in full.
+        """
+        stream = _Stream(False)
+        screen = Screen(stream)
+        screen.show(["a", "b"])
+        screen.show(["a", "b"])
+        screen.show(["a", "c"])
+        self.assertEqual(stream.getvalue(), "a\nb\n\na\nc\n\n")